@@ -0,0 +1,114 @@
+import logging
+import time
+import traceback
+from typing import Any, Awaitable, Callable, Dict, MutableMapping
+
+import metrics
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# Long-lived SSE streams need buckets well past the request latency range
+STREAM_BUCKETS = metrics.LATENCY_BUCKETS + (300.0, 1800.0, 3600.0)
+
+HTTP_TTFB = metrics.registry.histogram(
+    "linkedin_http_time_to_first_byte_seconds", "Time from request start to the response headers", ("path",))
+HTTP_DURATION = metrics.registry.histogram(
+    "linkedin_http_request_duration_seconds", "Time from request start to the end of the response body",
+    ("path",), buckets=STREAM_BUCKETS)
+HTTP_REQUESTS = metrics.registry.counter(
+    "linkedin_http_requests_total", "HTTP requests by status", ("path", "status"))
+HTTP_BYTES_SENT = metrics.registry.counter(
+    "linkedin_http_response_bytes_total", "Response body bytes sent to clients", ("path",))
+HTTP_IN_FLIGHT = metrics.registry.gauge(
+    "linkedin_http_in_flight", "HTTP requests and streams currently open", ("path",))
+
+
+def path_label(path: str) -> str:
+    """Groups a request path by its first segment (e.g. /mcp/messages/ -> /mcp) to bound label cardinality."""
+    segment = path.lstrip("/").split("/", 1)[0]
+    return f"/{segment}"
+
+
+class RequestTimingMiddleware:
+    """
+    Pure ASGI middleware logging and timing every HTTP request.
+
+    Unlike BaseHTTPMiddleware it does not wrap the response in a new stream:
+    messages are forwarded to the server as they are sent, so streaming
+    responses such as the MCP SSE stream pass through untouched. Time to first
+    byte (the response start) and total duration (the last body chunk, i.e. the
+    end of a stream) are recorded separately.
+
+    Args:
+        app: The ASGI application to wrap
+        logger: Logger for the request/response lines
+    """
+
+    def __init__(self, app: ASGIApp, logger: logging.Logger):
+        self.app = app
+        self.logger = logger
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        label = path_label(path)
+        start = time.perf_counter()
+        state: Dict[str, Any] = {"status": None, "ttfb": None, "bytes": 0, "done": False}
+        self.logger.info(f"Request: {method} {path}")
+        HTTP_IN_FLIGHT.inc(path=label)
+
+        def finish(outcome: str) -> None:
+            # Called at the last body chunk, on client disconnect or when the app returns, whichever is first;
+            # an SSE handler may keep running well after its stream has ended
+            if state["done"]:
+                return
+            state["done"] = True
+            duration = time.perf_counter() - start
+            HTTP_IN_FLIGHT.dec(path=label)
+            HTTP_DURATION.observe(duration, path=label)
+            HTTP_REQUESTS.inc(path=label, status=str(state["status"]))
+            HTTP_BYTES_SENT.inc(state["bytes"], path=label)
+            if state["ttfb"] is None:
+                self.logger.info(f"Response: {method} {path} - No response sent ({outcome}) - Time: {duration:.3f}s")
+                return
+            HTTP_TTFB.observe(state["ttfb"], path=label)
+            self.logger.info(
+                f"Response: {method} {path} - Status: {state['status']} - TTFB: {state['ttfb']:.3f}s - "
+                f"Time: {duration:.3f}s - Bytes: {state['bytes']}" + (f" ({outcome})" if outcome != "complete" else "")
+            )
+
+        async def send_timed(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                state["ttfb"] = time.perf_counter() - start
+            elif message["type"] == "http.response.body":
+                state["bytes"] += len(message.get("body", b""))
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                finish("complete")
+
+        async def receive_timed() -> Message:
+            message = await receive()
+            if message["type"] == "http.disconnect" and state["ttfb"] is not None:
+                finish("client disconnected")
+            return message
+
+        try:
+            await self.app(scope, receive_timed, send_timed)
+        except Exception as e:
+            # Log any unhandled exceptions
+            state["status"] = state["status"] or 500
+            self.logger.error(f"Unhandled exception in request: {method} {path}")
+            self.logger.error(f"Exception details: {str(e)}")
+            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            raise
+        finally:
+            finish("complete" if state["ttfb"] is not None else "no response")
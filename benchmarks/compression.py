@@ -0,0 +1,100 @@
+"""
+Transfer time of heavy responses with and without negotiated compression.
+
+Serves a 100-profile /profiles batch and a posts page from a local server
+whose send rate is capped (default 50 Mbit/s, roughly a good WAN link) and
+gzips responses when the request offers it. Each payload is fetched through
+make_api_request (http.client pool) and make_api_request_async (httpx),
+with LINKEDIN_COMPRESSION on and off.
+
+Synthetic payloads repeat a small vocabulary and compress better than real
+profiles, so treat the ratios as an upper bound.
+
+Run from the repository root:
+    python benchmarks/compression.py [mbit_per_second]
+"""
+import asyncio
+import gzip
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("LINKEDIN_CACHE_MAX_ENTRIES", "0")
+
+import httpx
+
+import linkedin_api_tools as tools
+from connection_pool import HTTPSConnectionPool
+from payloads import large_profile, posts_page
+
+RATE = float(sys.argv[1]) * 1e6 / 8 if len(sys.argv) > 1 else 50e6 / 8
+
+BODIES = {
+    "/profiles": json.dumps({"data": [large_profile(seed)["data"] for seed in range(100)]}).encode("utf-8"),
+    "/profile_posts_all": json.dumps(posts_page(posts=200)).encode("utf-8"),
+}
+GZIPPED = {route: gzip.compress(body, 6) for route, body in BODIES.items()}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        compressed = "gzip" in self.headers.get("Accept-Encoding", "")
+        body = GZIPPED[self.path] if compressed else BODIES[self.path]
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        # Send in 64KB slices at the capped rate
+        for start in range(0, len(body), 65536):
+            chunk = body[start:start + 65536]
+            self.wfile.write(chunk)
+            time.sleep(len(chunk) / RATE)
+
+    def log_message(self, *args):
+        pass
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"127.0.0.1:{server.server_port}"
+    tools.connection_pool = HTTPSConnectionPool(host, connection_class=http.client.HTTPConnection)
+    tools.get_async_client = lambda: client
+    tools.logger.setLevel("WARNING")
+
+    print(f"send rate capped at {RATE * 8 / 1e6:.0f} Mbit/s")
+    for route, body in BODIES.items():
+        print(f"{route}: {len(body) / 1e6:.2f}MB raw, {len(GZIPPED[route]) / 1e6:.2f}MB gzip")
+        for enabled in (False, True):
+            tools.LINKEDIN_COMPRESSION = enabled
+            start = time.perf_counter()
+            result = tools.make_api_request("POST", route, json.dumps({"link": "x"}), dict(tools.LINKEDIN_HEADERS))
+            sync_time = time.perf_counter() - start
+
+            async def fetch_async():
+                global client
+                client = httpx.AsyncClient(base_url=f"http://{host}", timeout=120)
+                started = time.perf_counter()
+                response = await tools.make_api_request_async("POST", route, json.dumps({"link": "y"}), dict(tools.LINKEDIN_HEADERS))
+                elapsed = time.perf_counter() - started
+                await client.aclose()
+                return response, elapsed
+
+            async_result, async_time = asyncio.run(fetch_async())
+            assert result["success"] and async_result["success"]
+            label = "gzip" if enabled else "identity"
+            print(f"  {label:9} sync {sync_time:6.3f}s   async {async_time:6.3f}s")
+
+
+if __name__ == "__main__":
+    main()
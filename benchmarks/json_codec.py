@@ -0,0 +1,66 @@
+"""
+Response-path JSON cost: the previous str-decode + json pipeline against the codecs.
+
+For synthetic large profile and post payloads (see payloads.py) this times
+parsing the raw upstream body and serializing the tool result the way it is
+handed to the MCP client:
+
+- before: body.decode("utf-8") + json.loads, then FastMCP's
+  pydantic_core.to_jsonable_python + json.dumps
+- json / orjson: json_codec parsing the bytes and serializing the result
+
+Run from the repository root:
+    python benchmarks/json_codec.py
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pydantic_core
+
+from json_codec import select_codec, orjson
+from payloads import large_profile, posts_page
+
+
+def before(body: bytes) -> str:
+    response = {"success": True, "status": 200, "data": json.loads(body.decode("utf-8"))}
+    return json.dumps(pydantic_core.to_jsonable_python(response))
+
+
+def with_codec(codec):
+    def run(body: bytes) -> str:
+        return codec.dumps({"success": True, "status": 200, "data": codec.loads(body)})
+    return run
+
+
+def timed(fn, body: bytes, rounds: int) -> float:
+    fn(body)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(body)
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    bodies = [
+        ("large profile", json.dumps(large_profile()).encode("utf-8")),
+        ("100 large profiles", json.dumps({"data": [large_profile(seed)["data"] for seed in range(100)]}).encode("utf-8")),
+        ("posts page", json.dumps(posts_page()).encode("utf-8")),
+    ]
+    variants = [("before", before), ("json", with_codec(select_codec("json")))]
+    if orjson is not None:
+        variants.append(("orjson", with_codec(select_codec("orjson"))))
+    for name, body in bodies:
+        rounds = max(5, int(2e7 // len(body)))
+        baseline = None
+        for variant, fn in variants:
+            elapsed = timed(fn, body, rounds)
+            baseline = baseline or elapsed
+            print(f"{name:20} {len(body) / 1024:8.1f}KB  {variant:8} {elapsed * 1e3:8.3f} ms  x{baseline / elapsed:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
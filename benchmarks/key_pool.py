@@ -0,0 +1,91 @@
+"""
+Throughput of the tools over 1, 2, 4 and 8 API keys against a per-key quota.
+
+Starts benchmarks/mock_upstream.py with --key-rate (requests per second per
+x-rapidapi-key, 429 with Retry-After beyond it) and drives job_details calls
+with distinct ids, so none is served from the cache, from --concurrency
+workers for --seconds per key count. The pool is swapped between runs with
+fresh keys. Reports successful calls per second, upstream 429s and the
+requests each key served.
+
+Run from the repository root:
+    python benchmarks/key_pool.py [--key-rate 20] [--seconds 5] [--concurrency 32] [--latency 0.02]
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from load_test import free_port, stop, wait_for  # noqa: E402
+
+KEY_COUNTS = (1, 2, 4, 8)
+
+
+async def run(tools, keys, seconds: float, concurrency: int, ids) -> int:
+    from key_pool import KeyPool
+    tools.key_pool = KeyPool([(key, "") for key in keys], cooldown=1, max_cooldown=5)
+    tools.LINKEDIN_HEADERS = dict(tools.LINKEDIN_HEADERS, **{"x-rapidapi-key": keys[0]})
+    deadline = time.monotonic() + seconds
+    done = 0
+
+    async def worker() -> None:
+        nonlocal done
+        while time.monotonic() < deadline:
+            result = await tools.job_details(job_id=str(next(ids)))
+            done += bool(result.get("success"))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return done
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--key-rate", type=int, default=20, help="mock quota, requests per second per key")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    port = free_port()
+    upstream = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "benchmarks", "mock_upstream.py"), "--port", str(port),
+         "--latency", str(args.latency), "--key-rate", str(args.key_rate)],
+        stdout=subprocess.DEVNULL)
+    wait_for(f"http://127.0.0.1:{port}/__stats", upstream)
+    os.environ.update(LINKEDIN_API_SCHEME="http", LINKEDIN_API_HOST=f"127.0.0.1:{port}", LOG_HOST="",
+                      LINKEDIN_BREAKER_MIN_REQUESTS="1000000", LINKEDIN_CACHE_MAX_ENTRIES="0",
+                      LINKEDIN_REQUEST_DEADLINE="30")
+    import logging
+    logging.disable(logging.CRITICAL)
+    import linkedin_api_tools as tools
+
+    print(f"mock quota {args.key_rate} req/s per key, latency {args.latency * 1000:.0f}ms, "
+          f"{args.concurrency} workers, {args.seconds:g}s per run")
+    ids = itertools.count(1)
+    baseline = None
+    try:
+        for count in KEY_COUNTS:
+            keys = [f"bench-{count}-key-{index}" for index in range(count)]
+            done = asyncio.run(run(tools, keys, args.seconds, args.concurrency, ids))
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/__stats") as response:
+                stats = json.loads(response.read())
+            per_key = [stats.get(f"key {key} 200", 0) for key in keys]
+            throttled = sum(stats.get(f"key {key} 429", 0) for key in keys)
+            rate = done / args.seconds
+            baseline = baseline or rate
+            print(f"{count} key{'s' if count > 1 else ' '}: {rate:7.1f} calls/s ({rate / baseline:.2f}x), "
+                  f"{throttled} upstream 429s, served per key {per_key}")
+    finally:
+        stop(upstream)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Cost of links.canonical_link and what it buys on mixed-spelling input.
+
+- per link: time per call on links never seen before (regex and rewrite)
+  and on repeated links (served from the memo), for each kind of link
+- cache hit rate: a stream of person/company lookups where every entity is
+  spelled the way callers do (http/https, with or without www., trailing
+  slash, mixed case, tracking query strings, sub-pages), keyed like the
+  response cache with the raw link vs. the canonical one
+- batches: distinct /profiles request bodies for the same link sets
+  spelled differently, i.e. upstream calls the cache cannot save
+
+Run from the repository root:
+    python benchmarks/link_canonicalization.py
+"""
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from links import canonical_link  # noqa: E402
+from response_cache import request_key  # noqa: E402
+
+SEED = 11
+ENTITIES = 2000
+LOOKUPS = 50000
+BATCHES = 500
+
+SAMPLES = {
+    "profile": "http://www.linkedin.com/in/Ingmar-Klein/?trk=public_profile",
+    "member id": "https://www.linkedin.com/in/ACoAACeIPPkBUymOGNvgfbBL_uhKc32Hg_g_haU",
+    "company": "https://linkedin.com/company/huzzle-app/about/",
+    "post": "https://www.linkedin.com/posts/bill_some-title-activity-7219434359085252608-AbCd/?utm_source=share",
+    "feed urn": "https://www.linkedin.com/feed/update/urn:li:activity:7219434359085252608/",
+    "bare urn": "URN:LI:ugcPost:7219434359085252608",
+}
+
+
+def spellings(rng: random.Random, kind: str, slug: str) -> str:
+    """One of the spellings seen for an entity: scheme, host, case, trailing slash and query all vary."""
+    scheme = rng.choice(["https://", "http://", ""])
+    host = rng.choice(["www.linkedin.com", "linkedin.com", "uk.linkedin.com"])
+    name = rng.choice([slug, slug.capitalize(), slug.upper()]) if rng.random() < 0.3 else slug
+    tail = rng.choice(["", "/", "/", "/?trk=public_profile", "?originalSubdomain=uk", "/details/experience/"])
+    return f"{scheme}{host}/{kind}/{name}{tail}"
+
+
+def per_link() -> None:
+    for label, link in SAMPLES.items():
+        # Unseen links: the function behind the memo, so every call parses
+        parse = canonical_link.__wrapped__
+        start = time.perf_counter()
+        for _ in range(50000):
+            parse(link)
+        cold = (time.perf_counter() - start) / 50000
+        start = time.perf_counter()
+        for _ in range(200000):
+            canonical_link(link)
+        warm = (time.perf_counter() - start) / 200000
+        print(f"  {label:10s} {cold * 1e9:7.0f}ns unseen, {warm * 1e9:5.0f}ns repeated   -> {canonical_link(link)}")
+
+
+def hit_rate(rng: random.Random) -> None:
+    entities = [("in", f"person-{index:04d}-{rng.getrandbits(24):06x}") for index in range(ENTITIES // 2)]
+    entities += [("company", f"company-{index:04d}") for index in range(ENTITIES // 2)]
+    weights = [1 / (rank + 1) for rank in range(len(entities))]
+    stream = rng.choices(entities, weights=weights, k=LOOKUPS)
+    raw_seen, canonical_seen = set(), set()
+    raw_hits = canonical_hits = 0
+    for kind, slug in stream:
+        link = spellings(rng, kind, slug)
+        route = "/person" if kind == "in" else "/company"
+        raw_key = request_key("POST", route, json.dumps({"link": link}))
+        canonical_key = request_key("POST", route, json.dumps({"link": canonical_link(link)}))
+        raw_hits += raw_key in raw_seen
+        canonical_hits += canonical_key in canonical_seen
+        raw_seen.add(raw_key)
+        canonical_seen.add(canonical_key)
+    print(f"cache hit rate over {LOOKUPS} lookups of {ENTITIES} entities (Zipf): "
+          f"{raw_hits / LOOKUPS:.1%} raw links, {canonical_hits / LOOKUPS:.1%} canonical "
+          f"({len(raw_seen)} vs {len(canonical_seen)} distinct keys)")
+
+
+def batches(rng: random.Random) -> None:
+    teams = [[f"person-{team:03d}-{member}" for member in range(rng.randint(5, 40))] for team in range(50)]
+    raw_bodies, canonical_bodies = set(), set()
+    for _ in range(BATCHES):
+        links = [spellings(rng, "in", slug) for slug in rng.choice(teams)]
+        raw_bodies.add(json.dumps({"links": links}))
+        canonical_bodies.add(json.dumps({"links": [canonical_link(link) for link in links]}))
+    print(f"{BATCHES} profiles calls over 50 link sets: {len(raw_bodies)} distinct request bodies raw, "
+          f"{len(canonical_bodies)} canonical")
+
+
+def main() -> None:
+    print("canonical_link per call:")
+    per_link()
+    rng = random.Random(SEED)
+    hit_rate(rng)
+    batches(rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""
+End-to-end load test of the MCP server against the local mock upstream.
+
+Starts benchmarks/mock_upstream.py in a process of its own and drives a mix
+of tools through each transport:
+
+- direct: the tool functions of linkedin_api_tools, in this process
+- stdio: ``python linkedin_api_tools.py`` through the MCP stdio client
+- http: ``uvicorn main:app`` through the MCP SSE client on /mcp/sse
+
+For every tool it reports calls, failures (transport errors and results
+without "success"), throughput, p50/p95/p99 latency and the server
+process' resident memory after the tool ran (and how much that tool added).
+Arguments cycle through VARIANTS values per tool so mock bodies are reused;
+the server's response cache is off unless --cache is given, so every call
+reaches the upstream path.
+
+--json writes the results; --baseline compares a run with a saved one and
+flags tools whose p95 or throughput got worse by more than --tolerance.
+
+Run from the repository root:
+    python benchmarks/load_test.py [--modes direct,stdio,http] [--calls 200] [--concurrency 16]
+        [--latency 0.05] [--error-rate 0] [--throttle-rate 0] [--json out.json] [--baseline old.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+VARIANTS = 64
+
+# Tool mix: name -> arguments for call i
+WORKLOAD: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "person": lambda i: {"link": f"https://www.linkedin.com/in/load-{i % VARIANTS}"},
+    "person_data_with_experiences": lambda i: {"link": f"https://www.linkedin.com/in/load-{i % VARIANTS}",
+                                               "fields": ["data.full_name", "data.experiences[].company"]},
+    "profiles": lambda i: {"links": [f"https://www.linkedin.com/in/batch-{i % VARIANTS}-{n}" for n in range(10)]},
+    "company": lambda i: {"link": f"https://www.linkedin.com/company/load-{i % VARIANTS}"},
+    "search_jobs": lambda i: {"query": f"engineer {i % VARIANTS}", "searchLocationId": "Europe"},
+    "suggestion_location": lambda i: {"query": f"ber{i % VARIANTS}"},
+    "post_reactions": lambda i: {"reactions_urn": f"urn:li:activity:{7219434359085252608 + i % VARIANTS}/reactions"},
+    "profile_updates": lambda i: {"profile_url": f"https://www.linkedin.com/in/load-{i % VARIANTS}",
+                                  "auto_paginate": True, "max_items": 60},
+}
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def rss_mb(pid: int) -> Optional[float]:
+    """Resident set size of a process in MB (Linux /proc), or None where unavailable."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def child_pid(marker: str) -> Optional[int]:
+    """Finds a child process of this one whose command line contains marker (the stdio server)."""
+    for entry in os.listdir("/proc") if os.path.isdir("/proc") else []:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                cmdline = f.read().decode(errors="replace")
+        except (OSError, ValueError, IndexError):
+            continue
+        if ppid == os.getpid() and marker in cmdline:
+            return int(entry)
+    return None
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(url: str, process: subprocess.Popen, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            urllib.request.urlopen(url, timeout=1).read()
+            return
+        except OSError:
+            if time.monotonic() > deadline or process.poll() is not None:
+                raise RuntimeError(f"{' '.join(process.args)} did not start")
+            time.sleep(0.2)
+
+
+def stop(process: subprocess.Popen) -> None:
+    process.terminate()
+    try:
+        process.wait(10)
+    except subprocess.TimeoutExpired:
+        # uvicorn waits for open SSE streams on a graceful shutdown
+        process.kill()
+        process.wait()
+
+
+def succeeded(result: Any) -> bool:
+    return isinstance(result, dict) and bool(result.get("success"))
+
+
+async def run_tool(call: Callable[[str, Dict[str, Any]], Awaitable[bool]], name: str, calls: int,
+                   concurrency: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    failures = 0
+    counter = iter(range(calls))
+
+    async def worker() -> None:
+        nonlocal failures
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                ok = await call(name, WORKLOAD[name](i))
+            except Exception:
+                ok = False
+            latencies.append(time.perf_counter() - start)
+            failures += not ok
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {
+        "calls": calls,
+        "failures": failures,
+        "throughput": calls / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+async def run_mode(call: Callable[[str, Dict[str, Any]], Awaitable[bool]], pid: Callable[[], Optional[int]],
+                   tools: List[str], calls: int, concurrency: int) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for name in tools:
+        # An untimed pass over the argument variants first, so lazy tool registration, connection setup
+        # and the mock generating its bodies are not measured
+        await run_tool(call, name, min(calls, VARIANTS), concurrency)
+        before = rss_mb(pid()) if pid() else None
+        result = await run_tool(call, name, calls, concurrency)
+        after = rss_mb(pid()) if pid() else None
+        result["rss_mb"] = after
+        result["rss_delta_mb"] = after - before if before is not None and after is not None else None
+        results[name] = result
+    return results
+
+
+async def direct_mode(tools: List[str], calls: int, concurrency: int) -> Dict[str, Dict[str, Any]]:
+    import linkedin_api_tools
+
+    async def call(name: str, arguments: Dict[str, Any]) -> bool:
+        return succeeded(await getattr(linkedin_api_tools, name)(**arguments))
+
+    return await run_mode(call, os.getpid, tools, calls, concurrency)
+
+
+async def session_mode(session, pid: Callable[[], Optional[int]], tools: List[str], calls: int,
+                       concurrency: int) -> Dict[str, Dict[str, Any]]:
+    await session.initialize()
+
+    async def call(name: str, arguments: Dict[str, Any]) -> bool:
+        result = await session.call_tool(name, arguments)
+        if result.isError or not result.content:
+            return False
+        return succeeded(json.loads(result.content[0].text))
+
+    return await run_mode(call, pid, tools, calls, concurrency)
+
+
+async def stdio_mode(env: Dict[str, str], tools: List[str], calls: int, concurrency: int) -> Dict[str, Dict[str, Any]]:
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
+    params = StdioServerParameters(command=sys.executable, args=[os.path.join(ROOT, "linkedin_api_tools.py")],
+                                   env=env, cwd=ROOT)
+    with open(os.devnull, "w") as devnull:
+        async with stdio_client(params, errlog=devnull) as (read, write):
+            async with ClientSession(read, write) as session:
+                return await session_mode(session, lambda: child_pid("linkedin_api_tools.py"), tools, calls,
+                                          concurrency)
+
+
+async def http_mode(env: Dict[str, str], tools: List[str], calls: int, concurrency: int) -> Dict[str, Dict[str, Any]]:
+    from mcp import ClientSession
+    from mcp.client.sse import sse_client
+
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for(f"http://127.0.0.1:{port}/", server)
+        async with sse_client(f"http://127.0.0.1:{port}/mcp/sse", timeout=30, sse_read_timeout=600) as (read, write):
+            async with ClientSession(read, write) as session:
+                return await session_mode(session, lambda: server.pid, tools, calls, concurrency)
+    finally:
+        stop(server)
+
+
+def report(mode: str, results: Dict[str, Dict[str, Any]]) -> None:
+    print(f"\n== {mode}")
+    print(f"{'tool':30s} {'calls':>6s} {'fail':>5s} {'req/s':>8s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} "
+          f"{'rss MB':>8s} {'+MB':>6s}")
+    for name, r in results.items():
+        rss = f"{r['rss_mb']:8.1f}" if r["rss_mb"] is not None else f"{'n/a':>8s}"
+        delta = f"{r['rss_delta_mb']:6.1f}" if r["rss_delta_mb"] is not None else f"{'n/a':>6s}"
+        print(f"{name:30s} {r['calls']:6d} {r['failures']:5d} {r['throughput']:8.1f} {r['p50_ms']:8.1f} "
+              f"{r['p95_ms']:8.1f} {r['p99_ms']:8.1f} {rss} {delta}")
+
+
+def compare(results: Dict[str, Dict[str, Dict[str, Any]]], baseline: Dict[str, Dict[str, Dict[str, Any]]],
+            tolerance: float) -> int:
+    """Prints tools whose p95 or throughput regressed past tolerance; returns how many did."""
+    regressions = 0
+    for mode, tools in results.items():
+        for name, r in tools.items():
+            old = baseline.get(mode, {}).get(name)
+            if old is None:
+                continue
+            p95 = r["p95_ms"] / old["p95_ms"] - 1 if old["p95_ms"] else 0.0
+            rps = 1 - r["throughput"] / old["throughput"] if old["throughput"] else 0.0
+            if p95 > tolerance or rps > tolerance:
+                regressions += 1
+                print(f"REGRESSION {mode}/{name}: p95 {old['p95_ms']:.1f} -> {r['p95_ms']:.1f}ms, "
+                      f"throughput {old['throughput']:.1f} -> {r['throughput']:.1f} req/s")
+    if not regressions:
+        print(f"\nNo regressions beyond {tolerance:.0%} against the baseline")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--modes", default="direct,stdio,http")
+    parser.add_argument("--tools", default=",".join(WORKLOAD))
+    parser.add_argument("--calls", type=int, default=200, help="calls per tool")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.05, help="mock upstream latency, seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--experiences", type=int, default=40, help="experiences per mock profile")
+    parser.add_argument("--cache", action="store_true", help="keep the server's response cache on")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="results file of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args()
+
+    port = free_port()
+    upstream = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "benchmarks", "mock_upstream.py"), "--port", str(port),
+         "--latency", str(args.latency), "--error-rate", str(args.error_rate), "--throttle-rate", str(args.throttle_rate),
+         "--retry-after", "0.2", "--experiences", str(args.experiences)],
+        stdout=subprocess.DEVNULL)
+    wait_for(f"http://127.0.0.1:{port}/__stats", upstream)
+    host = f"127.0.0.1:{port}"
+    env = dict(os.environ, LINKEDIN_API_SCHEME="http", LINKEDIN_API_HOST=host, LOG_HOST="",
+               LINKEDIN_BREAKER_MIN_REQUESTS="1000000", PYTHONPATH=ROOT)
+    if not args.cache:
+        env["LINKEDIN_CACHE_MAX_ENTRIES"] = "0"
+    # direct mode imports the tools into this process, so they read the same settings
+    os.environ.update(env)
+    import logging
+    logging.disable(logging.CRITICAL)
+
+    tools = [name for name in args.tools.split(",") if name]
+    modes = {"direct": lambda: direct_mode(tools, args.calls, args.concurrency),
+             "stdio": lambda: stdio_mode(env, tools, args.calls, args.concurrency),
+             "http": lambda: http_mode(env, tools, args.calls, args.concurrency)}
+    print(f"mock upstream {host}: latency {args.latency * 1000:.0f}ms, errors {args.error_rate:.0%}, "
+          f"429s {args.throttle_rate:.0%}; {args.calls} calls per tool at concurrency {args.concurrency}")
+    results = {}
+    try:
+        for mode in args.modes.split(","):
+            results[mode] = asyncio.run(modes[mode]())
+            report(mode, results[mode])
+    finally:
+        stop(upstream)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=1)
+    if args.baseline:
+        with open(args.baseline) as f:
+            sys.exit(1 if compare(results, json.load(f), args.tolerance) else 0)
+
+
+if __name__ == "__main__":
+    main()
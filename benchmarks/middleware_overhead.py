@@ -0,0 +1,91 @@
+"""
+Per-request overhead of the HTTP request middleware.
+
+Drives a minimal FastAPI app directly through ASGI (no sockets) with no
+middleware, with the previous BaseHTTPMiddleware-based LoggingMiddleware, and
+with the pure ASGI RequestTimingMiddleware, and prints the mean time per
+request and the overhead over the bare app.
+
+Run from the repository root:
+    python benchmarks/middleware_overhead.py [requests]
+"""
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from asgi_middleware import RequestTimingMiddleware
+
+# Records are created and formatted as in production, but not written anywhere
+logger = logging.getLogger("benchmark")
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.NullHandler())
+logger.propagate = False
+
+
+class LoggingMiddleware(BaseHTTPMiddleware):
+    """The middleware main.py used before, kept here as the baseline."""
+
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        logger.info(f"Request: {request.method} {request.url.path}")
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        logger.info(f"Response: {request.method} {request.url.path} - Status: {response.status_code} - Time: {process_time:.3f}s")
+        return response
+
+
+def build_app(middleware=None, **options) -> FastAPI:
+    app = FastAPI()
+    if middleware is not None:
+        app.add_middleware(middleware, **options)
+
+    @app.get("/")
+    async def root():
+        return {"status": "LinkedIn MCP server is running"}
+
+    return app
+
+
+async def run(app: FastAPI, requests: int) -> float:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/", "raw_path": b"/", "root_path": "", "query_string": b"", "headers": [],
+        "client": ("127.0.0.1", 1234), "server": ("127.0.0.1", 8000)
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(200):
+        await app(dict(scope), receive, send)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / requests
+
+
+async def main(requests: int) -> None:
+    variants = [
+        ("no middleware", build_app()),
+        ("BaseHTTPMiddleware (before)", build_app(LoggingMiddleware)),
+        ("pure ASGI (after)", build_app(RequestTimingMiddleware, logger=logger)),
+    ]
+    baseline = None
+    for name, app in variants:
+        per_request = await run(app, requests)
+        baseline = per_request if baseline is None else baseline
+        print(f"{name:30} {per_request * 1e6:8.1f} us/request   overhead {(per_request - baseline) * 1e6:7.1f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
@@ -0,0 +1,334 @@
+"""
+Local stand-in for the LinkedIn bulk-data API, so the server can be load
+tested without spending RapidAPI credits.
+
+Every route in api_doc.jsonl is served with synthetic bodies (see
+payloads.py) shaped like the real ones: profiles and companies echo the
+requested links so batch results map back to them, feeds hand out
+paginationTokens for a fixed number of pages, engagement feeds list people.
+Bodies are generated and gzipped once per distinct request, so producing
+them never dominates a load test, and sent gzipped when the client offers it.
+
+Faults are injected per request: latency (mean seconds, +/- jitter), 5xx
+errors and 429s with a Retry-After header. With a per-key quota every
+x-rapidapi-key gets that many requests per second, announced in
+x-ratelimit-requests-remaining/-reset headers, and 429s beyond it.
+GET /__stats returns the request count per route and status, and per key.
+
+Point the server at it with:
+    LINKEDIN_API_SCHEME=http LINKEDIN_API_HOST=127.0.0.1:8700
+
+Run from the repository root:
+    python benchmarks/mock_upstream.py [--port 8700] [--latency 0.05] [--error-rate 0.01] [--throttle-rate 0.01]
+                                       [--key-rate 20]
+"""
+import argparse
+import functools
+import gzip
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from payloads import _company, _text, large_profile, posts_page
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Paginated feeds and the kind of item they list; every other route gets a shape by its name
+FEEDS = {
+    "/profile_updates": "post",
+    "/profile_updates_original": "post",
+    "/company_updates": "post",
+    "/company_updates_original": "post",
+    "/comments_from_recent_activity": "post",
+    "/post_reactions": "engager",
+    "/post_comments": "engager",
+    "/post_reposts": "engager",
+    "/post_reposts_original": "engager",
+}
+PROFILE_BATCHES = ("/profiles", "/profiles_david", "/private_chtiouisk")
+PROFILE_ROUTES = ("/person", "/person_urn", "/person_skills", "/person_data_with_experiences",
+                  "/person_data_with_open_to_work_flag", "/person_data_with_languages", "/person_data_with_educations")
+
+
+def doc_routes(path: str = os.path.join(ROOT, "api_doc.jsonl")) -> List[str]:
+    """Routes listed in the API doc (a JSON array despite the extension)."""
+    with open(path, encoding="utf-8") as f:
+        return sorted({entry["route"] for entry in json.load(f)})
+
+
+def _seed(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=4).digest(), "big")
+
+
+def _engager(rng: random.Random, index: int, kind: str) -> Dict[str, Any]:
+    username = f"engager-{rng.getrandbits(40):x}"
+    return {
+        "actor": {
+            "urn": f"urn:li:fsd_profile:ACoAA{rng.getrandbits(64):x}",
+            "name": f"Engager {index}",
+            "headline": _text(rng, 10),
+            "profile_url": f"https://www.linkedin.com/in/{username}/"
+        },
+        "reactionType": rng.choice(("LIKE", "PRAISE", "EMPATHY")) if kind == "/post_reactions" else None,
+        "text": _text(rng, 30) if kind == "/post_comments" else None
+    }
+
+
+class MockUpstream:
+    """
+    Threaded HTTP/1.1 stand-in for the API.
+
+    Args:
+        port: Port to listen on; 0 picks a free one
+        latency: Mean added latency per request, in seconds
+        jitter: Spread of the latency as a fraction of it (0.5 means +/- 50%)
+        error_rate: Share of requests answered with a 500/502/503
+        throttle_rate: Share of requests answered with a 429 and Retry-After
+        retry_after: Retry-After of the 429s, in seconds
+        pages: Pages a feed has before it stops handing out paginationTokens
+        page_size: Items per feed, search and suggestion page
+        experiences: Experiences per generated profile (the main size knob)
+        seed: Seed of the fault injection
+        key_rate: Requests per second each API key may make; 0 for no quota
+    """
+
+    def __init__(self, port: int = 0, latency: float = 0.05, jitter: float = 0.5, error_rate: float = 0.0,
+                 throttle_rate: float = 0.0, retry_after: float = 1.0, pages: int = 3, page_size: int = 20,
+                 experiences: int = 40, seed: int = 1, key_rate: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.pages = pages
+        self.page_size = page_size
+        self.experiences = experiences
+        self.key_rate = key_rate
+        # API key -> (current one-second window, requests in it)
+        self._key_windows: Dict[str, Tuple[int, int]] = {}
+        self.routes = set(doc_routes())
+        self.stats: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.encoded = functools.lru_cache(maxsize=4096)(self._encoded)
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        return f"127.0.0.1:{self.server.server_port}"
+
+    def start(self) -> "MockUpstream":
+        self._thread = threading.Thread(target=self.server.serve_forever, name="mock-upstream", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _fault(self) -> Tuple[Optional[int], float]:
+        """Draws this request's injected status (None for a normal answer) and latency."""
+        with self._lock:
+            draw = self._rng.random()
+            delay = self.latency * self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+            status = None
+            if draw < self.error_rate:
+                status = self._rng.choice((500, 502, 503))
+            elif draw < self.error_rate + self.throttle_rate:
+                status = 429
+        return status, max(delay, 0.0)
+
+    def _quota(self, api_key: str) -> Optional[Dict[str, str]]:
+        """Counts a request against its key's one-second window; returns the quota headers (None without a quota)."""
+        if self.key_rate <= 0:
+            return None
+        now = time.time()
+        with self._lock:
+            window, used = self._key_windows.get(api_key, (int(now), 0))
+            if window != int(now):
+                window, used = int(now), 0
+            used += 1
+            self._key_windows[api_key] = (window, used)
+        reset = window + 1 - now
+        return {"x-ratelimit-requests-limit": str(self.key_rate),
+                "x-ratelimit-requests-remaining": str(max(0, self.key_rate - used)),
+                "x-ratelimit-requests-reset": f"{reset:.3f}",
+                **({"Retry-After": f"{reset:.3f}"} if used > self.key_rate else {})}
+
+    def _feed(self, route: str, key: str, page: int) -> Dict[str, Any]:
+        rng = random.Random(_seed(f"{route}:{key}:{page}"))
+        if FEEDS[route] == "post":
+            items = posts_page(_seed(f"{key}:{page}"), posts=self.page_size)["data"]
+            # Newest first across pages, so "since" cut-offs behave
+            for index, item in enumerate(items):
+                day = (page - 1) * self.page_size + index
+                item["postedAt"] = time.strftime("%Y-%m-%dT10:00:00Z", time.gmtime(1750000000 - day * 86400))
+        else:
+            items = [_engager(rng, (page - 1) * self.page_size + index, route) for index in range(self.page_size)]
+        body: Dict[str, Any] = {"success": True, "message": "", "data": items}
+        if page < self.pages:
+            body["paginationToken"] = f"{route.strip('/')}-{page + 1}-{rng.getrandbits(32):x}"
+        return body
+
+    def _body(self, route: str, key: str, page: int, count: int) -> bytes:
+        """Encoded body for one logical request."""
+        if route in FEEDS:
+            body = self._feed(route, key, page)
+        elif route in PROFILE_BATCHES:
+            items = []
+            for link in json.loads(key):
+                item = large_profile(_seed(link), experiences=self.experiences)["data"]
+                item["profile_url"] = link
+                items.append(item)
+            body = {"success": True, "message": "", "data": items}
+        elif route == "/companies":
+            rng = random.Random(_seed(key))
+            body = {"success": True, "data": [dict(_company(rng, index), url=link, description=_text(rng, 80))
+                                              for index, link in enumerate(json.loads(key))]}
+        elif route == "/company_posts":
+            posts = []
+            for link in json.loads(key):
+                posts.extend(posts_page(_seed(link), posts=count)["data"])
+            body = {"success": True, "data": posts}
+        elif route in PROFILE_ROUTES:
+            body = large_profile(_seed(key), experiences=self.experiences)
+        elif route in ("/company", "/private_company_insights_2"):
+            rng = random.Random(_seed(key))
+            body = {"success": True, "data": dict(_company(rng, 0), url=key, description=_text(rng, 200),
+                                                  specialities=[_text(rng, 2) for _ in range(10)])}
+        elif route in ("/post", "/profile_posts_all"):
+            page_body = posts_page(_seed(key), posts=1 if route == "/post" else self.page_size * self.pages)
+            body = dict(page_body, data=page_body["data"][0] if route == "/post" else page_body["data"])
+        elif route.startswith("/suggestion_") or route == "/search_geourns":
+            rng = random.Random(_seed(route + key))
+            body = {"success": True, "data": [{"id": str(rng.randint(1, 10 ** 8)), "name": f"{key or 'item'} {index}"}
+                                              for index in range(min(self.page_size, 10))]}
+        else:
+            # Searches, jobs, counts: a page of small records
+            rng = random.Random(_seed(route + key))
+            body = {"success": True, "total": self.page_size * 10,
+                    "data": [{"title": _text(rng, 4), "url": f"https://www.linkedin.com/in/result-{rng.getrandbits(40):x}",
+                              "subtitle": _text(rng, 12)} for _ in range(self.page_size)]}
+        return json.dumps(body).encode("utf-8")
+
+    def _encoded(self, route: str, key: str, page: int, count: int) -> Tuple[bytes, Optional[bytes]]:
+        """(body, gzipped body or None when too small to bother); cached, like the generation itself."""
+        body = self._body(route, key, page, count)
+        return body, gzip.compress(body, 5) if len(body) > 1024 else None
+
+    def _handler(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: bytes, headers: Dict[str, str] = None,
+                      gzipped_body: Optional[bytes] = None) -> None:
+                gzipped = gzipped_body is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+                if gzipped:
+                    body = gzipped_body
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                if gzipped:
+                    self.send_header("Content-Encoding", "gzip")
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _serve(self, payload: Optional[Dict[str, Any]]) -> None:
+                route, _, query = self.path.partition("?")
+                if route == "/__stats":
+                    self._send(200, json.dumps({f"{r} {s}": n for (r, s), n in upstream.stats.items()}).encode())
+                    return
+                api_key = self.headers.get("x-rapidapi-key", "")
+                quota = upstream._quota(api_key)
+                if quota is not None:
+                    upstream.stats[(f"key {api_key}", 429 if "Retry-After" in quota else 200)] += 1
+                    if "Retry-After" in quota:
+                        upstream.stats[(route, 429)] += 1
+                        self._send(429, b'{"message":"You have exceeded the rate limit per second for your plan"}', quota)
+                        return
+                if route not in upstream.routes:
+                    upstream.stats[(route, 404)] += 1
+                    self._send(404, b'{"message":"Endpoint does not exist"}')
+                    return
+
+                status, delay = upstream._fault()
+                time.sleep(delay)
+                if status is not None:
+                    upstream.stats[(route, status)] += 1
+                    headers = {"Retry-After": f"{upstream.retry_after:g}"} if status == 429 else None
+                    if quota is not None:
+                        headers = dict(quota, **(headers or {}))
+                    self._send(status, json.dumps({"message": f"Injected {status}"}).encode(), headers)
+                    return
+
+                params = dict(urllib.parse.parse_qsl(query))
+                params.update(payload or {})
+                links = params.get("links")
+                page = params.get("page") or 1
+                token = params.get("paginationToken") or params.get("pagination_token")
+                if token:
+                    # Tokens carry the page they lead to
+                    page = token.split("-")[-2]
+                key = json.dumps(links) if links is not None else str(
+                    next((v for k, v in sorted(params.items()) if k not in ("page", "paginationToken", "pagination_token", "count")), ""))
+                body, gzipped_body = upstream.encoded(route, key, int(page), int(params.get("count") or 1))
+                upstream.stats[(route, 200)] += 1
+                self._send(200, body, quota, gzipped_body=gzipped_body)
+
+            def do_GET(self):
+                self._serve(None)
+
+            def do_POST(self):
+                raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                try:
+                    payload = json.loads(raw) if raw else {}
+                except ValueError:
+                    self._send(400, b'{"message":"Invalid JSON body"}')
+                    return
+                self._serve(payload)
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--port", type=int, default=8700)
+    parser.add_argument("--latency", type=float, default=0.05, help="mean added latency, seconds")
+    parser.add_argument("--jitter", type=float, default=0.5, help="latency spread as a fraction of it")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 5xx answers")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of 429 answers")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--pages", type=int, default=3, help="pages per feed")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--experiences", type=int, default=40, help="experiences per profile")
+    parser.add_argument("--key-rate", type=int, default=0, help="requests per second per API key; 0 for no quota")
+    args = parser.parse_args()
+    upstream = MockUpstream(port=args.port, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                            throttle_rate=args.throttle_rate, retry_after=args.retry_after, pages=args.pages,
+                            page_size=args.page_size, experiences=args.experiences, key_rate=args.key_rate)
+    print(f"Mock upstream on http://{upstream.host} serving {len(upstream.routes)} routes "
+          f"(LINKEDIN_API_SCHEME=http LINKEDIN_API_HOST={upstream.host})")
+    try:
+        upstream.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Synthetic upstream payloads shaped like the API's larger responses.
+
+The API has no published response samples, so these follow the field names
+seen in person/profile and post responses, with deterministic content sized
+like real heavy profiles (tens of experiences, long descriptions).
+"""
+import random
+from typing import Any, Dict, List
+
+_WORDS = ("data platform engineering team product growth cloud customer scale built led launched "
+          "infrastructure migration analytics pipeline revenue hiring strategy mobile payments").split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _company(rng: random.Random, index: int) -> Dict[str, Any]:
+    slug = f"company-{index}-{rng.randint(1000, 9999)}"
+    return {
+        "name": slug.replace("-", " ").title(),
+        "url": f"https://www.linkedin.com/company/{slug}/",
+        "urn": f"urn:li:fsd_company:{rng.randint(10 ** 6, 10 ** 8)}",
+        "logo": f"https://media.licdn.com/dms/image/{rng.getrandbits(64):x}/company-logo_200_200/0/",
+        "industry": rng.choice(("Software Development", "Financial Services", "Retail", "Education")),
+        "staffCount": rng.randint(10, 50000)
+    }
+
+
+def large_profile(seed: int = 1, experiences: int = 40, educations: int = 6, skills: int = 60) -> Dict[str, Any]:
+    """A /person_data_with_experiences-style profile body."""
+    rng = random.Random(seed)
+    username = f"person-{seed}"
+    return {
+        "success": True,
+        "message": "",
+        "data": {
+            "urn": f"ACoAA{rng.getrandbits(96):x}",
+            "username": username,
+            "full_name": f"Person {seed}",
+            "headline": _text(rng, 12),
+            "summary": _text(rng, 250),
+            "location": {"country": "Germany", "city": "Berlin", "full": "Berlin, Germany"},
+            "profile_url": f"https://www.linkedin.com/in/{username}/",
+            "profilePicture": f"https://media.licdn.com/dms/image/{rng.getrandbits(64):x}/profile-displayphoto/0/",
+            "follower_count": rng.randint(100, 50000),
+            "connection_count": 500,
+            "experiences": [
+                {
+                    "title": _text(rng, 3),
+                    "company": _company(rng, index)["name"],
+                    "companyInfo": _company(rng, index),
+                    "location": "Berlin, Germany",
+                    "start": {"year": 2024 - index, "month": rng.randint(1, 12)},
+                    "end": {"year": 2025 - index, "month": rng.randint(1, 12)},
+                    "description": _text(rng, 120),
+                    "skills": [rng.choice(_WORDS) for _ in range(8)]
+                }
+                for index in range(experiences)
+            ],
+            "educations": [
+                {
+                    "school": f"University {index}",
+                    "degree": _text(rng, 4),
+                    "start": {"year": 2000 + index},
+                    "end": {"year": 2004 + index},
+                    "description": _text(rng, 60)
+                }
+                for index in range(educations)
+            ],
+            "skills": [{"name": _text(rng, 2), "endorsementsCount": rng.randint(0, 99)} for _ in range(skills)]
+        }
+    }
+
+
+def posts_page(seed: int = 1, posts: int = 50) -> Dict[str, Any]:
+    """A /profile_posts_all-style page of posts."""
+    rng = random.Random(seed)
+    items: List[Dict[str, Any]] = []
+    for index in range(posts):
+        activity = rng.randint(7 * 10 ** 18, 8 * 10 ** 18)
+        items.append({
+            "urn": f"urn:li:activity:{activity}",
+            "url": f"https://www.linkedin.com/feed/update/urn:li:activity:{activity}/",
+            "text": _text(rng, 180),
+            "postedAt": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T10:00:00Z",
+            "author": {"name": f"Person {seed}", "headline": _text(rng, 12), "url": f"https://www.linkedin.com/in/person-{seed}/"},
+            "reactions": {"total": rng.randint(0, 5000), "like": rng.randint(0, 4000), "praise": rng.randint(0, 300)},
+            "commentsCount": rng.randint(0, 400),
+            "repostsCount": rng.randint(0, 200),
+            "images": [{"url": f"https://media.licdn.com/dms/image/{rng.getrandbits(64):x}/", "width": 1280, "height": 720}
+                       for _ in range(rng.randint(0, 4))]
+        })
+    return {"success": True, "message": "", "data": items, "paginationToken": f"{rng.getrandbits(128):x}"}
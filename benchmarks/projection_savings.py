@@ -0,0 +1,46 @@
+"""
+Bytes saved by the `fields` projection of person_data_with_experiences / profile_posts_all.
+
+Projects synthetic heavy payloads (see payloads.py) with typical agent field
+lists and prints the size of the serialized tool result with and without
+projection, plus the time the projection itself takes.
+
+Run from the repository root:
+    python benchmarks/projection_savings.py
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from projection import compile_fields, project_response
+from payloads import large_profile, posts_page
+
+CASES = [
+    ("profile: name + headline", large_profile(), ["data.full_name", "data.headline"]),
+    ("profile: career", large_profile(), ["data.full_name", "data.experiences[].company", "data.experiences[].title",
+                                          "data.experiences[].start", "data.experiences[].end"]),
+    ("posts: text + date", posts_page(), ["data[].text", "data[].postedAt"]),
+    ("posts: engagement", posts_page(), ["data[].urn", "data[].reactions.total", "data[].commentsCount"]),
+]
+
+
+def main() -> None:
+    print(f"{'case':28} {'full':>10} {'projected':>10} {'saved':>7} {'project time':>13}")
+    for name, body, fields in CASES:
+        response = {"success": True, "status": 200, "data": body}
+        tree = compile_fields(fields)
+        full = len(json.dumps(response).encode("utf-8"))
+        rounds = 200
+        start = time.perf_counter()
+        for _ in range(rounds):
+            projected = project_response(response, tree)
+        elapsed = (time.perf_counter() - start) / rounds
+        size = len(json.dumps(projected).encode("utf-8"))
+        print(f"{name:28} {full:>9}B {size:>9}B {1 - size / full:>6.1%} {elapsed * 1e6:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
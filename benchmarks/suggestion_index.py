@@ -0,0 +1,124 @@
+"""
+Upstream calls and lookup cost of the local suggestion index.
+
+Replays keystroke-style sessions ("g", "go", "goo", ... "google cloud")
+against a simulated /suggestion_company over a catalog of company names:
+the upstream returns the first 10 names in which every query word prefixes
+a word, like the real autocomplete, with has_more telling whether it left
+any out. Reports
+
+- upstream calls with the index vs. one per call without it
+- how many local answers differ from what the upstream would have said
+- lookup latency of exact and prefix hits, and of misses
+- snapshot size, save and load time
+
+Run from the repository root:
+    python benchmarks/suggestion_index.py
+"""
+import bisect
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from suggestions import SuggestionIndex, normalize_query, response_items  # noqa: E402
+
+ROUTE = "/suggestion_company"
+PAGE_SIZE = 10
+SESSIONS = 2000
+SEED = 7
+
+SYLLABLES = ["al", "ba", "co", "de", "ex", "fi", "go", "ha", "in", "jo", "ka", "lo", "mi", "no", "or", "pa",
+             "qu", "ra", "si", "to", "un", "ve", "wa", "xe", "yo", "ze"]
+SUFFIXES = ["Labs", "Systems", "Group", "Cloud", "Health", "Bank", "Energy", "Media", "Foods", "Motors"]
+
+
+def catalog(rng: random.Random, size: int = 20000):
+    names = set()
+    while len(names) < size:
+        word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+        names.add(f"{word} {rng.choice(SUFFIXES)}" if rng.random() < 0.7 else word)
+    return [{"id": str(index), "name": name, "urn": f"urn:li:organization:{index}", "words": name.casefold().split()}
+            for index, name in enumerate(sorted(names))]
+
+
+def upstream(companies, query: str, answers={}, words=[]):
+    if query in answers:
+        return answers[query]
+    if not words:
+        words.extend(sorted((word, index) for index, company in enumerate(companies) for word in company["words"]))
+    parts = query.split()
+    # Companies with a word starting with the first part, via bisect; the other parts are checked on those
+    candidates = set()
+    position = bisect.bisect_left(words, (parts[0], -1))
+    while position < len(words) and words[position][0].startswith(parts[0]):
+        candidates.add(words[position][1])
+        position += 1
+    found = []
+    more = False
+    for index in sorted(candidates):
+        company = companies[index]
+        if all(any(word.startswith(part) for word in company["words"]) for part in parts[1:]):
+            if len(found) == PAGE_SIZE:
+                more = True
+                break
+            found.append({key: value for key, value in company.items() if key != "words"})
+    answers[query] = {"success": True, "status": 200, "data": {"success": True, "data": found, "has_more": more}}
+    return answers[query]
+
+
+def sessions(rng: random.Random, companies):
+    """Typed-out names, one call per keystroke; popular names come up again."""
+    popular = rng.sample(companies, 300)
+    for _ in range(SESSIONS):
+        target = rng.choice(popular)["name"] if rng.random() < 0.6 else rng.choice(companies)["name"]
+        typed = target[:rng.randint(4, len(target))]
+        yield [typed[:end] for end in range(1, len(typed) + 1)]
+
+
+def main() -> None:
+    rng = random.Random(SEED)
+    companies = catalog(rng)
+    index = SuggestionIndex()
+    calls = upstream_calls = wrong = 0
+    timings = {"exact": [], "prefix": [], "miss": []}
+    for keystrokes in sessions(rng, companies):
+        for text in keystrokes:
+            calls += 1
+            query = normalize_query(text)
+            start = time.perf_counter()
+            result, outcome = index.lookup(ROUTE, query)
+            timings[outcome].append(time.perf_counter() - start)
+            expected = upstream(companies, query)
+            if result is None:
+                upstream_calls += 1
+                index.merge(ROUTE, query, expected)
+            elif [item["id"] for item in response_items(result)] != [item["id"] for item in response_items(expected)]:
+                wrong += 1
+    print(f"{calls} calls in {SESSIONS} sessions: {upstream_calls} upstream with the index "
+          f"({upstream_calls / calls:.1%}), {calls} without; {wrong} local answers differing from the upstream")
+    for outcome, samples in timings.items():
+        if samples:
+            print(f"  {outcome:6s} {len(samples):6d} lookups, median {statistics.median(samples) * 1e6:6.1f}us, "
+                  f"p99 {sorted(samples)[int(len(samples) * 0.99)] * 1e6:6.1f}us")
+    stats = index.stats()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "suggestions.json")
+        start = time.perf_counter()
+        index.save(path)
+        saved = time.perf_counter() - start
+        start = time.perf_counter()
+        restored = SuggestionIndex().load(path)
+        loaded = time.perf_counter() - start
+        print(f"snapshot: {stats['queries']} queries / {stats['items']} distinct items, "
+              f"{os.path.getsize(path) / 1024:.0f}KB, save {saved * 1000:.1f}ms, load {loaded * 1000:.1f}ms "
+              f"({restored} queries restored)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Startup and per-call cost of the tools.
+
+- import: wall time of ``import linkedin_api_tools`` in a fresh interpreter
+  (median of several runs), i.e. what every stdio launch pays before serving
+- first list_tools: registering every tool with FastMCP, now done on the
+  first listing instead of at import
+- per call: a tool call with make_api_request_async replaced by a stub, so
+  only the tool's own work is timed (argument handling, query/body encoding,
+  result serialization), called directly and through mcp.call_tool
+
+Run from the repository root:
+    python benchmarks/tool_registry.py
+"""
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+IMPORT_RUNS = 7
+CALLS = 20000
+
+
+def import_time() -> float:
+    code = "import time; start = time.perf_counter(); import linkedin_api_tools; print(time.perf_counter() - start)"
+    samples = []
+    for _ in range(IMPORT_RUNS):
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+async def per_call(tools) -> None:
+    async def stub(method, endpoint, payload=None, headers=None, fields=None):
+        return {"success": True, "status": 200, "data": {"endpoint": endpoint, "payload": payload}}
+
+    tools.make_api_request_async = stub
+    calls = [
+        ("job_details (GET, 1 param)", "job_details", {"job_id": "3862806121"}),
+        ("search_jobs (GET, 14 params)", "search_jobs", {"query": "software engineer", "page": "1",
+                                                         "searchLocationId": "Europe", "jobType": "F"}),
+        ("company_jobs (POST body)", "company_jobs", {"company_url": "https://www.linkedin.com/company/google"}),
+    ]
+    for label, name, arguments in calls:
+        fn = getattr(tools, name)
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            await fn(**arguments)
+        direct = (time.perf_counter() - start) / CALLS
+        start = time.perf_counter()
+        for _ in range(CALLS // 4):
+            await tools.mcp.call_tool(name, arguments)
+        via_mcp = (time.perf_counter() - start) / (CALLS // 4)
+        print(f"{label:32s} direct {direct * 1e6:7.1f}us   mcp.call_tool {via_mcp * 1e6:7.1f}us")
+
+
+def main() -> None:
+    print(f"import linkedin_api_tools: {import_time() * 1000:.1f}ms (median of {IMPORT_RUNS})")
+    import logging
+    import linkedin_api_tools as tools
+    tools.logger.setLevel(logging.WARNING)
+    start = time.perf_counter()
+    listed = asyncio.run(tools.mcp.list_tools())
+    print(f"first list_tools: {(time.perf_counter() - start) * 1000:.1f}ms for {len(listed)} tools")
+    asyncio.run(per_call(tools))
+
+
+if __name__ == "__main__":
+    main()
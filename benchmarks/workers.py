@@ -0,0 +1,150 @@
+"""
+Upstream calls, 429s and throughput of N workers sharing state vs. N separate replicas.
+
+Starts benchmarks/mock_upstream.py with a per-key quota (--key-rate) and,
+for each worker count, serves the app two ways:
+
+- shared: ``python main.py`` with LINKEDIN_WORKERS=N, i.e. uvicorn workers
+  sharing one SQLite file (response cache, in-flight requests, rate-limit
+  buckets and the MCP session relay)
+- separate: N single-process servers with nothing shared, the MCP sessions
+  spread over them, as with replicas behind a sticky load balancer
+
+Both run with LINKEDIN_RATE_LIMIT equal to the key's quota. --sessions MCP SSE
+clients work through the same --calls ``person`` lookups in every run, links
+drawn from a Zipf distribution over --entities profiles, so lookups repeat
+across sessions and workers and cold ones arrive concurrently. Reports calls
+per second, failures, latency, upstream requests (credits) and upstream 429s
+per run.
+
+Run from the repository root:
+    python benchmarks/workers.py [--workers 1,2,4] [--sessions 8] [--calls 400] [--entities 300]
+        [--latency 0.2] [--key-rate 20]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from load_test import free_port, percentile, stop, succeeded, wait_for  # noqa: E402
+
+
+def upstream_stats(port: int) -> Dict[str, int]:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/__stats") as response:
+        stats = json.loads(response.read())
+    routes = {name: count for name, count in stats.items() if name.startswith("/")}
+    return {"requests": sum(routes.values()),
+            "throttled": sum(count for name, count in routes.items() if name.endswith(" 429"))}
+
+
+async def drive(urls: List[str], sessions: int, lookups: List[int]) -> Dict[str, float]:
+    from mcp import ClientSession
+    from mcp.client.sse import sse_client
+
+    latencies: List[float] = []
+    failures = 0
+    pending = iter(lookups)
+
+    async def client(url: str) -> None:
+        nonlocal failures
+        async with sse_client(url, timeout=30, sse_read_timeout=600) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                for entity in pending:
+                    start = time.perf_counter()
+                    try:
+                        result = await session.call_tool("person", {"link": f"https://www.linkedin.com/in/w-{entity}"})
+                        ok = not result.isError and succeeded(json.loads(result.content[0].text))
+                    except Exception:
+                        ok = False
+                    latencies.append(time.perf_counter() - start)
+                    failures += not ok
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(urls[index % len(urls)]) for index in range(sessions)))
+    elapsed = time.perf_counter() - start
+    return {"calls": len(latencies), "failures": failures, "rate": len(latencies) / elapsed,
+            "p50_ms": percentile(latencies, 50) * 1000, "p95_ms": percentile(latencies, 95) * 1000}
+
+
+def serve(mode: str, workers: int, env: Dict[str, str], directory: str) -> List[subprocess.Popen]:
+    """Starts the servers of one run and returns them once they answer; their SSE URLs are on .url."""
+    servers = []
+    for index in range(1 if mode == "shared" else workers):
+        port = free_port()
+        server_env = dict(env, PORT=str(port))
+        if mode == "shared":
+            server_env.update(LINKEDIN_WORKERS=str(workers),
+                              LINKEDIN_SHARED_STATE=os.path.join(directory, f"shared-{workers}.db"))
+        server = subprocess.Popen([sys.executable, os.path.join(ROOT, "main.py")], cwd=ROOT, env=server_env,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        server.url = f"http://127.0.0.1:{port}/mcp/sse"
+        servers.append(server)
+    for server in servers:
+        wait_for(server.url.replace("/mcp/sse", "/"), server)
+    return servers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--calls", type=int, default=400, help="person lookups per run")
+    parser.add_argument("--entities", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--key-rate", type=int, default=20)
+    args = parser.parse_args()
+
+    port = free_port()
+    upstream = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "benchmarks", "mock_upstream.py"), "--port", str(port),
+         "--latency", str(args.latency), "--key-rate", str(args.key_rate)],
+        stdout=subprocess.DEVNULL)
+    wait_for(f"http://127.0.0.1:{port}/__stats", upstream)
+    env = dict(os.environ, LINKEDIN_API_SCHEME="http", LINKEDIN_API_HOST=f"127.0.0.1:{port}", LOG_HOST="",
+               LINKEDIN_RATE_LIMIT=str(args.key_rate),
+               LINKEDIN_BREAKER_MIN_REQUESTS="1000000", LINKEDIN_SUGGEST_INDEX="0", PYTHONPATH=ROOT)
+    env.pop("LINKEDIN_SHARED_STATE", None)
+    rng = random.Random(7)
+    lookups = rng.choices(range(args.entities), weights=[1 / (rank + 1) for rank in range(args.entities)],
+                          k=args.calls)
+    print(f"mock latency {args.latency * 1000:.0f}ms, quota {args.key_rate} req/s per key; {args.sessions} MCP "
+          f"sessions calling person over {args.entities} profiles (Zipf) {args.calls} times per run; "
+          f"{os.cpu_count()} CPU(s)")
+    print(f"{'run':14s} {'calls/s':>8s} {'fail':>5s} {'p50 ms':>8s} {'p95 ms':>8s} {'upstream':>9s} {'429s':>5s}")
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            for workers in [int(count) for count in args.workers.split(",")]:
+                for mode in ("shared", "separate"):
+                    if workers == 1 and mode == "separate":
+                        continue
+                    # A fresh key per run, so no run starts with another one's quota used up
+                    run_env = dict(env, LINKEDIN_API_KEY=f"bench-{mode}-{workers}")
+                    before = upstream_stats(port)
+                    servers = serve(mode, workers, run_env, directory)
+                    try:
+                        result = asyncio.run(drive([server.url for server in servers], args.sessions, lookups))
+                    finally:
+                        for server in servers:
+                            stop(server)
+                    after = upstream_stats(port)
+                    label = f"{workers} {mode if workers > 1 else 'worker'}"
+                    print(f"{label:14s} {result['rate']:8.1f} {result['failures']:5d} {result['p50_ms']:8.1f} "
+                          f"{result['p95_ms']:8.1f} {after['requests'] - before['requests']:9d} "
+                          f"{after['throttled'] - before['throttled']:5d}")
+    finally:
+        stop(upstream)
+
+
+if __name__ == "__main__":
+    main()
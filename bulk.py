@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import re
+import urllib.parse
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger('linkedin_api_tools.bulk')
+
+# Upstream limits of the batch endpoints
+PROFILES_PER_CALL = 100
+COMPANIES_PER_CALL = 100
+COMPANY_POSTS_PER_CALL = 50
+
+_ENTITY_SLUG = re.compile(r"/(?:in|company|school|showcase)/([^/?#]+)", re.IGNORECASE)
+
+# Fields a batch item may use to say which profile or company it describes
+_LINK_FIELDS = ("entity", "link", "url", "profile_url", "profileUrl", "linkedin_url", "linkedinUrl",
+                "company_url", "companyUrl", "public_identifier", "publicIdentifier", "username",
+                "universal_name", "universalName")
+
+
+def link_key(link: str) -> str:
+    """Reduces a profile/company link (or bare vanity name) to its lowercase vanity name."""
+    match = _ENTITY_SLUG.search(link)
+    slug = match.group(1) if match else link.strip().strip("/")
+    return urllib.parse.unquote(slug).lower()
+
+
+def dedupe_links(links: List[str]) -> List[str]:
+    """Drops links that point at an entity already listed, keeping first occurrences in order."""
+    seen = set()
+    unique = []
+    for link in links:
+        key = link_key(link)
+        if key not in seen:
+            seen.add(key)
+            unique.append(link)
+    return unique
+
+
+def chunked(items: List[Any], size: int) -> Iterator[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def batch_items(data: Any) -> List[Any]:
+    """Finds the list of per-entity items in a batch response body."""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        for value in data.values():
+            if isinstance(value, list) and value and isinstance(value[0], dict):
+                return value
+    return []
+
+
+def item_link_key(item: Any) -> Optional[str]:
+    """Returns the link_key of the entity a batch item describes, if it says."""
+    if not isinstance(item, dict):
+        return None
+    for source in (item, item.get("data")):
+        if not isinstance(source, dict):
+            continue
+        for field in _LINK_FIELDS:
+            value = source.get(field)
+            if isinstance(value, str) and value:
+                return link_key(value)
+    return None
+
+
+async def fan_out(links: List[str], chunk_size: int,
+                  fetch_chunk: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+                  concurrency: int = 4, per_link: bool = True) -> Dict[str, Any]:
+    """
+    Fetches an arbitrarily long link list through a batch endpoint.
+
+    Links are deduplicated and split into upstream-sized chunks that are
+    fetched concurrently, at most ``concurrency`` at a time. A list that fits in
+    a single call is passed through unchanged and its response returned as is.
+
+    Otherwise items are merged in input order. With ``per_link``, items are
+    matched back to their links and every link without an item is listed in
+    ``errors``; without it (e.g. company posts, many items per link) items are
+    kept in chunk order and only failed chunks are reported.
+
+    Args:
+        links: Links as given by the caller
+        chunk_size: Maximum links per upstream call
+        fetch_chunk: Coroutine sending one chunk upstream
+        concurrency: Maximum chunks in flight at once
+        per_link: Whether items can be attributed to individual links
+
+    Returns:
+        The upstream response for a single chunk, or a merged result dictionary
+    """
+    unique = dedupe_links(links)
+    chunks = list(chunked(unique, chunk_size))
+    if len(chunks) <= 1:
+        return await fetch_chunk(unique)
+
+    logger.info(f"Fanning out {len(unique)} links ({len(links)} requested) over {len(chunks)} chunks")
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(chunk: List[str]) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await fetch_chunk(chunk)
+            except Exception as e:
+                return {"success": False, "status": 500, "message": str(e)}
+
+    responses = await asyncio.gather(*(run(chunk) for chunk in chunks))
+
+    data: List[Any] = []
+    errors: List[Dict[str, Any]] = []
+    for chunk, response in zip(chunks, responses):
+        if not response.get("success"):
+            for link in chunk:
+                errors.append({
+                    "link": link,
+                    "status": response.get("status"),
+                    "message": response.get("message", response.get("error", "Unknown API error"))
+                })
+            continue
+        items = batch_items(response.get("data"))
+        if not per_link:
+            data.extend(items)
+            continue
+        by_key: Dict[str, Any] = {}
+        unattributed = []
+        for item in items:
+            key = item_link_key(item)
+            if key is None:
+                unattributed.append(item)
+            else:
+                by_key.setdefault(key, item)
+        if unattributed and not by_key:
+            # Items carry no link to match on; keep upstream order for this chunk
+            data.extend(unattributed)
+            continue
+        for link in chunk:
+            item = by_key.get(link_key(link))
+            if item is None:
+                errors.append({"link": link, "status": response.get("status"), "message": "Not returned by upstream"})
+            else:
+                data.append(item)
+        data.extend(unattributed)
+
+    succeeded = sum(1 for response in responses if response.get("success"))
+    return {
+        "success": succeeded > 0,
+        "status": 200 if succeeded else responses[0].get("status", 500),
+        "data": data,
+        "errors": errors,
+        "requested": len(links),
+        "unique": len(unique),
+        "chunks": len(chunks)
+    }
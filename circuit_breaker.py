@@ -0,0 +1,181 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Tuple
+
+logger = logging.getLogger('linkedin_api_tools.breaker')
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_breaker_failure(status: int, count_bad_requests: bool = False) -> bool:
+    """
+    Whether a response counts against its route's circuit.
+
+    Server errors count; 4xx responses are about the request or credentials
+    (a dead or garbled link answers 400), and 429 is left to the rate limiter.
+    400 counts only with ``count_bad_requests``, for routes that answer 400
+    when they are broken themselves.
+    """
+    return status >= 500 or (count_bad_requests and status == 400)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one upstream route, driven by its error rate.
+
+    While closed, outcomes are kept for the last ``window`` seconds; once at
+    least ``min_requests`` were seen and the share of failures reaches
+    ``failure_rate``, the circuit opens and callers fail fast. After
+    ``cooldown`` seconds a single probe request is let through (half-open): its
+    success closes the circuit, its failure reopens it with the cooldown
+    doubled, up to ``max_cooldown``. The probe is the next real request after
+    the cooldown; nothing is replayed in the background.
+
+    Args:
+        route: Route the breaker guards
+        failure_rate: Share of failed requests that opens the circuit
+        min_requests: Requests needed in the window before the rate is trusted
+        window: Length of the outcome window, in seconds
+        cooldown: Seconds the circuit stays open before the first probe
+        max_cooldown: Upper bound for the doubled cooldown
+        count_bad_requests: Whether 400 responses count as failures on this route
+    """
+
+    def __init__(self, route: str, failure_rate: float = 0.5, min_requests: int = 10, window: float = 60,
+                 cooldown: float = 30, max_cooldown: float = 300, count_bad_requests: bool = False):
+        self.route = route
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.cooldown = cooldown
+        self.count_bad_requests = count_bad_requests
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures = 0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+        self._stats = {"opened": 0, "rejected": 0}
+
+    def _trim(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window:
+            _, ok = self._outcomes.popleft()
+            if not ok:
+                self._failures -= 1
+
+    def allow(self) -> bool:
+        """Whether a request may go upstream now; in half-open state only one probe is allowed."""
+        now = time.monotonic()
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and now - self.opened_at >= self.cooldown:
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == HALF_OPEN and self._probe_in_flight and now - self._probe_started > self.window:
+                # The probe never reported back (e.g. its caller was cancelled)
+                self._probe_in_flight = False
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                self._probe_started = now
+                return True
+            self._stats["rejected"] += 1
+            return False
+
+    def release(self) -> None:
+        """Gives back a probe slot taken by allow() for a request that never went upstream."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record(self, ok: bool) -> bool:
+        """Records an outcome; returns True if this outcome opened the circuit."""
+        now = time.monotonic()
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+                if ok:
+                    logger.info(f"Circuit closed for {self.route}")
+                    self.state = CLOSED
+                    self.cooldown = self.base_cooldown
+                    self._outcomes.clear()
+                    self._failures = 0
+                    return False
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+                return self._open(now)
+            if self.state == OPEN:
+                return False
+            self._outcomes.append((now, ok))
+            if not ok:
+                self._failures += 1
+            self._trim(now)
+            total = len(self._outcomes)
+            if total >= self.min_requests and self._failures / total >= self.failure_rate:
+                return self._open(now)
+            return False
+
+    def _open(self, now: float) -> bool:
+        logger.warning(f"Circuit opened for {self.route} for {self.cooldown:.0f}s")
+        self.state = OPEN
+        self.opened_at = now
+        self._stats["opened"] += 1
+        return True
+
+    def is_failure(self, status: int) -> bool:
+        return is_breaker_failure(status, self.count_bad_requests)
+
+    def retry_after(self) -> float:
+        """Seconds until the next probe is allowed (0 unless open)."""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            total = len(self._outcomes)
+            return dict(
+                self._stats,
+                state=self.state,
+                requests_in_window=total,
+                failure_rate=round(self._failures / total, 3) if total else 0.0,
+                cooldown=self.cooldown,
+                retry_after=round(max(0.0, self.cooldown - (now - self.opened_at)), 1) if self.state == OPEN else 0.0
+            )
+
+
+class CircuitBreakerRegistry:
+    """
+    Creates one CircuitBreaker per route on first use, all with the same settings.
+
+    Args:
+        bad_request_routes: Routes whose 400 responses count as failures
+        **settings: CircuitBreaker arguments
+    """
+
+    def __init__(self, bad_request_routes: Iterable[str] = (), **settings: Any):
+        self.bad_request_routes = frozenset(bad_request_routes)
+        self.settings = settings
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, route: str) -> CircuitBreaker:
+        breaker = self._breakers.get(route)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(route)
+                if breaker is None:
+                    breaker = self._breakers[route] = CircuitBreaker(
+                        route, count_bad_requests=route in self.bad_request_routes, **self.settings)
+        return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {route: breaker.snapshot() for route, breaker in sorted(self._breakers.items())}
@@ -0,0 +1,161 @@
+import asyncio
+import copy
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import json_codec
+import metrics
+
+# Polling of a request another process performs: first interval, doubling up to the last
+POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 0.2
+
+
+class _Call:
+    """An in-flight synchronous call shared by every caller with the same key."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Collapses identical concurrent requests into one upstream call.
+
+    The first caller for a key (the leader) performs the call; callers that
+    arrive while it is still running wait for it and receive a deep copy of
+    its result, so no two callers ever share a mutable response.
+
+    The async path runs the call as its own task: a caller that gets cancelled
+    stops waiting without cancelling the request the others depend on.
+
+    With ``shared`` the leader also coalesces with the other worker
+    processes: it claims the key in the shared store first, and if another
+    process is still performing the request, polls for that process' result
+    (decoded from JSON, so a fresh copy) instead of calling fn. Only requests
+    still running are joined, never finished ones, and only successful
+    results are handed over: on a failure (an exception or a result without
+    "success") the claim is given up and the waiting callers perform the
+    request themselves. A claim whose holder died lapses after ``lease``
+    seconds. On the async path every call to the store runs in a worker
+    thread, so waiting on its lock or the network never stalls the event loop.
+
+    Args:
+        shared: Optional SqliteSharedState/RemoteSharedState coalescing across processes
+        lease: Seconds a claim holds at most, i.e. the longest a request may take
+    """
+
+    def __init__(self, shared: Optional[Any] = None, lease: float = 90):
+        self.shared = shared
+        self.lease = lease
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = {"leaders": 0, "coalesced": 0, "remote": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Awaits fn() once per key across all concurrent callers."""
+        task = self._tasks.get(key)
+        leader = task is None
+        if leader:
+            task = asyncio.ensure_future(fn() if self.shared is None else self._across_processes(key, fn))
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget_task(key, done))
+        with self._lock:
+            self._stats["leaders" if leader else "coalesced"] += 1
+        (metrics.COALESCING_LEADERS if leader else metrics.COALESCING_COALESCED).inc()
+        result = await asyncio.shield(task)
+        return result if leader else copy.deepcopy(result)
+
+    def _forget_task(self, key: str, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+    def _hand_over(self, key: str, token: str, result: Any) -> None:
+        # Errors (503s, local 429s...) are not replayed to other processes; their callers try for themselves
+        if isinstance(result, dict) and result.get("success"):
+            self.shared.publish(key, token, json_codec.dumps_bytes(result))
+        else:
+            self.shared.release(key, token)
+
+    async def _across_processes(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        while True:
+            token = await asyncio.to_thread(self.shared.claim, key, self.lease)
+            if token is not None:
+                try:
+                    result = await fn()
+                except BaseException:
+                    await asyncio.to_thread(self.shared.release, key, token)
+                    raise
+                await asyncio.to_thread(self._hand_over, key, token, result)
+                return result
+            interval = POLL_INTERVAL
+            state, encoded = await asyncio.to_thread(self.shared.poll, key)
+            while state == "running":
+                await asyncio.sleep(interval)
+                interval = min(interval * 2, MAX_POLL_INTERVAL)
+                state, encoded = await asyncio.to_thread(self.shared.poll, key)
+            if state == "done":
+                with self._lock:
+                    self._stats["remote"] += 1
+                metrics.COALESCING_REMOTE.inc()
+                return json_codec.loads(encoded)
+
+    def _across_processes_sync(self, key: str, fn: Callable[[], Any]) -> Any:
+        while True:
+            token = self.shared.claim(key, self.lease)
+            if token is not None:
+                try:
+                    result = fn()
+                except BaseException:
+                    self.shared.release(key, token)
+                    raise
+                self._hand_over(key, token, result)
+                return result
+            interval = POLL_INTERVAL
+            state, encoded = self.shared.poll(key)
+            while state == "running":
+                time.sleep(interval)
+                interval = min(interval * 2, MAX_POLL_INTERVAL)
+                state, encoded = self.shared.poll(key)
+            if state == "done":
+                with self._lock:
+                    self._stats["remote"] += 1
+                metrics.COALESCING_REMOTE.inc()
+                return json_codec.loads(encoded)
+
+    def do_sync(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Calls fn() once per key across all concurrent threads."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            self._stats["leaders" if leader else "coalesced"] += 1
+        (metrics.COALESCING_LEADERS if leader else metrics.COALESCING_COALESCED).inc()
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        try:
+            call.result = fn() if self.shared is None else self._across_processes_sync(key, fn)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._tasks) + len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._tasks) + len(self._calls))
@@ -0,0 +1,104 @@
+import logging
+import zlib
+from typing import Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+import metrics
+
+logger = logging.getLogger('linkedin_api_tools.compression')
+
+# Encodings offered to the upstream, best first; brotli only when a decoder is installed
+ACCEPT_ENCODING = "br, gzip, deflate" if brotli is not None else "gzip, deflate"
+
+# Size of the reads feeding the decompressor
+READ_CHUNK = 64 * 1024
+
+COMPRESSED_BYTES = metrics.registry.counter(
+    "linkedin_upstream_compressed_bytes_total", "Compressed response bytes received from upstream", ("route", "encoding"))
+DECOMPRESSED_BYTES = metrics.registry.counter(
+    "linkedin_upstream_decompressed_bytes_total", "Response bytes after decompression", ("route", "encoding"))
+
+
+class _DeflateDecoder:
+    """Deflate as sent in practice: zlib-wrapped per the RFC, or raw deflate from some servers."""
+
+    def __init__(self):
+        self._decoder = zlib.decompressobj()
+        self._first = True
+
+    def decompress(self, data: bytes) -> bytes:
+        if self._first:
+            self._first = False
+            try:
+                return self._decoder.decompress(data)
+            except zlib.error:
+                self._decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._decoder.decompress(data)
+
+    def flush(self) -> bytes:
+        return self._decoder.flush()
+
+
+class _BrotliDecoder:
+    def __init__(self):
+        self._decoder = brotli.Decompressor()
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decoder.process(data)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def decoder_for(encoding: Optional[str]):
+    """Returns an incremental decoder for a Content-Encoding, or None for identity/unknown encodings."""
+    encoding = (encoding or "").strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        return _DeflateDecoder()
+    if encoding == "br" and brotli is not None:
+        return _BrotliDecoder()
+    if encoding not in ("", "identity"):
+        logger.warning(f"Unsupported Content-Encoding {encoding}; passing body through")
+    return None
+
+
+def read_body(response, route: str) -> Tuple[bytearray, int]:
+    """
+    Reads an http.client response to the end, decompressing chunks as they arrive.
+
+    Decompression overlaps with the transfer instead of waiting for the whole
+    compressed body, and the result is a single bytearray the JSON codec
+    parses directly.
+
+    Returns:
+        (decoded body, bytes received on the wire)
+    """
+    encoding = response.getheader("Content-Encoding")
+    decoder = decoder_for(encoding)
+    body = bytearray()
+    received = 0
+    while True:
+        chunk = response.read(READ_CHUNK)
+        if not chunk:
+            break
+        received += len(chunk)
+        body += decoder.decompress(chunk) if decoder is not None else chunk
+    if decoder is not None:
+        body += decoder.flush()
+        record_transfer(route, encoding, received, len(body))
+    return body, received
+
+
+def record_transfer(route: str, encoding: Optional[str], compressed: int, decompressed: int) -> None:
+    """Counts a compressed response's size before and after decompression."""
+    encoding = (encoding or "identity").strip().lower()
+    if encoding == "identity":
+        return
+    COMPRESSED_BYTES.inc(compressed, route=route, encoding=encoding)
+    DECOMPRESSED_BYTES.inc(decompressed, route=route, encoding=encoding)
@@ -0,0 +1,130 @@
+import http.client
+import logging
+import select
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Tuple
+
+logger = logging.getLogger('linkedin_api_tools.pool')
+
+
+class HTTPSConnectionPool:
+    """
+    Process-wide pool of keep-alive HTTPS connections to a single host.
+
+    Idle connections are reused LIFO so the warmest socket is handed out first.
+    Connections idle for longer than ``idle_timeout`` are evicted, and every
+    connection is health checked before reuse so a socket the server already
+    closed is never handed to a caller.
+
+    Args:
+        host: Upstream host name
+        maxsize: Maximum number of idle connections kept for reuse
+        idle_timeout: Seconds an idle connection may sit in the pool
+        timeout: Socket timeout for new connections, in seconds
+        connection_class: Connection factory (HTTPConnection for plain-HTTP stand-ins)
+    """
+
+    def __init__(self, host: str, maxsize: int = 10, idle_timeout: float = 60.0, timeout: float = 30,
+                 connection_class: type = http.client.HTTPSConnection):
+        self.host = host
+        self.connection_class = connection_class
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._idle: Deque[Tuple[http.client.HTTPSConnection, float]] = deque()
+        self._lock = threading.Lock()
+        self._stats = {"created": 0, "reused": 0, "evicted": 0, "discarded": 0}
+
+    def _new_connection(self) -> http.client.HTTPSConnection:
+        self._stats["created"] += 1
+        return self.connection_class(self.host, timeout=self.timeout)
+
+    @staticmethod
+    def _is_healthy(conn: http.client.HTTPSConnection) -> bool:
+        """An idle keep-alive socket must not be readable; readable means EOF or stray data."""
+        sock = conn.sock
+        if sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def get(self) -> http.client.HTTPSConnection:
+        """Returns a healthy idle connection, or a new one if none is available."""
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                conn, idle_since = self._idle.pop()
+                if now - idle_since > self.idle_timeout:
+                    self._stats["evicted"] += 1
+                    conn.close()
+                    continue
+                if not self._is_healthy(conn):
+                    self._stats["discarded"] += 1
+                    conn.close()
+                    continue
+                self._stats["reused"] += 1
+                return conn
+            return self._new_connection()
+
+    def put(self, conn: http.client.HTTPSConnection) -> None:
+        """Returns a connection to the pool once its response has been fully read."""
+        with self._lock:
+            if len(self._idle) < self.maxsize and conn.sock is not None:
+                self._idle.append((conn, time.monotonic()))
+                return
+            self._stats["discarded"] += 1
+        conn.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[http.client.HTTPSConnection]:
+        """
+        Borrows a connection for one request/response exchange.
+
+        The caller must read the response body completely inside the block.
+        Connections that raised, or whose response asked to close, are dropped.
+        """
+        conn = self.get()
+        try:
+            yield conn
+        except BaseException:
+            conn.close()
+            raise
+        else:
+            response = getattr(conn, "_HTTPConnection__response", None)
+            if response is not None and not response.isclosed():
+                # Body was not drained; the socket cannot carry another request
+                conn.close()
+            self.put(conn)
+
+    def evict_idle(self) -> int:
+        """Closes idle connections that exceeded the idle timeout; returns how many were closed."""
+        now = time.monotonic()
+        closed = 0
+        with self._lock:
+            kept: Deque[Tuple[http.client.HTTPSConnection, float]] = deque()
+            for conn, idle_since in self._idle:
+                if now - idle_since > self.idle_timeout:
+                    conn.close()
+                    closed += 1
+                else:
+                    kept.append((conn, idle_since))
+            self._idle = kept
+            self._stats["evicted"] += closed
+        return closed
+
+    def close(self) -> None:
+        """Closes every idle connection."""
+        with self._lock:
+            while self._idle:
+                conn, _ = self._idle.pop()
+                conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, idle=len(self._idle))
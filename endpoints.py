@@ -0,0 +1,762 @@
+import inspect
+from urllib.parse import quote
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from bulk import PROFILES_PER_CALL, COMPANIES_PER_CALL, COMPANY_POSTS_PER_CALL
+import json_codec
+from links import canonical_link
+
+REQUIRED = inspect.Parameter.empty
+
+# Arguments holding LinkedIn links or URNs; unless a Param says otherwise these are canonicalized
+LINK_ARGUMENTS = frozenset({"link", "links", "company_url", "profile_url", "profileUrl", "schoolUrl",
+                            "reactions_urn", "comments_urn", "reposts_urn", "repostsUrn"})
+
+
+def with_query(route: str, params: Dict[str, Any]) -> str:
+    """Appends query parameters to a route, percent-encoding the values; the route is returned as is without any."""
+    if not params:
+        return route
+    return route + "?" + "&".join(f"{key}={quote(str(value), safe='')}" for key, value in params.items())
+
+
+class Param:
+    """
+    One tool argument and the upstream parameter it is sent as.
+
+    Args:
+        name: Argument name of the tool
+        annotation: Type of the argument, as FastMCP should see it
+        default: Default value; REQUIRED for a required argument
+        upstream: Name sent upstream, when it differs from the argument name
+        omit_empty: Leave the parameter out while it is empty (None, "", 0 or False);
+            the default is to do so for arguments defaulting to None
+        link: Rewrite the value (or each value of a list) with links.canonical_link;
+            the default is to do so for the names in LINK_ARGUMENTS
+    """
+
+    def __init__(self, name: str, annotation: Any = str, default: Any = REQUIRED, upstream: Optional[str] = None,
+                 omit_empty: Optional[bool] = None, link: Optional[bool] = None):
+        self.name = name
+        self.annotation = annotation
+        self.default = default
+        self.upstream = upstream or name
+        self.omit_empty = default is None if omit_empty is None else omit_empty
+        self.link = name in LINK_ARGUMENTS if link is None else link
+
+
+class Batch:
+    """
+    Splits a link list argument into upstream-sized calls (see bulk.fan_out).
+
+    Args:
+        param: Name of the list argument
+        size: Most links per upstream call
+        per_link: Whether items map back to links one to one
+    """
+
+    def __init__(self, param: str, size: int, per_link: bool = True):
+        self.param = param
+        self.size = size
+        self.per_link = per_link
+
+
+class Endpoint:
+    """
+    Declarative description of one upstream endpoint and the MCP tool exposing it.
+
+    GET endpoints send their parameters URL-encoded in the query string, POST
+    endpoints as a JSON body.
+
+    Args:
+        tool: Tool name
+        method: HTTP method
+        route: Upstream route
+        params: Tool arguments, in signature order
+        doc: Tool description
+        batch: Link list fanned out over several calls, if any
+        fields: Whether the tool takes a fields projection (see projection.compile_fields)
+    """
+
+    def __init__(self, tool: str, method: str, route: str, params: List[Param], doc: str = "",
+                 batch: Optional[Batch] = None, fields: bool = False):
+        self.tool = tool
+        self.method = method
+        self.route = route
+        self.params = params
+        self.doc = inspect.cleandoc(doc)
+        self.batch = batch
+        self.fields = fields
+        # Precomputed so a call only walks (argument, upstream name, omit_empty) tuples
+        self._sent = tuple((param.name, param.upstream, param.omit_empty) for param in params)
+        self._links = tuple(param.name for param in params if param.link)
+        arguments = [inspect.Parameter(param.name, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                       default=param.default, annotation=param.annotation) for param in params]
+        if fields:
+            arguments.append(inspect.Parameter("fields", inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                               default=None, annotation=Optional[List[str]]))
+        self.signature = inspect.Signature(arguments, return_annotation=Dict)
+        self._names = tuple(self.signature.parameters)
+        self._name_set = frozenset(self._names)
+        self._defaults = {name: parameter.default for name, parameter in self.signature.parameters.items()
+                          if parameter.default is not REQUIRED}
+
+    def upstream_params(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Maps tool arguments to upstream parameter names, leaving out empty optional ones."""
+        return {upstream: arguments[name] for name, upstream, omit_empty in self._sent
+                if not (omit_empty and not arguments[name])}
+
+    def canonical(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Rewrites link arguments in place to their canonical spelling, so equal entities share cache keys."""
+        for name in self._links:
+            value = arguments[name]
+            if isinstance(value, str):
+                arguments[name] = canonical_link(value)
+            elif isinstance(value, list):
+                arguments[name] = [canonical_link(item) if isinstance(item, str) else item for item in value]
+        return arguments
+
+    def request(self, arguments: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """Returns the (endpoint with query string, JSON payload) to send for these tool arguments."""
+        params = self.upstream_params(arguments)
+        if self.method == "GET":
+            return with_query(self.route, params), None
+        return self.route, json_codec.dumps(params)
+
+    def bind(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resolves a call's arguments against the signature, filling in defaults.
+
+        Raises:
+            TypeError: On too many, unknown or missing arguments, as for a plain function
+        """
+        if len(args) > len(self._names):
+            raise TypeError(f"{self.tool}() takes {len(self._names)} arguments but {len(args)} were given")
+        unknown = kwargs.keys() - self._name_set
+        if unknown:
+            raise TypeError(f"{self.tool}() got unexpected arguments: {', '.join(sorted(unknown))}")
+        arguments = dict(self._defaults)
+        arguments.update(zip(self._names, args))
+        for name in self._names[:len(args)]:
+            if name in kwargs:
+                raise TypeError(f"{self.tool}() got multiple values for argument '{name}'")
+        arguments.update(kwargs)
+        # Every key is a parameter by now, so a short count means a required argument is missing
+        if len(arguments) != len(self._names):
+            missing = [name for name in self._names if name not in arguments]
+            raise TypeError(f"{self.tool}() missing required arguments: {', '.join(missing)}")
+        return arguments
+
+
+def build_tool(endpoint: Endpoint,
+               dispatch: Callable[[Endpoint, Dict[str, Any]], Awaitable[Dict]]) -> Callable[..., Awaitable[Dict]]:
+    """
+    Generates the tool function for an endpoint.
+
+    The function carries the endpoint's name, description and signature, so
+    FastMCP derives the same argument schema as for a hand-written tool, and
+    hands its arguments, links canonicalized, to ``dispatch``.
+    """
+    async def tool(*args: Any, **kwargs: Any) -> Dict:
+        return await dispatch(endpoint, endpoint.canonical(endpoint.bind(args, kwargs)))
+
+    tool.__name__ = tool.__qualname__ = endpoint.tool
+    tool.__doc__ = endpoint.doc
+    tool.__signature__ = endpoint.signature
+    tool.__annotations__ = {**{param.name: param.annotation for param in endpoint.params}, "return": Dict}
+    if endpoint.fields:
+        tool.__annotations__["fields"] = Optional[List[str]]
+    return tool
+
+
+# Every endpoint served by a generated tool, following api_doc.jsonl. Endpoints
+# needing more than one request per call (person batching, auto-pagination,
+# engagement harvesting) keep hand-written tools in linkedin_api_tools.
+ENDPOINTS: List[Endpoint] = [
+    Endpoint(
+        "profiles", "POST", "/profiles",
+        [Param("links", List[str])],
+        batch=Batch("links", PROFILES_PER_CALL), fields=True,
+        doc="""
+        Scrapes profiles data for any number of links
+
+        Links are deduplicated and sent upstream 100 at a time, concurrently. Lists
+        longer than 100 return the merged items in input order under "data" and
+        the links that could not be fetched under "errors".
+
+        Pass fields (e.g. ["full_name", "headline", "experiences[].company"]) to
+        return only those paths of each profile.
+
+        Request Body Example:
+        {
+            "links": [
+                "http://www.linkedin.com/in/luke-sharp-b3838719a",
+                "http://www.linkedin.com/in/hollie-smith-96ab44b5"
+            ]
+        }
+        """),
+    Endpoint(
+        "companies", "POST", "/companies",
+        [Param("links", List[str])],
+        batch=Batch("links", COMPANIES_PER_CALL),
+        doc="""
+        Scrapes companies data for any number of links
+
+        Links are deduplicated and sent upstream 100 at a time, concurrently. Lists
+        longer than 100 return the merged items in input order under "data" and
+        the links that could not be fetched under "errors".
+
+        Request Body Example:
+        {
+            "links": [
+                "https://www.linkedin.com/company/huzzle-app/",
+                "http://www.linkedin.com/company/aep-energy"
+            ],
+            "count": 1
+        }
+        """),
+    Endpoint(
+        "company_posts", "POST", "/company_posts",
+        [Param("links", List[str]), Param("count", int, 1)],
+        batch=Batch("links", COMPANY_POSTS_PER_CALL, per_link=False),
+        doc="""
+        Scrapes posts of any number of linkedin companies
+
+        Links are deduplicated and sent upstream 50 companies at a time, concurrently.
+        Lists longer than 50 return all posts under "data" in input order and the
+        companies whose chunk failed under "errors".
+
+        Request Body Example:
+        {
+            "links": [
+                "https://www.linkedin.com/company/huzzle-app/",
+                "http://www.linkedin.com/company/aep-energy"
+            ],
+            "count": 1
+        }
+        """),
+    Endpoint(
+        "person_urn", "POST", "/person_urn",
+        [Param("link")],
+        doc="""
+        Scrapes all data from a person's page using his profile URN
+
+        NOTE: This tool failed during testing (status 400, error: Failed to scrape profile).
+        The API documentation is unclear if this expects a URN string or a full profile link with URN.
+
+        Request Body Example:
+        {
+            "link": "https://www.linkedin.com/in/ACoAACeIPPkBUymOGNvgfbBL_uhKc32Hg_g_haU" 
+        }
+        """),
+    Endpoint(
+        "person_skills", "POST", "/person_skills",
+        [Param("link")],
+        doc="""
+        Scrapes all skills of a linkedin user
+
+        Request Body Example:
+        {
+            "link": "https://www.linkedin.com/in/ingmar-klein"
+        }
+        """),
+    Endpoint(
+        "search_people_with_filters", "POST", "/search_people_with_filters",
+        [Param("keyword"), Param("page", int, 1), Param("title_free_text", str, None),
+         Param("company_free_text", str, None), Param("first_name", str, None), Param("last_name", str, None)],
+        doc="""
+        Search for people from linkedin using all filters as per linkedin
+
+        Request Body Example:
+        {
+            "keyword": "ingmar", 
+            "page": 1, 
+            "title_free_text": "CEO", 
+            "company_free_text": "Huzzle", 
+            "first_name": "Ingmar", 
+            "last_name": "Klein"
+        }
+        """),
+    Endpoint(
+        "company", "POST", "/company",
+        [Param("link")],
+        doc="""
+        Scrapes all data from a provided company url
+
+        Request Body Example:
+        {
+            "link": "https://www.linkedin.com/company/huzzle-app"
+        }
+        """),
+    Endpoint(
+        "company_jobs", "POST", "/company_jobs",
+        [Param("company_url"), Param("starts_from", int, 0), Param("count", int, 10)],
+        doc="""
+        Scrapes jobs of a specific linkedin company
+
+        Request Body Example:
+        {
+            "company_url": "https://www.linkedin.com/company/google",
+            "starts_from": 0,
+            "count": 10
+        }
+        """),
+    Endpoint(
+        "search_company_with_filters", "POST", "/search_company_with_filters",
+        [Param("keyword"), Param("page", int, 1), Param("company_size_list", str, None),
+         Param("hasJobs", bool, False), Param("location_list", str, None), Param("industry_list", str, None)],
+        doc="""
+        Search for companies as per linkedin search engine
+
+        Request Body Example:
+        {
+            "keyword": "G", 
+            "page": 1, 
+            "company_size_list": "A,D", 
+            "hasJobs": false, 
+            "location_list": "", 
+            "industry_list": ""
+        }
+        """),
+    Endpoint(
+        "post", "POST", "/post",
+        [Param("link")],
+        doc="""
+        Scrapes post data by a person/company using its linkedin url
+
+        Request Body Example:
+        {
+            "link": "https://www.linkedin.com/feed/update/urn:li:activity:7219434359085252608"
+        }
+        """),
+    Endpoint(
+        "search_posts", "POST", "/search_posts",
+        [Param("query"), Param("page", int, 1), Param("filters", List[Dict], None)],
+        doc="""
+        Search posts as per linkedin.com search engine (with filters)
+
+        Request Body Example:
+        {
+            "page": 1,
+            "query": "Top 10",
+            "filters": [
+                {
+                    "key": "datePosted",
+                    "values": "past-week"
+                }
+            ]
+        }
+        """),
+    Endpoint(
+        "company_employee_count_per_skill", "POST", "/company_employee_count_per_skill",
+        [Param("keyword"), Param("company_url", upstream="companyUrl")],
+        doc="""
+        Get employee count with specific skill at a company
+
+        NOTE: API doc example uses camelCase 'companyUrl' in the request body.
+
+        Request Body Example:
+        {
+            "keyword": "java",
+            "companyUrl": "https://www.linkedin.com/company/google"
+        }
+        """),
+    Endpoint(
+        "school_alumini_count_per_skill", "POST", "/school_alumini_count_per_skill",
+        [Param("keyword"), Param("schoolUrl"), Param("skillExplicits", str, None)],
+        doc="""
+        Returns alumni count of a school/university
+        NOTE: API doc example uses camelCase 'schoolUrl' in the request body.
+        NOTE: This tool failed during testing with 400 Bad Request.
+
+        Request Body Example:
+        {
+            "keyword": "",
+            "schoolUrl": "https://www.linkedin.com/school/abertay-university",
+            "skillExplicits": "260"
+        }
+        """),
+    Endpoint(
+        "company_employee", "GET", "/company_employee",
+        [Param("company_id", upstream="companyId"), Param("page", int, 1)],
+        doc="""
+        Scrapes 12 people from a company (People Tab)
+
+        NOTE: API doc specifies company_id and page as required GET parameters.
+        NOTE: This tool failed persistently during testing (status 400, error: Couldn't recognize the parameter keys provided), unable to recognize parameters even when matching doc.
+
+        Get Request Parameters:
+        - company_id: LinkedIn company ID (paramType: STRING, required) (e.g., "1441" for Google)
+        - page: Page number (paramType: NUMBER, required) (e.g., 1)
+        """),
+    Endpoint(
+        "post_reactions", "GET", "/post_reactions",
+        [Param("reactions_urn"), Param("pagination_token", str, None)],
+        doc="""
+        Data of the people who reacted to a particular post
+
+        NOTE: Obtain 'reactionsUrn' from 'Company Updates' or 'Profile Updates' endpoints.
+
+        Get Request Parameters:
+        - reactionsUrn: URN for the post reactions (paramType: STRING, required) (e.g., "urn:li:activity:7219434359085252608/reactions")
+        - paginationToken: For pagination (paramType: STRING, optional)
+        """),
+    Endpoint(
+        "post_comments", "GET", "/post_comments",
+        [Param("comments_urn"), Param("pagination_token", str, None)],
+        doc="""
+        Scrapes all commenters data who commented below a post
+
+        NOTE: Obtain 'commentsUrn' from 'Company Updates' or 'Profile Updates' endpoints.
+
+        Get Request Parameters:
+        - commentsUrn: URN for the post comments (paramType: STRING, required) (e.g., "urn:li:activity:7219434359085252608/comments")
+        - paginationToken: For pagination (paramType: STRING, optional)
+        """),
+    Endpoint(
+        "post_reposts", "GET", "/post_reposts",
+        [Param("reposts_urn"), Param("pagination_token", str, None)],
+        doc="""
+        Scrapes all Reposters data who reposted a post
+
+        NOTE: Obtain 'repostsUrn' from 'Company Updates' or 'Profile Updates' endpoints.
+
+        Get Request Parameters:
+        - repostsUrn: URN for the post reposts (paramType: STRING, required) (e.g., "urn:li:activity:7219434359085252608/reposts")
+        - paginationToken: For pagination (paramType: STRING, optional)
+        """),
+    Endpoint(
+        "search_posts_with_filters", "GET", "/search_posts_with_filters",
+        [Param("query", str, None), Param("sort_by", str, None), Param("from_member", str, None),
+         Param("from_organization", str, None), Param("author_job_title", str, None),
+         Param("author_company", str, None), Param("content_type", str, None),
+         Param("mentions_organization", str, None), Param("author_industry", str, None),
+         Param("mentions_member", str, None), Param("page", str, "1", omit_empty=True)],
+        doc="""
+        Search for posts as per linkedin using all the available filters
+
+        NOTE: API doc shows this endpoint uses different parameter names than previously implemented.
+
+        Get Request Parameters:
+        - query: Search term (paramType: STRING, optional) (e.g., "Top 10")
+        - sort_by: Sorting option (paramType: STRING, optional)
+        - from_member: Filter by member (paramType: STRING, optional)
+        - from_organization: Filter by organization (paramType: STRING, optional)
+        - author_job_title: Filter by author's job title (paramType: STRING, optional)
+        - author_company: Filter by author's company (paramType: STRING, optional)
+        - content_type: Filter by content type (paramType: STRING, optional)
+        - mentions_organization: Filter by mentioned organization (paramType: STRING, optional)
+        - author_industry: Filter by author's industry (paramType: STRING, optional)
+        - mentions_member: Filter by mentioned member (paramType: STRING, optional)
+        - page: Page number (paramType: STRING, optional) (e.g., "1")
+        """),
+    Endpoint(
+        "search_jobs", "GET", "/search_jobs",
+        [Param("query"), Param("page", str, "1"), Param("searchLocationId", str, None),
+         Param("experience", str, None), Param("postedAgo", str, None), Param("locationIdsList", str, None),
+         Param("sortBy", str, None), Param("titleIdsList", str, None), Param("workplaceType", str, None),
+         Param("functionIdsList", str, None), Param("industryIdsList", str, None), Param("jobType", str, None),
+         Param("companyIdsList", str, None), Param("easyApply", str, None)],
+        doc="""
+        Search for jobs with filters as per linkedin
+
+        NOTE: API doc shows this endpoint uses different parameter names than previously implemented.
+
+        Get Request Parameters:
+        - query: Job search keywords (paramType: STRING, required) (e.g., "software engineer")
+        - page: Page number (paramType: STRING, required) (e.g., "1")
+        - searchLocationId: Location ID (paramType: STRING, optional) (e.g., "Europe")
+        - experience: Experience level (paramType: STRING, optional)
+        - postedAgo: Filter by post date (paramType: STRING, optional)
+        - locationIdsList: List of location IDs (paramType: STRING, optional)
+        - sortBy: Sort results by (paramType: STRING, optional)
+        - titleIdsList: List of job title IDs (paramType: STRING, optional)
+        - workplaceType: Type of workplace (paramType: STRING, optional)
+        - functionIdsList: List of function IDs (paramType: STRING, optional)
+        - industryIdsList: List of industry IDs (paramType: STRING, optional)
+        - jobType: Type of job (paramType: STRING, optional)
+        - companyIdsList: List of company IDs (paramType: STRING, optional)
+        - easyApply: Filter for easy apply jobs (paramType: STRING, optional)
+        """),
+    Endpoint(
+        "job_details", "GET", "/job_details",
+        [Param("job_id", upstream="jobId")],
+        doc="""
+        Get detailed information about a specific job
+
+        Get Request Parameters:
+        - jobId: LinkedIn job ID (paramType: STRING, required) (e.g., "3862806121" - obtain from search results)
+        """),
+    Endpoint(
+        "similar_profiles", "GET", "/similar_profiles",
+        [Param("profileUrl")],
+        doc="""
+        Returns similar profiles to a given linkedin profile url
+
+        Get Request Parameters:
+        - profileUrl: LinkedIn profile URL (paramType: STRING, required) (e.g., "https://www.linkedin.com/in/williamhgates/")
+        """),
+    Endpoint(
+        "suggestion_location", "GET", "/suggestion_location",
+        [Param("query")],
+        doc="""
+        Suggestions per query
+
+        Get Request Parameters:
+        - query: Search query (paramType: STRING, required) (e.g., "California")
+        """),
+    Endpoint(
+        "suggestion_company", "GET", "/suggestion_company",
+        [Param("query")],
+        doc="""
+        Suggestions per query
+
+        Get Request Parameters:
+        - query: Search query (paramType: STRING, required) (e.g., "Google")
+        """),
+    Endpoint(
+        "suggestion_school", "GET", "/suggestion_school",
+        [Param("query")],
+        doc="""
+        Suggestions per query
+
+        Get Request Parameters:
+        - query: Search query (paramType: STRING, required) (e.g., "Stanford")
+        """),
+    Endpoint(
+        "suggestion_industry", "GET", "/suggestion_industry",
+        [Param("query")],
+        doc="""
+        Suggestions per query
+
+        Get Request Parameters:
+        - query: Search query (paramType: STRING, required) (e.g., "Technology")
+        """),
+    Endpoint(
+        "suggestion_service_catagory", "GET", "/suggestion_service_catagory",
+        [Param("query")],
+        doc="""
+        Suggestions as per query
+
+        Get Request Parameters:
+        - query: Search query (paramType: STRING, required) (e.g., "Consulting")
+        """),
+    Endpoint(
+        "suggestion_person", "GET", "/suggestion_person",
+        [Param("query")],
+        doc="""
+        Returns a list of people suggestion from linkedin.
+
+        Get Request Parameters:
+        - query: Search query (paramType: STRING, required) (e.g., "Bill Gates")
+        """),
+    Endpoint(
+        "search_geourns", "GET", "/search_geourns",
+        [Param("keyword")],
+        doc="""
+        Suggestions per query
+
+        NOTE: Failed during testing when keyword contained spaces (e.g., "New York"). Needs URL encoding or API fix.
+
+        Get Request Parameters:
+        - keyword: Search keyword (paramType: STRING, required) (e.g., "California", avoid spaces)
+        """),
+    Endpoint(
+        "suggestion_function", "GET", "/suggestion_function",
+        [Param("query", str, None)],
+        doc="""
+        Gets suggestions for Job Function
+
+        Get Request Parameters:
+        - query: Search query (paramType: STRING, optional) (e.g., "Engineering")
+        """),
+    Endpoint(
+        "suggestion_company_size", "GET", "/suggestion_company_size",
+        [],
+        doc="""
+        Suggestions for company size filter
+    
+        """),
+    Endpoint(
+        "suggestion_language", "GET", "/suggestion_language",
+        [],
+        doc="""
+        Suggestions for language filter
+    
+        """),
+    Endpoint(
+        "profiles_david", "POST", "/profiles_david",
+        [Param("links", List[str])],
+        batch=Batch("links", PROFILES_PER_CALL),
+        doc="""
+        Scrape profiles for any number of links, 100 per API call
+
+        NOTE: Marked as private/premium in documentation.
+
+        Links are deduplicated and sent upstream 100 at a time, concurrently. Lists
+        longer than 100 return the merged items in input order under "data" and
+        the links that could not be fetched under "errors".
+
+        Request Body Example:
+        {
+            "links": [
+                "http://www.linkedin.com/in/luke-sharp-b3838719a",
+                "http://www.linkedin.com/in/hollie-smith-96ab44b5"
+            ]
+        }
+        """),
+    Endpoint(
+        "private_chtiouisk", "POST", "/private_chtiouisk",
+        [Param("links", List[str]), Param("count", int, 5)],
+        doc="""
+        This is a private endpoint for our premium user
+
+        NOTE: Marked as private/premium in documentation.
+
+        Request Body Example:
+        {
+            "links": [
+                "http://www.linkedin.com/in/luke-sharp-b3838719a",
+                "http://www.linkedin.com/in/rodneydbainjr"
+            ],
+            "count": 5
+        }
+        """),
+    Endpoint(
+        "person_data_with_open_to_work_flag", "POST", "/person_data_with_open_to_work_flag",
+        [Param("link")],
+        doc="""
+        Scrapes person data with open to work flag
+
+        Request Body Example:
+        {
+            "link": "https://www.linkedin.com/in/ingmar-klein"
+        }
+        """),
+    Endpoint(
+        "original_search_posts_with_filters", "GET", "/original_search_posts_with_filters",
+        [Param("query", str, None), Param("author_company", str, None),
+         Param("author_job_title", str, None), Param("author_industry", str, None),
+         Param("from_member", str, None), Param("from_organization", str, None),
+         Param("mentions_member", str, None), Param("mentions_organization", str, None),
+         Param("content_type", str, None), Param("sort_by", str, None), Param("page", str, None)],
+        doc="""
+        Search for posts as per linkedin using all the available filters
+
+        NOTE: Marked as private/premium in documentation.
+
+        Get Request Parameters:
+        - query: Search query (paramType: STRING, optional)
+        - author_company: Filter by author's company (paramType: STRING, optional)
+        - author_job_title: Filter by author's job title (paramType: STRING, optional)
+        - author_industry: Filter by author's industry (paramType: STRING, optional)
+        - from_member: Filter by member (paramType: STRING, optional)
+        - from_organization: Filter by organization (paramType: STRING, optional)
+        - mentions_member: Filter by mentioned member (paramType: STRING, optional)
+        - mentions_organization: Filter by mentioned organization (paramType: STRING, optional)
+        - content_type: Filter by content type (paramType: STRING, optional)
+        - sort_by: Sort results by (paramType: STRING, optional)
+        - page: Page number (paramType: STRING, optional)
+        """),
+    Endpoint(
+        "private_company_insights_2", "GET", "/private_company_insights_2",
+        [Param("link")],
+        doc="""
+        Private endpoint to scrapes company insights
+
+        NOTE: Marked as private/premium in documentation.
+
+        Get Request Parameters:
+        - link: Company LinkedIn URL (paramType: STRING, required)
+        """),
+    Endpoint(
+        "post_reposts_original", "GET", "/post_reposts_original",
+        [Param("repostsUrn"), Param("page")],
+        doc="""
+        Private
+
+        NOTE: Marked as private/premium in documentation.
+
+        Get Request Parameters:
+        - repostsUrn: URN for the post reposts (paramType: STRING, required)
+        - page: Page number (paramType: STRING, required)
+        """),
+    Endpoint(
+        "profile_updates_original", "GET", "/profile_updates_original",
+        [Param("profile_url"), Param("page")],
+        doc="""
+        Private
+
+        NOTE: Marked as private/premium in documentation.
+
+        Get Request Parameters:
+        - profile_url: LinkedIn profile URL (paramType: STRING, required)
+        - page: Page number (paramType: STRING, required)
+        """),
+    Endpoint(
+        "company_updates_original", "GET", "/company_updates_original",
+        [Param("company_url"), Param("page", int)],
+        doc="""
+        Original data
+
+        NOTE: Marked as private/premium in documentation.
+
+        Get Request Parameters:
+        - company_url: LinkedIn company URL (paramType: STRING, required)
+        - page: Page number (paramType: STRING, required)
+        """),
+    Endpoint(
+        "profile_posts_all", "POST", "/profile_posts_all",
+        [Param("link")],
+        fields=True,
+        doc="""
+        This endpoint scrapes all posts posted by a user at linkedin.com since joined.
+
+        NOTE: Marked as private/premium in documentation.
+
+        Pass fields (e.g. ["data[].text", "data[].postedAt"]) to return only those
+        paths of the response.
+
+        Request Body Example:
+        {
+            "link": "https://www.linkedin.com/in/ingmar-klein"
+        }
+        """),
+    Endpoint(
+        "person_data_with_experiences", "POST", "/person_data_with_experiences",
+        [Param("link")],
+        fields=True,
+        doc="""
+        Scrapes all linkedin profile data alongwith all the experiences.
+
+        Pass fields (e.g. ["data.full_name", "data.experiences[].company"]) to
+        return only those paths of the response body.
+
+        Request Body Example:
+        {
+            "link": "https://www.linkedin.com/in/ingmar-klein"
+        }
+        """),
+    Endpoint(
+        "person_data_with_languages", "POST", "/person_data_with_languages",
+        [Param("link")],
+        doc="""
+        Scrapers person data with all languages data
+
+        Request Body Example:
+        {
+            "link": "https://www.linkedin.com/in/matiss-brunavs/"
+        }
+        """),
+    Endpoint(
+        "person_data_with_educations", "POST", "/person_data_with_educations",
+        [Param("link")],
+        doc="""
+        Scrapers person data along with all the educations data.
+
+        Request Body Example:
+        {
+            "link": "https://www.linkedin.com/in/ingmar-klein"
+        }
+        """),
+]
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from pagination import FeedPaginator
+
+logger = logging.getLogger('linkedin_api_tools.engagement')
+
+ENGAGEMENT_TYPES = ("reactions", "comments", "reposts")
+
+_ACTIVITY_URN = re.compile(r"urn:li:(activity|ugcPost|share):(\d+)")
+_ACTIVITY_SLUG = re.compile(r"activity[-:](\d{10,})")
+
+# Nested objects an engagement item may keep the person in
+_PERSON_CONTAINERS = ("actor", "reactor", "author", "commenter", "reposter", "user", "profile", "person")
+
+# Fields identifying a person, most specific first
+_ID_FIELDS = ("urn", "profile_urn", "profileUrn", "entityUrn", "public_identifier", "publicIdentifier",
+              "profile_url", "profileUrl", "linkedin_url", "linkedinUrl", "url", "link", "username")
+
+_NAME_FIELDS = ("name", "fullName", "full_name", "fullname")
+_HEADLINE_FIELDS = ("headline", "occupation", "title", "description")
+_URL_FIELDS = ("profile_url", "profileUrl", "linkedin_url", "linkedinUrl", "url", "link")
+
+
+def activity_urn(post: str) -> str:
+    """Extracts the activity URN from a post URN, feed link or post link."""
+    post = post.strip()
+    match = _ACTIVITY_URN.search(post)
+    if match:
+        return f"urn:li:{match.group(1)}:{match.group(2)}"
+    match = _ACTIVITY_SLUG.search(post)
+    if match:
+        return f"urn:li:activity:{match.group(1)}"
+    raise ValueError(f"Could not find a post URN in: {post}")
+
+
+def _person_source(item: Dict[str, Any]) -> Dict[str, Any]:
+    for container in _PERSON_CONTAINERS:
+        value = item.get(container)
+        if isinstance(value, dict):
+            return value
+    return item
+
+
+def _first(source: Dict[str, Any], fields: tuple) -> Optional[str]:
+    for field in fields:
+        value = source.get(field)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def compact_engager(item: Any) -> Optional[Dict[str, Any]]:
+    """Reduces an engagement item to {"id", "name", "headline", "profile_url"}, or None if it names no one."""
+    if not isinstance(item, dict):
+        return None
+    source = _person_source(item)
+    identity = _first(source, _ID_FIELDS)
+    if identity is None:
+        return None
+    name = _first(source, _NAME_FIELDS)
+    if name is None:
+        parts = [source.get(field) for field in ("firstName", "first_name", "lastName", "last_name")]
+        name = " ".join(part for part in parts if isinstance(part, str) and part) or None
+    return {
+        "id": identity.rstrip("/").lower(),
+        "name": name,
+        "headline": _first(source, _HEADLINE_FIELDS),
+        "profile_url": _first(source, _URL_FIELDS)
+    }
+
+
+def _reaction_type(item: Dict[str, Any]) -> Optional[str]:
+    for field in ("reactionType", "reaction_type", "type", "reaction"):
+        value = item.get(field)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+async def harvest_engagement(streams: Dict[str, Callable[[int, Optional[str]], Awaitable[Dict[str, Any]]]],
+                             max_per_type: int = 1000, max_pages: int = 50,
+                             on_progress: Optional[Callable[[int], Awaitable[None]]] = None) -> Dict[str, Any]:
+    """
+    Walks several engagement feeds of one post in parallel and merges their people.
+
+    Every stream is paginated to the end (or ``max_per_type`` items) concurrently
+    with the others. People are deduplicated across streams; each engager lists
+    what they did, e.g. ["reaction:LIKE", "comment"].
+
+    Args:
+        streams: Page fetcher per engagement type
+        max_per_type: Maximum items to read from each stream
+        max_pages: Maximum upstream calls per stream
+        on_progress: Coroutine called with the total item count after every page
+
+    Returns:
+        {"success", "status", "engagers", "counts", "streams"}
+    """
+    collected = {"count": 0}
+
+    async def walk(kind: str, fetch_page: Callable[[int, Optional[str]], Awaitable[Dict[str, Any]]]):
+        paginator = FeedPaginator(fetch_page, max_items=max_per_type, max_pages=max_pages)
+        items: List[Any] = []
+        async for page in paginator.pages_iter():
+            items.extend(page)
+            collected["count"] += len(page)
+            if on_progress is not None:
+                await on_progress(collected["count"])
+        return kind, paginator, items
+
+    results = await asyncio.gather(*(walk(kind, fetch) for kind, fetch in streams.items()))
+
+    engagers: Dict[str, Dict[str, Any]] = {}
+    counts: Dict[str, int] = {}
+    stream_info: Dict[str, Any] = {}
+    for kind, paginator, items in results:
+        counts[kind] = len(items)
+        stream_info[kind] = {"pages": paginator.pages, "stop_reason": paginator.stop_reason}
+        if paginator.error is not None:
+            stream_info[kind]["error"] = paginator.error.get("message", paginator.error.get("error"))
+        label = kind.rstrip("s")
+        for item in items:
+            engager = compact_engager(item)
+            if engager is None:
+                continue
+            entry = engagers.setdefault(engager["id"], dict(engager, engagements=[]))
+            for field in ("name", "headline", "profile_url"):
+                if entry[field] is None:
+                    entry[field] = engager[field]
+            reaction = _reaction_type(item) if kind == "reactions" else None
+            entry["engagements"].append(f"{label}:{reaction}" if reaction else label)
+
+    succeeded = [kind for kind, paginator, _ in results if paginator.error is None or counts[kind]]
+    return {
+        "success": bool(succeeded),
+        "status": 200 if succeeded else 500,
+        "engagers": list(engagers.values()),
+        "counts": dict(counts, unique_people=len(engagers)),
+        "streams": stream_info
+    }
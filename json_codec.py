@@ -0,0 +1,95 @@
+import json
+import logging
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger('linkedin_api_tools.codec')
+
+JSONInput = Union[bytes, bytearray, memoryview, str]
+
+# Raised by every codec's loads, invalid UTF-8 included; orjson.JSONDecodeError subclasses it
+DecodeError = json.JSONDecodeError
+
+
+class JsonCodec:
+    """Standard library codec; parses bytes directly, letting json detect the encoding."""
+
+    name = "json"
+
+    def loads(self, data: JSONInput) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        try:
+            return json.loads(data)
+        except UnicodeDecodeError as e:
+            raise DecodeError(f"Invalid {e.encoding} ({e.reason})", "", e.start) from e
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str)
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return self.dumps(obj).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson codec: parses bytes without an intermediate str and serializes straight to UTF-8."""
+
+    name = "orjson"
+
+    def loads(self, data: JSONInput) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects a few documents the stdlib accepts (integers beyond 64 bits, NaN)
+            return super().loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def select_codec(name: str = "auto") -> JsonCodec:
+    """
+    Returns the codec called ``name``: "json", "orjson", or "auto" for orjson when installed.
+
+    Raises:
+        ValueError: If the codec is unknown or not installed
+    """
+    if name == "auto":
+        name = "orjson" if orjson is not None else "json"
+    if name == "json":
+        return JsonCodec()
+    if name == "orjson":
+        if orjson is None:
+            raise ValueError("orjson codec requested but orjson is not installed")
+        return OrjsonCodec()
+    raise ValueError(f"Unknown JSON codec: {name}")
+
+
+codec = select_codec()
+
+
+def configure(name: str) -> JsonCodec:
+    """Switches the process-wide codec used by loads()/dumps()."""
+    global codec
+    codec = select_codec(name)
+    logger.info(f"JSON codec: {codec.name}")
+    return codec
+
+
+def loads(data: JSONInput) -> Any:
+    return codec.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    return codec.dumps(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    return codec.dumps_bytes(obj)
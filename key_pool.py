@@ -0,0 +1,193 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import metrics
+from rate_limiter import parse_quota_headers
+from retry_policy import parse_retry_after
+
+logger = logging.getLogger('linkedin_api_tools.keys')
+
+KEY_REQUESTS = metrics.registry.counter(
+    "linkedin_api_key_requests_total", "Upstream attempts per API key by outcome", ("key", "outcome"))
+KEY_IN_FLIGHT = metrics.registry.gauge(
+    "linkedin_api_key_in_flight", "Upstream attempts currently running per API key", ("key",))
+
+
+def parse_keys(spec: str, default_user: str = "") -> List[Tuple[str, str]]:
+    """Parses "key1,key2:user2" into [(key1, default_user), (key2, user2)]; blanks are skipped."""
+    keys = []
+    for entry in spec.split(","):
+        key, _, user = entry.strip().partition(":")
+        if key:
+            keys.append((key, user or default_user))
+    return keys
+
+
+class ApiKey:
+    """One RapidAPI credential with its load, quota, cooldown and usage counters."""
+
+    def __init__(self, key: str, user: str = "", index: int = 1):
+        self.key = key
+        self.user = user
+        # Never the key itself: metrics labels and /api-keys show this, unique by the key's place in the pool
+        if len(key) > 16:
+            self.label = f"key{index}...{key[-4:]}"
+        else:
+            self.label = f"key{index}" if key else "default"
+        self.in_flight = 0
+        self.remaining: Optional[float] = None
+        self.remaining_until = 0.0
+        self.cooldown_until = 0.0
+        self.throttled_in_row = 0
+        self.last_used = 0.0
+        self.stats = {"requests": 0, "ok": 0, "client_error": 0, "server_error": 0, "throttled": 0,
+                      "transport_error": 0, "exhausted": 0}
+
+    def headers(self, base: Mapping[str, str]) -> Dict[str, str]:
+        """base with this key's credentials in place of whatever it carried."""
+        headers = {name: value for name, value in base.items()
+                   if name.lower() not in ("x-rapidapi-key", "x-rapidapi-user")}
+        headers["x-rapidapi-key"] = self.key
+        if self.user:
+            headers["x-rapidapi-user"] = self.user
+        return headers
+
+    def quota(self, now: float) -> float:
+        """Remaining quota as last reported, infinite when unknown or its window has reset."""
+        if self.remaining is None or now >= self.remaining_until:
+            return float("inf")
+        return self.remaining
+
+
+class KeyPool:
+    """
+    Routes upstream requests over several API keys.
+
+    Each attempt takes the key with the fewest requests in flight, ties going
+    to the most remaining quota (from the x-ratelimit-* headers) and then to
+    the least recently used key, so load spreads evenly and the key closest to
+    its limit gets it last.
+
+    A key answering 429 rests for its Retry-After, or else ``cooldown``
+    seconds doubling with every 429 in a row up to ``max_cooldown``. A key
+    with an exhausted quota rests until the quota resets. While every key
+    rests, the one back soonest is handed out; the rate limiter then holds the
+    request until it is usable.
+
+    Args:
+        keys: (key, user) pairs
+        cooldown: Seconds a throttled key rests when the upstream gives no Retry-After
+        max_cooldown: Longest rest after repeated 429s
+    """
+
+    def __init__(self, keys: List[Tuple[str, str]], cooldown: float = 30, max_cooldown: float = 300):
+        self.keys = [ApiKey(key, user, index) for index, (key, user) in enumerate(keys, 1)] or [ApiKey("")]
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self._by_key = {api_key.key: api_key for api_key in self.keys}
+        self._lock = threading.Lock()
+
+    def owns(self, key: str) -> bool:
+        """
+        Whether requests sent with this key may be routed over the pool.
+
+        No key at all counts as the pool's too: with only LINKEDIN_API_KEYS
+        configured, the default headers carry an empty key.
+        """
+        return not key or key in self._by_key
+
+    def available(self) -> bool:
+        """Whether some key is not resting, i.e. a retry after a 429 need not wait."""
+        now = time.monotonic()
+        with self._lock:
+            return any(api_key.cooldown_until <= now for api_key in self.keys)
+
+    def acquire(self) -> ApiKey:
+        """Picks the key for one attempt and counts it in flight; every acquire needs a release."""
+        now = time.monotonic()
+        with self._lock:
+            if len(self.keys) == 1:
+                chosen = self.keys[0]
+            else:
+                ready = [api_key for api_key in self.keys if api_key.cooldown_until <= now]
+                if ready:
+                    chosen = min(ready, key=lambda k: (k.in_flight, -k.quota(now), k.last_used))
+                else:
+                    chosen = min(self.keys, key=lambda k: k.cooldown_until)
+            chosen.in_flight += 1
+            chosen.last_used = now
+            chosen.stats["requests"] += 1
+        KEY_IN_FLIGHT.inc(key=chosen.label)
+        return chosen
+
+    def release(self, api_key: Optional[ApiKey]) -> None:
+        """Ends an acquired key's attempt; the outcome goes to observe() or failed()."""
+        if api_key is None:
+            return
+        with self._lock:
+            api_key.in_flight -= 1
+        KEY_IN_FLIGHT.dec(key=api_key.label)
+
+    def observe(self, api_key: Optional[ApiKey], status: int, headers: Mapping[str, str]) -> None:
+        """
+        Accounts a response to the key and updates its quota and cooldown.
+
+        Args:
+            api_key: Key the request was sent with; None for requests outside the pool
+            status: HTTP status of the response
+            headers: Response headers with lower-case names
+        """
+        if api_key is None:
+            return
+        now = time.monotonic()
+        remaining, reset = parse_quota_headers(headers)
+        with self._lock:
+            if remaining is not None and reset is not None and reset > 0:
+                api_key.remaining = remaining
+                api_key.remaining_until = now + reset
+            if status == 429:
+                outcome = "throttled"
+                api_key.throttled_in_row += 1
+                retry_after = parse_retry_after(headers.get("retry-after"))
+                if retry_after is None:
+                    retry_after = min(self.cooldown * 2 ** (api_key.throttled_in_row - 1), self.max_cooldown)
+                self._rest(api_key, now, retry_after, "throttled")
+            else:
+                api_key.throttled_in_row = 0
+                outcome = "ok" if status < 400 else "client_error" if status < 500 else "server_error"
+                if remaining is not None and remaining <= 0 and reset is not None and reset > 0:
+                    api_key.stats["exhausted"] += 1
+                    self._rest(api_key, now, reset, "out of quota")
+            api_key.stats[outcome] += 1
+        KEY_REQUESTS.inc(key=api_key.label, outcome=outcome)
+
+    def failed(self, api_key: Optional[ApiKey]) -> None:
+        """Accounts a transport error (no response) to the key."""
+        if api_key is None:
+            return
+        with self._lock:
+            api_key.stats["transport_error"] += 1
+        KEY_REQUESTS.inc(key=api_key.label, outcome="transport_error")
+
+    def _rest(self, api_key: ApiKey, now: float, seconds: float, reason: str) -> None:
+        if now + seconds > api_key.cooldown_until:
+            api_key.cooldown_until = now + seconds
+            if len(self.keys) > 1:
+                logger.warning(f"API key {api_key.label} {reason}, resting for {seconds:.0f}s")
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-key usage and state, keyed by the masked label."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                api_key.label: dict(
+                    api_key.stats,
+                    user=api_key.user,
+                    in_flight=api_key.in_flight,
+                    remaining=api_key.remaining if api_key.quota(now) != float("inf") else None,
+                    resting_for=round(max(0.0, api_key.cooldown_until - now), 1)
+                )
+                for api_key in self.keys
+            }
@@ -1,12 +1,35 @@
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import FastMCP, Context
 from typing import List, Dict, Optional, Any, Union
+import asyncio
+import httpx
 import http.client
 import json
 import os
-import urllib.parse
+import functools
 import logging
 import traceback
 import time
+import threading
+import atexit
+from connection_pool import HTTPSConnectionPool
+from response_cache import ResponseCache, PersistentCache, DEFAULT_ROUTE_TTLS, DEFAULT_STALE_TTLS, request_key, split_endpoint
+from coalescing import SingleFlight
+from profile_batcher import ProfileBatcher
+from bulk import batch_items, fan_out
+from pagination import FeedPaginator, parse_timestamp
+from engagement import activity_urn, harvest_engagement as _harvest_engagement
+from rate_limiter import RateLimiter
+from retry_policy import RetryPolicy
+from key_pool import ApiKey, KeyPool, parse_keys
+from shared_state import open_shared_state
+from circuit_breaker import CircuitBreakerRegistry, CircuitBreaker
+import metrics
+import json_codec
+import compression
+from projection import FieldTree, compile_fields, project_items, project_response
+from endpoints import ENDPOINTS, Endpoint, build_tool, with_query
+from suggestions import SuggestionIndex
+from links import canonical_link
 
 # Configure logging
 logging.basicConfig(
@@ -15,31 +38,443 @@ logging.basicConfig(
 )
 logger = logging.getLogger('linkedin_api_tools')
 
+# JSON codec for every upstream response and tool result; "auto" picks orjson when installed
+json_codec.configure(os.environ.get("LINKEDIN_JSON_CODEC", "auto"))
+
+def _encode_result(fn):
+    """Serializes a tool's dict result with the JSON codec, sparing FastMCP its to_jsonable_python + json.dumps pass."""
+    if not asyncio.iscoroutinefunction(fn):
+        return fn
+    
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        result = await fn(*args, **kwargs)
+        return json_codec.dumps(result) if isinstance(result, dict) else result
+    
+    return wrapper
+
+# MCP server whose tools report latency and outcome metrics. Registering a tool builds a pydantic model of
+# its signature, so that is put off until the tool is first listed or called rather than paid on import.
+class InstrumentedFastMCP(FastMCP):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending_tools: Dict[str, tuple] = {}
+    
+    def add_tool(self, fn, name: Optional[str] = None, description: Optional[str] = None) -> None:
+        self._pending_tools[name or fn.__name__] = (fn, description)
+    
+    def _register_tool(self, name: str) -> None:
+        pending = self._pending_tools.pop(name, None)
+        if pending is not None:
+            fn, description = pending
+            super().add_tool(_encode_result(metrics.instrument_tool(fn, name)), name=name, description=description)
+    
+    async def list_tools(self):
+        for name in list(self._pending_tools):
+            self._register_tool(name)
+        return await super().list_tools()
+    
+    async def call_tool(self, name: str, arguments: Dict[str, Any]):
+        self._register_tool(name)
+        return await super().call_tool(name, arguments)
+
 # Create MCP server
-mcp = FastMCP("LinkedInProfiler")
+mcp = InstrumentedFastMCP("LinkedInProfiler")
 
 # Get LinkedIn API credentials from environment variables
 LINKEDIN_API_KEY = os.environ.get("LINKEDIN_API_KEY", "")
 LINKEDIN_API_HOST = os.environ.get("LINKEDIN_API_HOST", "")
 LINKEDIN_API_USER = os.environ.get("LINKEDIN_API_USER", "")
 
+# More keys to spread requests over, "key1,key2:user2" (user defaults to LINKEDIN_API_USER); throttled keys
+# rest for their Retry-After or else LINKEDIN_KEY_COOLDOWN seconds, doubling up to 10x while 429s continue
+LINKEDIN_API_KEYS = os.environ.get("LINKEDIN_API_KEYS", "")
+LINKEDIN_KEY_COOLDOWN = float(os.environ.get("LINKEDIN_KEY_COOLDOWN", "30"))
+
+key_pool = KeyPool(
+    list(dict(([(LINKEDIN_API_KEY, LINKEDIN_API_USER)] if LINKEDIN_API_KEY else [])
+              + parse_keys(LINKEDIN_API_KEYS, LINKEDIN_API_USER)).items()),
+    cooldown=LINKEDIN_KEY_COOLDOWN,
+    max_cooldown=LINKEDIN_KEY_COOLDOWN * 10
+)
+
+# "http" points the tools at a plain-HTTP stand-in such as benchmarks/mock_upstream.py (LINKEDIN_API_HOST=127.0.0.1:8700)
+LINKEDIN_API_SCHEME = os.environ.get("LINKEDIN_API_SCHEME", "https")
+
+# Keep-alive connection pool shared by every tool
+LINKEDIN_POOL_SIZE = int(os.environ.get("LINKEDIN_POOL_SIZE", "10"))
+LINKEDIN_POOL_IDLE_TIMEOUT = float(os.environ.get("LINKEDIN_POOL_IDLE_TIMEOUT", "60"))
+
+connection_pool = HTTPSConnectionPool(
+    LINKEDIN_API_HOST,
+    maxsize=LINKEDIN_POOL_SIZE,
+    idle_timeout=LINKEDIN_POOL_IDLE_TIMEOUT,
+    timeout=30,
+    connection_class=http.client.HTTPConnection if LINKEDIN_API_SCHEME == "http" else http.client.HTTPSConnection
+)
+
+# In-process response cache; LINKEDIN_CACHE_TTLS is a JSON object of per-route overrides
+LINKEDIN_CACHE_MAX_ENTRIES = int(os.environ.get("LINKEDIN_CACHE_MAX_ENTRIES", "2048"))
+LINKEDIN_CACHE_MAX_BYTES = int(os.environ.get("LINKEDIN_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+LINKEDIN_CACHE_TTLS = {**DEFAULT_ROUTE_TTLS, **json.loads(os.environ.get("LINKEDIN_CACHE_TTLS", "{}"))}
+
+# Seconds past the TTL an entry is still served while it is refreshed in the background; JSON object per route
+LINKEDIN_CACHE_STALE_TTLS = {**DEFAULT_STALE_TTLS, **json.loads(os.environ.get("LINKEDIN_CACHE_STALE_TTLS", "{}"))}
+
+# Optional on-disk tier so profiles and companies survive restarts; off unless LINKEDIN_CACHE_PATH is set
+LINKEDIN_CACHE_PATH = os.environ.get("LINKEDIN_CACHE_PATH", "")
+LINKEDIN_CACHE_DISK_MAX_BYTES = int(os.environ.get("LINKEDIN_CACHE_DISK_MAX_BYTES", str(512 * 1024 * 1024)))
+LINKEDIN_CACHE_COMPACT_INTERVAL = float(os.environ.get("LINKEDIN_CACHE_COMPACT_INTERVAL", "3600"))
+
+# State shared by worker processes (main.py with LINKEDIN_WORKERS above 1) or replicas: a SQLite file, or the URL
+# of a `python shared_state.py` server. It holds every cacheable route, in-flight requests and rate-limit buckets
+LINKEDIN_SHARED_STATE = os.environ.get("LINKEDIN_SHARED_STATE", "")
+
+shared_state = open_shared_state(
+    LINKEDIN_SHARED_STATE,
+    routes=frozenset(route for route, ttl in LINKEDIN_CACHE_TTLS.items() if ttl > 0),
+    max_bytes=LINKEDIN_CACHE_DISK_MAX_BYTES,
+    compact_interval=LINKEDIN_CACHE_COMPACT_INTERVAL
+) if LINKEDIN_SHARED_STATE else None
+
+if shared_state is not None and LINKEDIN_CACHE_PATH:
+    logger.warning(f"LINKEDIN_CACHE_PATH is ignored: the shared state {LINKEDIN_SHARED_STATE} persists the cache")
+
+persistent_cache = PersistentCache(
+    LINKEDIN_CACHE_PATH,
+    max_bytes=LINKEDIN_CACHE_DISK_MAX_BYTES,
+    compact_interval=LINKEDIN_CACHE_COMPACT_INTERVAL
+) if LINKEDIN_CACHE_PATH and shared_state is None else None
+
+response_cache = ResponseCache(
+    max_entries=LINKEDIN_CACHE_MAX_ENTRIES,
+    max_bytes=LINKEDIN_CACHE_MAX_BYTES,
+    route_ttls=LINKEDIN_CACHE_TTLS,
+    backend=shared_state.cache if shared_state is not None else persistent_cache,
+    stale_ttls=LINKEDIN_CACHE_STALE_TTLS
+)
+
+# Local prefix index answering suggestion lookups; snapshot and seed files are optional (off when unset),
+# LINKEDIN_SUGGEST_SEED is a list of paths separated by os.pathsep
+LINKEDIN_SUGGEST_INDEX = os.environ.get("LINKEDIN_SUGGEST_INDEX", "1") not in ("0", "false", "no")
+LINKEDIN_SUGGEST_MAX_AGE = float(os.environ.get("LINKEDIN_SUGGEST_MAX_AGE", str(7 * 86400)))
+LINKEDIN_SUGGEST_SNAPSHOT = os.environ.get("LINKEDIN_SUGGEST_SNAPSHOT", "")
+LINKEDIN_SUGGEST_SAVE_INTERVAL = float(os.environ.get("LINKEDIN_SUGGEST_SAVE_INTERVAL", "60"))
+LINKEDIN_SUGGEST_SEED = os.environ.get("LINKEDIN_SUGGEST_SEED", "")
+
+suggestion_index = SuggestionIndex(
+    max_age=LINKEDIN_SUGGEST_MAX_AGE
+) if LINKEDIN_SUGGEST_INDEX else None
+
+if suggestion_index is not None:
+    for _seed_path in filter(None, LINKEDIN_SUGGEST_SEED.split(os.pathsep)):
+        logger.info(f"Seeded {suggestion_index.load_seed(_seed_path)} suggestion queries from {_seed_path}")
+    if LINKEDIN_SUGGEST_SNAPSHOT:
+        logger.info(f"Restored {suggestion_index.load(LINKEDIN_SUGGEST_SNAPSHOT)} suggestion queries "
+                    f"from {LINKEDIN_SUGGEST_SNAPSHOT}")
+
+_suggestion_save_lock = threading.Lock()
+_suggestion_last_save = time.monotonic()
+
+def save_suggestion_index() -> None:
+    """Writes the suggestion snapshot if anything was merged since the last one."""
+    global _suggestion_last_save
+    if suggestion_index is None or not LINKEDIN_SUGGEST_SNAPSHOT or not suggestion_index.dirty:
+        return
+    with _suggestion_save_lock:
+        try:
+            suggestion_index.save(LINKEDIN_SUGGEST_SNAPSHOT)
+        except OSError as e:
+            logger.error(f"Saving suggestion snapshot to {LINKEDIN_SUGGEST_SNAPSHOT} failed: {str(e)}")
+        _suggestion_last_save = time.monotonic()
+
+if suggestion_index is not None and LINKEDIN_SUGGEST_SNAPSHOT:
+    atexit.register(save_suggestion_index)
+
+# Client-side rate limiting; LINKEDIN_ROUTE_RATE_LIMITS is a JSON object of per-route requests/second
+LINKEDIN_RATE_LIMIT = float(os.environ.get("LINKEDIN_RATE_LIMIT", "0"))
+LINKEDIN_RATE_BURST = float(os.environ.get("LINKEDIN_RATE_BURST", "10"))
+LINKEDIN_ROUTE_RATE_LIMITS = json.loads(os.environ.get("LINKEDIN_ROUTE_RATE_LIMITS", "{}"))
+LINKEDIN_RATE_MAX_WAIT = float(os.environ.get("LINKEDIN_RATE_MAX_WAIT", "30"))
+
+rate_limiter = RateLimiter(
+    rate=LINKEDIN_RATE_LIMIT,
+    burst=LINKEDIN_RATE_BURST,
+    route_rates=LINKEDIN_ROUTE_RATE_LIMITS,
+    max_wait=LINKEDIN_RATE_MAX_WAIT,
+    shared=shared_state
+)
+
+# Per-route circuit breakers stop paying retries on routes that keep failing
+LINKEDIN_BREAKER_FAILURE_RATE = float(os.environ.get("LINKEDIN_BREAKER_FAILURE_RATE", "0.5"))
+LINKEDIN_BREAKER_MIN_REQUESTS = int(os.environ.get("LINKEDIN_BREAKER_MIN_REQUESTS", "10"))
+LINKEDIN_BREAKER_WINDOW = float(os.environ.get("LINKEDIN_BREAKER_WINDOW", "60"))
+LINKEDIN_BREAKER_COOLDOWN = float(os.environ.get("LINKEDIN_BREAKER_COOLDOWN", "30"))
+# Routes whose 400s mean the route is broken rather than the input, comma-separated (none by default)
+LINKEDIN_BREAKER_400_ROUTES = os.environ.get("LINKEDIN_BREAKER_400_ROUTES", "")
+
+circuit_breakers = CircuitBreakerRegistry(
+    failure_rate=LINKEDIN_BREAKER_FAILURE_RATE,
+    min_requests=LINKEDIN_BREAKER_MIN_REQUESTS,
+    window=LINKEDIN_BREAKER_WINDOW,
+    cooldown=LINKEDIN_BREAKER_COOLDOWN,
+    max_cooldown=LINKEDIN_BREAKER_COOLDOWN * 10,
+    bad_request_routes=[route.strip() for route in LINKEDIN_BREAKER_400_ROUTES.split(",") if route.strip()]
+)
+
+# Retry policy: which failures get another attempt, the backoff between them and the budget of a whole call
+LINKEDIN_RETRY_MAX_ATTEMPTS = int(os.environ.get("LINKEDIN_RETRY_MAX_ATTEMPTS", "3"))
+LINKEDIN_RETRY_BASE_DELAY = float(os.environ.get("LINKEDIN_RETRY_BASE_DELAY", "0.5"))
+LINKEDIN_RETRY_MAX_DELAY = float(os.environ.get("LINKEDIN_RETRY_MAX_DELAY", "20"))
+LINKEDIN_REQUEST_DEADLINE = float(os.environ.get("LINKEDIN_REQUEST_DEADLINE", "60"))
+
+retry_policy = RetryPolicy(
+    max_attempts=LINKEDIN_RETRY_MAX_ATTEMPTS,
+    base_delay=LINKEDIN_RETRY_BASE_DELAY,
+    max_delay=LINKEDIN_RETRY_MAX_DELAY,
+    deadline=LINKEDIN_REQUEST_DEADLINE
+)
+
+# Ask the upstream for compressed bodies (gzip/deflate, brotli when installed)
+LINKEDIN_COMPRESSION = os.environ.get("LINKEDIN_COMPRESSION", "1") not in ("0", "false", "no")
+
+def _with_accept_encoding(headers: Dict) -> Dict:
+    if any(k.lower() == "accept-encoding" for k in headers):
+        return headers
+    # "identity" also stops httpx from offering its default gzip/deflate
+    return dict(headers, **{"Accept-Encoding": compression.ACCEPT_ENCODING if LINKEDIN_COMPRESSION else "identity"})
+
+# Identical concurrent requests share one upstream call, across workers too with shared state; a claim
+# lapses once the request could no longer be running
+single_flight = SingleFlight(shared=shared_state, lease=LINKEDIN_REQUEST_DEADLINE + LINKEDIN_RATE_MAX_WAIT)
+
+# Async client for the tools; created lazily because it is bound to the running event loop
+_async_client: Optional[httpx.AsyncClient] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_async_client() -> httpx.AsyncClient:
+    """Returns the process-wide httpx client, recreating it if the event loop changed."""
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client.is_closed or _async_client_loop is not loop:
+        _async_client = httpx.AsyncClient(
+            base_url=f"{LINKEDIN_API_SCHEME}://{LINKEDIN_API_HOST}",
+            timeout=30,
+            limits=httpx.Limits(
+                max_keepalive_connections=LINKEDIN_POOL_SIZE,
+                keepalive_expiry=LINKEDIN_POOL_IDLE_TIMEOUT
+            )
+        )
+        _async_client_loop = loop
+    return _async_client
+
+# Helper function turning a raw upstream response into the tool result shape
+def _build_response(method: str, endpoint: str, status: int, data: bytes) -> Dict[str, Any]:
+    """
+    Parses an upstream response body into the standard result dictionary.
+    
+    Args:
+        method: HTTP method of the request
+        endpoint: API endpoint of the request
+        status: HTTP status code of the response
+        data: Raw response body
+        
+    Returns:
+        {"success", "status", "data"} on success, or an error dictionary
+    """
+    # Log response status
+    logger.info(f"API Response: {method} {endpoint} - Status: {status}")
+    
+    # Parse response
+    if data:
+        try:
+            response_data = json_codec.loads(data)
+            
+            # Log partial response for debugging
+            if isinstance(response_data, dict):
+                log_keys = list(response_data.keys())
+                logger.debug(f"Response keys: {log_keys}")
+            
+            # Check for API errors in response
+            if status >= 400:
+                error_msg = response_data.get('message', 'Unknown API error')
+                logger.error(f"API Error: {method} {endpoint} - Status: {status} - Error: {error_msg}")
+                
+                # Return error response
+                return {
+                    "success": False,
+                    "status": status,
+                    "message": error_msg,
+                    "details": response_data
+                }
+            
+            # Return successful response
+            return {
+                "success": True,
+                "status": status,
+                "data": response_data
+            }
+        except json_codec.DecodeError as e:
+            logger.error(f"JSON Decode Error: {method} {endpoint} - {str(e)}")
+            data = data.decode("utf-8", errors="replace")
+            logger.error(f"Raw response: {data[:200]}..." if len(data) > 200 else f"Raw response: {data}")
+            
+            # Return error response
+            return {
+                "success": False,
+                "status": status,
+                "message": "Failed to decode JSON response",
+                "details": {"error": str(e), "raw_data": data[:1000] if len(data) > 1000 else data}
+            }
+    else:
+        logger.warning(f"Empty response: {method} {endpoint}")
+        return {
+            "success": False,
+            "status": status,
+            "message": "Empty response from API"
+        }
+
+# Helper function for requests the rate limiter would have to hold for too long
+def _rate_limited_response(method: str, endpoint: str) -> Dict[str, Any]:
+    logger.warning(f"Rate limited locally: {method} {endpoint}")
+    return {
+        "success": False,
+        "status": 429,
+        "message": f"Rate limit reached; no request slot within {LINKEDIN_RATE_MAX_WAIT} seconds"
+    }
+
+# Helper function for requests refused by an open circuit
+def _circuit_open_response(method: str, endpoint: str, breaker: CircuitBreaker) -> Dict[str, Any]:
+    logger.warning(f"Circuit open, failing fast: {method} {endpoint}")
+    return {
+        "success": False,
+        "status": 503,
+        "message": f"Upstream route {breaker.route} is failing; circuit open",
+        "details": {"retry_after": round(breaker.retry_after(), 1)}
+    }
+
+# Helper function for the Retry-After a retry has to respect
+def _retry_after(status: int, headers: Dict[str, str], pooled_key: Optional[ApiKey]) -> Optional[float]:
+    # A 429 only throttled the key it was sent with; another key of the pool can take the retry right away
+    if status == 429 and pooled_key is not None and key_pool.available():
+        return None
+    return retry_policy.retry_after(status, headers)
+
+# Upstream fetch behind a cache miss or a refresh, storing successful results
+def _fetch(method: str, endpoint: str, payload: Optional[str], headers: Dict, cache_key: Optional[str]) -> Dict[str, Any]:
+    metrics.API_CALLS.inc(route=split_endpoint(endpoint)[0], source="upstream")
+    result = _request_with_retries(method, endpoint, payload, headers)
+    if cache_key is not None:
+        response_cache.put(cache_key, endpoint, result)
+    return result
+
+async def _fetch_async(method: str, endpoint: str, payload: Optional[str], headers: Dict,
+                       cache_key: Optional[str]) -> Dict[str, Any]:
+    metrics.API_CALLS.inc(route=split_endpoint(endpoint)[0], source="upstream")
+    result = await _request_with_retries_async(method, endpoint, payload, headers)
+    if cache_key is not None:
+        await response_cache.put_async(cache_key, endpoint, result)
+    return result
+
+# Background refreshes of stale cache entries: at most one per key, references kept until they finish
+_refreshing = set()
+_refresh_tasks = set()
+_refresh_lock = threading.Lock()
+
+def _schedule_refresh(method: str, endpoint: str, payload: Optional[str], headers: Dict, cache_key: str) -> None:
+    """
+    Refetches a stale cache entry without making the caller wait.
+    
+    Goes through single_flight, so a concurrent miss for the same request
+    shares the refresh. Only a successful response replaces the entry; on
+    failure the stale copy keeps being served until its stale TTL runs out.
+    """
+    with _refresh_lock:
+        if cache_key in _refreshing:
+            return
+        _refreshing.add(cache_key)
+    route = split_endpoint(endpoint)[0]
+    
+    def finish(result: Optional[Dict[str, Any]], error: Optional[Exception] = None) -> None:
+        with _refresh_lock:
+            _refreshing.discard(cache_key)
+        if result is not None and result.get("success"):
+            metrics.CACHE_REFRESHES.inc(route=route, outcome="ok")
+            return
+        metrics.CACHE_REFRESHES.inc(route=route, outcome="failed")
+        reason = f"{type(error).__name__}: {str(error)}" if error is not None else f"status {result.get('status')}"
+        logger.warning(f"Refresh of stale {method} {endpoint} failed ({reason}); serving the stale copy meanwhile")
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        def refresh_sync() -> None:
+            try:
+                result = single_flight.do_sync(cache_key, lambda: _fetch(method, endpoint, payload, headers, cache_key))
+            except Exception as e:
+                finish(None, e)
+                return
+            finish(result)
+        threading.Thread(target=refresh_sync, name="cache-refresh", daemon=True).start()
+        return
+    
+    async def refresh() -> None:
+        try:
+            result = await single_flight.do(cache_key, lambda: _fetch_async(method, endpoint, payload, headers, cache_key))
+        except Exception as e:
+            finish(None, e)
+            return
+        finish(result)
+    
+    task = asyncio.ensure_future(refresh())
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+
+# Helper function serving a cached response, stale or not; stale ones get refreshed in the background
+def _from_cache(method: str, endpoint: str, payload: Optional[str], headers: Dict,
+                cache_key: str) -> Optional[Dict[str, Any]]:
+    cached, stale = response_cache.lookup(cache_key)
+    return _serve_cached(method, endpoint, payload, headers, cache_key, cached, stale)
+
+async def _from_cache_async(method: str, endpoint: str, payload: Optional[str], headers: Dict,
+                            cache_key: str) -> Optional[Dict[str, Any]]:
+    cached, stale = await response_cache.lookup_async(cache_key)
+    return _serve_cached(method, endpoint, payload, headers, cache_key, cached, stale)
+
+def _serve_cached(method: str, endpoint: str, payload: Optional[str], headers: Dict, cache_key: str,
+                  cached: Optional[Dict[str, Any]], stale: bool) -> Optional[Dict[str, Any]]:
+    if cached is None:
+        return None
+    if stale:
+        logger.info(f"Stale cache hit, refreshing: {method} {endpoint}")
+        _schedule_refresh(method, endpoint, payload, headers, cache_key)
+        cached["stale"] = True
+    else:
+        logger.info(f"Cache hit: {method} {endpoint}")
+    metrics.API_CALLS.inc(route=split_endpoint(endpoint)[0], source="stale" if stale else "cache")
+    cached["attempts"] = 0
+    return cached
+
 # Helper function for making API requests with error handling
-def make_api_request(method: str, endpoint: str, payload: Optional[str] = None, headers: Dict = None) -> Dict[str, Any]:
+def make_api_request(method: str, endpoint: str, payload: Optional[str] = None, headers: Dict = None,
+                     fields: Optional[FieldTree] = None) -> Dict[str, Any]:
     """
     Makes an API request with error handling.
     
+    Repeated requests are served from the response cache (stale entries of
+    slow-changing routes at once, refreshed in the background), and identical
+    requests already in flight are coalesced into a single upstream call.
+    
     Args:
         method: HTTP method (GET, POST, etc.)
         endpoint: API endpoint
         payload: Request payload (for POST, PUT, etc.)
         headers: Request headers
+        fields: Projection from compile_fields; only these paths of "data" are returned
         
     Returns:
         API response as a dictionary
     """
-    MAX_RETRIES = 3
-    RETRY_DELAY = 2  # seconds
-    
     # Ensure headers are set
     if headers is None:
         headers = {
@@ -56,100 +491,208 @@ def make_api_request(method: str, endpoint: str, payload: Optional[str] = None,
     if payload:
         logger.debug(f"Payload: {payload[:200]}..." if len(payload) > 200 else f"Payload: {payload}")
     
-    for attempt in range(MAX_RETRIES):
+    # Serve repeated lookups from the cache
+    cache_key = response_cache.key_for(method, endpoint, payload)
+    if cache_key is not None:
+        cached = _from_cache(method, endpoint, payload, headers, cache_key)
+        if cached is not None:
+            return project_response(cached, fields)
+    
+    result = single_flight.do_sync(cache_key or request_key(method, endpoint, payload),
+                                   lambda: _fetch(method, endpoint, payload, headers, cache_key))
+    return project_response(result, fields)
+
+def _request_with_retries(method: str, endpoint: str, payload: Optional[str], headers: Dict) -> Dict[str, Any]:
+    route = split_endpoint(endpoint)[0]
+    breaker = circuit_breakers.get(route)
+    retry = retry_policy.start()
+    sent = len(payload.encode("utf-8")) if payload else 0
+    base_headers = _with_accept_encoding(headers)
+    pooled = key_pool.owns(headers.get("x-rapidapi-key", ""))
+    
+    while True:
+        # Fail fast while the route's circuit is open
+        if not breaker.allow():
+            return dict(_circuit_open_response(method, endpoint, breaker), attempts=retry.attempts)
+        
+        # Every attempt goes out with the least loaded key of the pool; a key from outside it is kept as is
+        pooled_key = key_pool.acquire() if pooled else None
+        api_key = pooled_key.key if pooled_key is not None else headers.get("x-rapidapi-key", "")
+        request_headers = pooled_key.headers(base_headers) if pooled_key is not None else base_headers
+        
+        # Queue for a rate-limit slot instead of running into a 429
+        wait = rate_limiter.reserve(api_key, route)
+        while wait:
+            time.sleep(wait)
+            wait = rate_limiter.blocked_for(api_key)
+        if wait is None:
+            key_pool.release(pooled_key)
+            breaker.release()
+            return dict(_rate_limited_response(method, endpoint), attempts=retry.attempts)
+        
+        retry.attempts += 1
         try:
-            # Create connection
-            conn = http.client.HTTPSConnection(LINKEDIN_API_HOST)
-            
-            # Set timeout to prevent hanging requests
-            conn.timeout = 30
-            
-            # Make request
-            conn.request(method, endpoint, payload, headers)
+            # Borrow a keep-alive connection and drain the response before returning it
+            try:
+                with metrics.upstream_attempt(route, method, retry.attempts, sent) as attempt, \
+                        connection_pool.connection() as conn:
+                    conn.timeout = min(connection_pool.timeout, max(retry.remaining(), 1.0))
+                    if conn.sock is not None:
+                        conn.sock.settimeout(conn.timeout)
+                    conn.request(method, endpoint, payload, request_headers)
+                    res = conn.getresponse()
+                    body, received = compression.read_body(res, route)
+                    attempt["status"], attempt["received"] = res.status, received
+            finally:
+                key_pool.release(pooled_key)
             
-            # Get response
-            res = conn.getresponse()
-            data = res.read().decode("utf-8")
-            
-            # Log response status
-            logger.info(f"API Response: {method} {endpoint} - Status: {res.status}")
+            response_headers = {k.lower(): v for k, v in res.getheaders()}
+            key_pool.observe(pooled_key, res.status, response_headers)
+            rate_limiter.observe(api_key, res.status, response_headers)
+            breaker.record(not breaker.is_failure(res.status))
+            result = dict(_build_response(method, endpoint, res.status, body), attempts=retry.attempts)
+            if not retry_policy.retryable_status(res.status):
+                return result
+            retry_wait = retry.backoff(_retry_after(res.status, response_headers, pooled_key))
+            if retry_wait is None:
+                return result
+            logger.info(f"Retrying after status {res.status} in {retry_wait:.2f} seconds... (Attempt {retry.attempts}/{retry_policy.max_attempts})")
+        except Exception as e:
+            logger.error(f"Request Error: {method} {endpoint} - {str(e)}")
+            logger.error(f"Traceback: {traceback.format_exc()}")
+            key_pool.failed(pooled_key)
+            breaker.record(False)
             
-            # Parse response
-            if data:
-                try:
-                    response_data = json.loads(data)
-                    
-                    # Log partial response for debugging
-                    if isinstance(response_data, dict):
-                        log_keys = list(response_data.keys())
-                        logger.debug(f"Response keys: {log_keys}")
-                    
-                    # Check for API errors in response
-                    if res.status >= 400:
-                        error_msg = response_data.get('message', 'Unknown API error')
-                        logger.error(f"API Error: {method} {endpoint} - Status: {res.status} - Error: {error_msg}")
-                        
-                        # Return error response
-                        return {
-                            "success": False,
-                            "status": res.status,
-                            "message": error_msg,
-                            "details": response_data
-                        }
-                    
-                    # Return successful response
-                    return {
-                        "success": True,
-                        "status": res.status,
-                        "data": response_data
-                    }
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON Decode Error: {method} {endpoint} - {str(e)}")
-                    logger.error(f"Raw response: {data[:200]}..." if len(data) > 200 else f"Raw response: {data}")
-                    
-                    # Return error response
-                    return {
-                        "success": False,
-                        "status": res.status,
-                        "message": "Failed to decode JSON response",
-                        "details": {"error": str(e), "raw_data": data[:1000] if len(data) > 1000 else data}
-                    }
-            else:
-                logger.warning(f"Empty response: {method} {endpoint}")
+            # Check if we should retry
+            retry_wait = retry.backoff() if retry_policy.retryable_exception(e) else None
+            if retry_wait is None:
+                # Return error response once retries are used up or pointless
                 return {
                     "success": False,
-                    "status": res.status,
-                    "message": "Empty response from API"
+                    "status": 500,
+                    "message": f"Request failed after {retry.attempts} attempts",
+                    "details": {"error": str(e), "exception_type": type(e).__name__},
+                    "attempts": retry.attempts
                 }
-                
+            logger.info(f"Retrying in {retry_wait:.2f} seconds... (Attempt {retry.attempts}/{retry_policy.max_attempts})")
+        
+        time.sleep(retry_wait)
+
+# Async variant of make_api_request used by the tools so upstream waits never block the event loop
+async def make_api_request_async(method: str, endpoint: str, payload: Optional[str] = None, headers: Dict = None,
+                                 fields: Optional[FieldTree] = None) -> Dict[str, Any]:
+    """
+    Makes an API request with error handling without blocking the event loop.
+    
+    Repeated requests are served from the response cache (stale entries of
+    slow-changing routes at once, refreshed in the background), and identical
+    requests already in flight are coalesced into a single upstream call.
+    
+    Args:
+        method: HTTP method (GET, POST, etc.)
+        endpoint: API endpoint
+        payload: Request payload (for POST, PUT, etc.)
+        headers: Request headers
+        fields: Projection from compile_fields; only these paths of "data" are returned
+        
+    Returns:
+        API response as a dictionary
+    """
+    # Ensure headers are set
+    if headers is None:
+        headers = {
+            "Content-Type": "application/json",
+            "x-rapidapi-host": LINKEDIN_API_HOST,
+            "x-rapidapi-key": LINKEDIN_API_KEY,
+            "x-rapidapi-user": LINKEDIN_API_USER
+        }
+    
+    logger.info(f"API Request: {method} {endpoint}")
+    if payload:
+        logger.debug(f"Payload: {payload[:200]}..." if len(payload) > 200 else f"Payload: {payload}")
+    
+    # Serve repeated lookups from the cache
+    cache_key = response_cache.key_for(method, endpoint, payload)
+    if cache_key is not None:
+        cached = await _from_cache_async(method, endpoint, payload, headers, cache_key)
+        if cached is not None:
+            return project_response(cached, fields)
+    
+    result = await single_flight.do(cache_key or request_key(method, endpoint, payload),
+                                    lambda: _fetch_async(method, endpoint, payload, headers, cache_key))
+    return project_response(result, fields)
+
+async def _request_with_retries_async(method: str, endpoint: str, payload: Optional[str], headers: Dict) -> Dict[str, Any]:
+    route = split_endpoint(endpoint)[0]
+    breaker = circuit_breakers.get(route)
+    retry = retry_policy.start()
+    sent = len(payload.encode("utf-8")) if payload else 0
+    base_headers = _with_accept_encoding(headers)
+    pooled = key_pool.owns(headers.get("x-rapidapi-key", ""))
+    
+    while True:
+        # Fail fast while the route's circuit is open
+        if not breaker.allow():
+            return dict(_circuit_open_response(method, endpoint, breaker), attempts=retry.attempts)
+        
+        # Every attempt goes out with the least loaded key of the pool; a key from outside it is kept as is
+        pooled_key = key_pool.acquire() if pooled else None
+        api_key = pooled_key.key if pooled_key is not None else headers.get("x-rapidapi-key", "")
+        request_headers = pooled_key.headers(base_headers) if pooled_key is not None else base_headers
+        
+        # Queue for a rate-limit slot instead of running into a 429
+        wait = await rate_limiter.reserve_async(api_key, route)
+        while wait:
+            await asyncio.sleep(wait)
+            wait = await rate_limiter.blocked_for_async(api_key)
+        if wait is None:
+            key_pool.release(pooled_key)
+            breaker.release()
+            return dict(_rate_limited_response(method, endpoint), attempts=retry.attempts)
+        
+        retry.attempts += 1
+        try:
+            try:
+                with metrics.upstream_attempt(route, method, retry.attempts, sent) as attempt:
+                    res = await get_async_client().request(
+                        method, endpoint, content=payload, headers=request_headers,
+                        timeout=min(30.0, max(retry.remaining(), 1.0))
+                    )
+                    attempt["status"], attempt["received"] = res.status_code, res.num_bytes_downloaded
+                    compression.record_transfer(route, res.headers.get("content-encoding"), res.num_bytes_downloaded, len(res.content))
+            finally:
+                key_pool.release(pooled_key)
+            response_headers = {k.lower(): v for k, v in res.headers.items()}
+            key_pool.observe(pooled_key, res.status_code, response_headers)
+            await rate_limiter.observe_async(api_key, res.status_code, response_headers)
+            breaker.record(not breaker.is_failure(res.status_code))
+            result = dict(_build_response(method, endpoint, res.status_code, res.content), attempts=retry.attempts)
+            if not retry_policy.retryable_status(res.status_code):
+                return result
+            retry_wait = retry.backoff(_retry_after(res.status_code, response_headers, pooled_key))
+            if retry_wait is None:
+                return result
+            logger.info(f"Retrying after status {res.status_code} in {retry_wait:.2f} seconds... (Attempt {retry.attempts}/{retry_policy.max_attempts})")
         except Exception as e:
             logger.error(f"Request Error: {method} {endpoint} - {str(e)}")
             logger.error(f"Traceback: {traceback.format_exc()}")
+            key_pool.failed(pooled_key)
+            breaker.record(False)
             
             # Check if we should retry
-            if attempt < MAX_RETRIES - 1:
-                retry_wait = RETRY_DELAY * (attempt + 1)
-                logger.info(f"Retrying in {retry_wait} seconds... (Attempt {attempt + 1}/{MAX_RETRIES})")
-                time.sleep(retry_wait)
-            else:
-                # Return error response after all retries failed
+            retry_wait = retry.backoff() if retry_policy.retryable_exception(e) else None
+            if retry_wait is None:
+                # Return error response once retries are used up or pointless
                 return {
                     "success": False,
                     "status": 500,
-                    "message": f"Request failed after {MAX_RETRIES} attempts",
-                    "details": {"error": str(e)}
+                    "message": f"Request failed after {retry.attempts} attempts",
+                    "details": {"error": str(e), "exception_type": type(e).__name__},
+                    "attempts": retry.attempts
                 }
-        finally:
-            # Close connection
-            if 'conn' in locals():
-                conn.close()
-    
-    # This should never be reached due to the return in the last retry attempt
-    return {
-        "success": False,
-        "status": 500,
-        "message": "Unexpected error in API request"
-    }
+            logger.info(f"Retrying in {retry_wait:.2f} seconds... (Attempt {retry.attempts}/{retry_policy.max_attempts})")
+        
+        await asyncio.sleep(retry_wait)
 
 # LinkedIn API headers
 LINKEDIN_HEADERS = {
@@ -159,285 +702,174 @@ LINKEDIN_HEADERS = {
     "x-rapidapi-user": LINKEDIN_API_USER
 }
 
-# LinkedIn API Tools based on api_doc.md
+# Maximum batch calls in flight for one bulk tool call
+LINKEDIN_BULK_CONCURRENCY = int(os.environ.get("LINKEDIN_BULK_CONCURRENCY", "4"))
 
-# Tool: Get Profiles
-@mcp.tool()
-def profiles(links: List[str]) -> Dict:
-    """Can scrape up to 100 profiles data in a go
-    
-    Request Body Example:
-    {
-        "links": [
-            "http://www.linkedin.com/in/luke-sharp-b3838719a",
-            "http://www.linkedin.com/in/hollie-smith-96ab44b5"
-        ]
-    }
-    """
-    try:
-        payload = json.dumps({"links": links})
-        return make_api_request("POST", "/profiles", payload, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in profiles tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
+# Upper bound on upstream calls for one auto-paginated tool call
+LINKEDIN_MAX_PAGES = int(os.environ.get("LINKEDIN_MAX_PAGES", "50"))
 
-# Tool: Get Companies
-@mcp.tool()
-def companies(links: List[str]) -> Dict:
-    """Can scrape up to 100 companies data in a go
-    
-    Request Body Example:
-    {
-        "links": [
-            "https://www.linkedin.com/company/huzzle-app/",
-            "http://www.linkedin.com/company/aep-energy"
-        ],
-        "count": 1
-    }
+# Helper function walking a paginated feed for the auto_paginate mode of the feed tools
+async def _paginate_feed(route: str, params: Dict[str, Any], page: int, pagination_token: Optional[str],
+                         offset: int, max_items: int, since: Optional[str], ctx: Optional[Context]) -> Dict[str, Any]:
     """
-    try:
-        payload = json.dumps({"links": links})
-        return make_api_request("POST", "/companies", payload, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in companies tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Get Company Posts
-@mcp.tool()
-def company_posts(links: List[str], count: int = 1) -> Dict:
-    """Can scrape 100 posts of 50 linkedin companies
+    Follows page/paginationToken of a feed endpoint until max_items, the since cutoff or the last page.
     
-    Request Body Example:
-    {
-        "links": [
-            "https://www.linkedin.com/company/huzzle-app/",
-            "http://www.linkedin.com/company/aep-energy"
-        ],
-        "count": 1
-    }
+    Args:
+        route: Feed endpoint
+        params: Query parameters sent with every page
+        page: First page number
+        pagination_token: Token of the first page, if resuming
+        offset: Items of the first page returned by the previous call, if resuming
+        max_items: Maximum number of items to return
+        since: ISO-8601 date or epoch; older items end the walk
+        ctx: MCP context used to send a progress notification per page
+        
+    Returns:
+        All collected items with the page/paginationToken/offset to resume from
     """
-    try:
-        payload = json.dumps({"links": links, "count": count})
-        return make_api_request("POST", "/company_posts", payload, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in company_posts tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Get Person Data
-@mcp.tool()
-def person(link: str) -> Dict:
-    """Scrapes all data of a person from linkedin
+    cutoff = None
+    if since:
+        cutoff = parse_timestamp(since)
+        if cutoff is None:
+            raise ValueError(f"Unrecognized since value: {since}")
     
-    Request Body Example:
-    {
-        "link": "https://www.linkedin.com/in/ingmar-klein"
-    }
+    async def fetch_page(page_number: int, token: Optional[str]) -> Dict[str, Any]:
+        page_params = dict(params, page=page_number)
+        if token:
+            page_params["paginationToken"] = token
+        return await make_api_request_async("GET", with_query(route, page_params), None, LINKEDIN_HEADERS)
+    
+    async def report_progress(done: int, total: int) -> None:
+        if ctx is None:
+            return
+        try:
+            await ctx.report_progress(done, total)
+        except ValueError:
+            # Called outside of an MCP request
+            pass
+    
+    paginator = FeedPaginator(
+        fetch_page,
+        max_items=max_items,
+        since=cutoff,
+        max_pages=LINKEDIN_MAX_PAGES,
+        start_page=page,
+        start_token=pagination_token,
+        start_offset=offset
+    )
+    return await paginator.collect(on_page=report_progress)
+
+# Shared request path of every tool generated from the endpoint registry
+async def _suggest(endpoint: Endpoint, arguments: Dict[str, Any]) -> Dict:
+    """Answers a suggestion tool from the local index, going upstream (and merging the answer) on a miss."""
+    query = suggestion_index.query_for(endpoint.route, arguments)
+    result, outcome = suggestion_index.lookup(endpoint.route, query)
+    metrics.SUGGESTION_LOOKUPS.inc(route=endpoint.route, outcome=outcome)
+    if result is not None:
+        logger.info(f"Suggestion index {outcome} hit: {endpoint.route} {query!r}")
+        return result
+    path, payload = endpoint.request(arguments)
+    result = await make_api_request_async(endpoint.method, path, payload, LINKEDIN_HEADERS)
+    if not result.get("stale") and suggestion_index.merge(endpoint.route, query, result) \
+            and time.monotonic() - _suggestion_last_save >= LINKEDIN_SUGGEST_SAVE_INTERVAL:
+        threading.Thread(target=save_suggestion_index, name="suggestion-snapshot", daemon=True).start()
+    return result
+
+async def call_endpoint(endpoint: Endpoint, arguments: Dict[str, Any]) -> Dict:
     """
-    try:
-        payload = json.dumps({"link": link})
-        return make_api_request("POST", "/person", payload, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in person tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
+    Sends one tool call to its endpoint: builds the encoded request, fans link
+    lists out in upstream-sized batches and applies the fields projection.
+    Suggestion routes are answered from the local index when it can.
 
-# Tool: Get Person Data Using URN
-@mcp.tool()
-def person_urn(link: str) -> Dict:
-    """Scrapes all data from a person's page using his profile URN
-    
-    NOTE: This tool failed during testing (status 400, error: Failed to scrape profile).
-    The API documentation is unclear if this expects a URN string or a full profile link with URN.
+    Args:
+        endpoint: Registry entry of the tool
+        arguments: Tool arguments, every one present
 
-    Request Body Example:
-    {
-        "link": "https://www.linkedin.com/in/ACoAACeIPPkBUymOGNvgfbBL_uhKc32Hg_g_haU" 
-    }
+    Returns:
+        Response data as dictionary
     """
     try:
-        payload = json.dumps({"link": link})
-        return make_api_request("POST", "/person_urn", payload, LINKEDIN_HEADERS)
+        projection = compile_fields(arguments.get("fields")) if endpoint.fields else None
+        batch = endpoint.batch
+        if suggestion_index is not None and endpoint.route in suggestion_index.routes:
+            return await _suggest(endpoint, arguments)
+        if batch is None:
+            path, payload = endpoint.request(arguments)
+            return await make_api_request_async(endpoint.method, path, payload, LINKEDIN_HEADERS, fields=projection)
+
+        async def fetch_chunk(chunk: List[str]) -> Dict:
+            path, payload = endpoint.request(dict(arguments, **{batch.param: chunk}))
+            return await make_api_request_async(endpoint.method, path, payload, LINKEDIN_HEADERS)
+
+        result = await fan_out(arguments[batch.param], batch.size, fetch_chunk, LINKEDIN_BULK_CONCURRENCY,
+                               per_link=batch.per_link)
+        return project_items(result, projection)
     except Exception as e:
-        logger.error(f"Error in person_urn tool: {str(e)}")
+        logger.error(f"Error in {endpoint.tool} tool: {str(e)}")
         return {"error": str(e), "exception_type": type(e).__name__}
 
-# Tool: Get Person Skills
-@mcp.tool()
-def person_skills(link: str) -> Dict:
-    """Scrapes all skills of a linkedin user
-    
-    Request Body Example:
-    {
-        "link": "https://www.linkedin.com/in/ingmar-klein"
-    }
-    """
-    try:
-        payload = json.dumps({"link": link})
-        return make_api_request("POST", "/person_skills", payload, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in person_skills tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
+# LinkedIn API Tools based on api_doc.md; plain endpoints are generated from the registry in endpoints.py
+for _endpoint in ENDPOINTS:
+    globals()[_endpoint.tool] = mcp.tool()(build_tool(_endpoint, call_endpoint))
 
-# Tool: Search People With Filters
-@mcp.tool()
-def search_people_with_filters(keyword: str, page: int = 1, title_free_text: str = None, 
-                            company_free_text: str = None, first_name: str = None, 
-                            last_name: str = None) -> Dict:
-    """Search for people from linkedin using all filters as per linkedin
-    
-    Request Body Example:
-    {
-        "keyword": "ingmar", 
-        "page": 1, 
-        "title_free_text": "CEO", 
-        "company_free_text": "Huzzle", 
-        "first_name": "Ingmar", 
-        "last_name": "Klein"
-    }
-    """
-    try:
-        payload = {"keyword": keyword, "page": page}
-        
-        if title_free_text:
-            payload["title_free_text"] = title_free_text
-        if company_free_text:
-            payload["company_free_text"] = company_free_text
-        if first_name:
-            payload["first_name"] = first_name
-        if last_name:
-            payload["last_name"] = last_name
-            
-        return make_api_request("POST", "/search_people_with_filters", json.dumps(payload), LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in search_people_with_filters tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
+# Opt-in micro-batching of person lookups into /profiles calls; LINKEDIN_PROFILE_BATCH_WINDOW is in seconds
+LINKEDIN_PROFILE_BATCH_WINDOW = float(os.environ.get("LINKEDIN_PROFILE_BATCH_WINDOW", "0"))
 
-# Tool: Get Company Data
-@mcp.tool()
-def company(link: str) -> Dict:
-    """Scrapes all data from a provided company url
-    
-    Request Body Example:
-    {
-        "link": "https://www.linkedin.com/company/huzzle-app"
-    }
-    """
-    try:
-        payload = json.dumps({"link": link})
-        return make_api_request("POST", "/company", payload, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in company tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
+async def _fetch_profiles_batch(links: List[str]) -> Dict[str, Any]:
+    return await make_api_request_async("POST", "/profiles", json.dumps({"links": links}), LINKEDIN_HEADERS)
 
-# Tool: Get Company Jobs
-@mcp.tool()
-def company_jobs(company_url: str, starts_from: int = 0, count: int = 10) -> Dict:
-    """Scrapes jobs of a specific linkedin company
-    
-    Request Body Example:
-    {
-        "company_url": "https://www.linkedin.com/company/google",
-        "starts_from": 0,
-        "count": 10
-    }
-    """
-    try:
-        payload = json.dumps({
-            "company_url": company_url,
-            "starts_from": starts_from,
-            "count": count
-        })
-        return make_api_request("POST", "/company_jobs", payload, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in company_jobs tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
+profile_batcher = ProfileBatcher(
+    _fetch_profiles_batch,
+    window=LINKEDIN_PROFILE_BATCH_WINDOW
+) if LINKEDIN_PROFILE_BATCH_WINDOW > 0 else None
 
-# Tool: Search Companies With Filters
+# Tool: Get Person Data
 @mcp.tool()
-def search_company_with_filters(keyword: str, page: int = 1, company_size_list: str = None, 
-                             hasJobs: bool = False, location_list: str = None, 
-                             industry_list: str = None) -> Dict:
-    """Search for companies as per linkedin search engine
+async def person(link: str, fields: Optional[List[str]] = None) -> Dict:
+    """Scrapes all data of a person from linkedin
     
-    Request Body Example:
-    {
-        "keyword": "G", 
-        "page": 1, 
-        "company_size_list": "A,D", 
-        "hasJobs": false, 
-        "location_list": "", 
-        "industry_list": ""
-    }
-    """
-    try:
-        payload = {
-            "keyword": keyword,
-            "page": page,
-            "hasJobs": hasJobs
-        }
-        
-        if company_size_list:
-            payload["company_size_list"] = company_size_list
-        if location_list:
-            payload["location_list"] = location_list
-        if industry_list:
-            payload["industry_list"] = industry_list
-            
-        return make_api_request("POST", "/search_company_with_filters", json.dumps(payload), LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in search_company_with_filters tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Get Post Data
-@mcp.tool()
-def post(link: str) -> Dict:
-    """Scrapes post data by a person/company using its linkedin url
+    Pass fields (e.g. ["data.full_name", "data.experiences[].company"]) to
+    return only those paths of the response body.
     
     Request Body Example:
     {
-        "link": "https://www.linkedin.com/feed/update/urn:li:activity:7219434359085252608"
+        "link": "https://www.linkedin.com/in/ingmar-klein"
     }
     """
     try:
+        link = canonical_link(link)
         payload = json.dumps({"link": link})
-        return make_api_request("POST", "/post", payload, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in post tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Search Posts
-@mcp.tool()
-def search_posts(query: str, page: int = 1, filters: List[Dict] = None) -> Dict:
-    """Search posts as per linkedin.com search engine (with filters)
-    
-    Request Body Example:
-    {
-        "page": 1,
-        "query": "Top 10",
-        "filters": [
-            {
-                "key": "datePosted",
-                "values": "past-week"
-            }
-        ]
-    }
-    """
-    try:
-        payload = {
-            "query": query,
-            "page": page
-        }
+        projection = compile_fields(fields)
         
-        if filters:
-            payload["filters"] = filters
-            
-        return make_api_request("POST", "/search_posts", json.dumps(payload), LINKEDIN_HEADERS)
+        # With batching enabled, lookups not already cached ride along in a shared /profiles call
+        if profile_batcher is not None:
+            cache_key = response_cache.key_for("POST", "/person", payload)
+            cached = await response_cache.get_async(cache_key) if cache_key is not None else None
+            if cached is not None:
+                return project_response(cached, projection)
+            # Batched items have the /profiles shape, so they are cached as a one-link /profiles answer,
+            # never under the /person key that unbatched lookups read
+            batch_key = response_cache.key_for("POST", "/profiles", json.dumps({"links": [link]}))
+            cached = await response_cache.get_async(batch_key) if batch_key is not None else None
+            items = batch_items(cached.get("data")) if cached is not None else []
+            if items:
+                return project_response(dict(cached, data=items[0]), projection)
+            batched = await profile_batcher.lookup(link)
+            if batched is not None:
+                if batch_key is not None:
+                    await response_cache.put_async(batch_key, "/profiles", dict(batched, data=[batched["data"]]))
+                return project_response(batched, projection)
+        
+        return await make_api_request_async("POST", "/person", payload, LINKEDIN_HEADERS, fields=projection)
     except Exception as e:
-        logger.error(f"Error in search_posts tool: {str(e)}")
+        logger.error(f"Error in person tool: {str(e)}")
         return {"error": str(e), "exception_type": type(e).__name__}
 
 # Tool: Person Updates
 @mcp.tool()
-def profile_updates(profile_url: str, page: int = 1, paginationToken: str = None) -> Dict:
+async def profile_updates(profile_url: str, page: int = 1, paginationToken: str = None,
+                          auto_paginate: bool = False, max_items: int = 100, since: str = None, offset: int = 0,
+                          ctx: Context = None) -> Dict:
     """Scrapes updates posted by a linkedin user
 
     NOTE: API doc specifies profile_url and page as required GET parameters.
@@ -446,23 +878,32 @@ def profile_updates(profile_url: str, page: int = 1, paginationToken: str = None
     - profile_url: LinkedIn profile URL (paramType: STRING, required) (e.g., "http://www.linkedin.com/in/ingmar-klein")
     - page: Page number (paramType: NUMBER, required) (e.g., 1)
     - paginationToken: For pagination (paramType: STRING, optional)
+
+    Auto-pagination (auto_paginate=true) follows page/paginationToken internally and returns
+    every item under "data", stopping at max_items, at the first item older than since
+    (ISO-8601 date or epoch), or on the last page. Progress is reported after each page;
+    passing the returned page/paginationToken/offset back resumes right after the last item returned.
     """
     try:
+        profile_url = canonical_link(profile_url)
+        if auto_paginate:
+            return await _paginate_feed("/profile_updates", {"profile_url": profile_url}, int(page),
+                                        paginationToken, int(offset), max_items, since, ctx)
+        
         params = {"profile_url": profile_url, "page": page}
         if paginationToken:
             params["paginationToken"] = paginationToken
 
-        # Construct query string with URL encoding
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        
-        return make_api_request("GET", f"/profile_updates?{query_string}", None, LINKEDIN_HEADERS)
+        return await make_api_request_async("GET", with_query("/profile_updates", params), None, LINKEDIN_HEADERS)
     except Exception as e:
         logger.error(f"Error in profile_updates tool: {str(e)}")
         return {"error": str(e), "exception_type": type(e).__name__}
 
 # Tool: Person comments from recent activity
 @mcp.tool()
-def comments_from_recent_activity(profile_url: str, page: int = 1, paginationToken: str = None) -> Dict:
+async def comments_from_recent_activity(profile_url: str, page: int = 1, paginationToken: str = None,
+                                        auto_paginate: bool = False, max_items: int = 100, since: str = None, offset: int = 0,
+                                        ctx: Context = None) -> Dict:
     """Scrapes comments posted by a person as per his recent activity
 
     NOTE: API doc specifies profile_url and page as required GET parameters.
@@ -471,23 +912,32 @@ def comments_from_recent_activity(profile_url: str, page: int = 1, paginationTok
     - profile_url: LinkedIn profile URL (paramType: STRING, required) (e.g., "http://www.linkedin.com/in/ingmar-klein")
     - page: Page number (paramType: NUMBER, required) (e.g., 1)
     - paginationToken: For pagination (paramType: STRING, optional)
+
+    Auto-pagination (auto_paginate=true) follows page/paginationToken internally and returns
+    every item under "data", stopping at max_items, at the first item older than since
+    (ISO-8601 date or epoch), or on the last page. Progress is reported after each page;
+    passing the returned page/paginationToken/offset back resumes right after the last item returned.
     """
     try:
+        profile_url = canonical_link(profile_url)
+        if auto_paginate:
+            return await _paginate_feed("/comments_from_recent_activity", {"profile_url": profile_url}, int(page),
+                                        paginationToken, int(offset), max_items, since, ctx)
+        
         params = {"profile_url": profile_url, "page": page}
         if paginationToken:
             params["paginationToken"] = paginationToken
             
-        # Construct query string with URL encoding
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-
-        return make_api_request("GET", f"/comments_from_recent_activity?{query_string}", None, LINKEDIN_HEADERS)
+        return await make_api_request_async("GET", with_query("/comments_from_recent_activity", params), None, LINKEDIN_HEADERS)
     except Exception as e:
         logger.error(f"Error in comments_from_recent_activity tool: {str(e)}")
         return {"error": str(e), "exception_type": type(e).__name__}
 
 # Tool: Company Updates
 @mcp.tool()
-def company_updates(company_url: str, page: str = "1", paginationToken: str = None) -> Dict:
+async def company_updates(company_url: str, page: str = "1", paginationToken: str = None,
+                          auto_paginate: bool = False, max_items: int = 100, since: str = None, offset: int = 0,
+                          ctx: Context = None) -> Dict:
     """Scrapes updates of a given company
 
     NOTE: API doc specifies company_url and page as required GET parameters.
@@ -496,731 +946,106 @@ def company_updates(company_url: str, page: str = "1", paginationToken: str = No
     - company_url: LinkedIn company URL (paramType: STRING, required) (e.g., "https://www.linkedin.com/company/google")
     - page: Page number (paramType: STRING, required) (e.g., "1")
     - paginationToken: For pagination (paramType: STRING, optional)
+
+    Auto-pagination (auto_paginate=true) follows page/paginationToken internally and returns
+    every item under "data", stopping at max_items, at the first item older than since
+    (ISO-8601 date or epoch), or on the last page. Progress is reported after each page;
+    passing the returned page/paginationToken/offset back resumes right after the last item returned.
     """
     try:
+        company_url = canonical_link(company_url)
+        if auto_paginate:
+            return await _paginate_feed("/company_updates", {"company_url": company_url}, int(page),
+                                        paginationToken, int(offset), max_items, since, ctx)
+        
         params = {"company_url": company_url, "page": page}
         if paginationToken:
             params["paginationToken"] = paginationToken
             
-        # Construct query string with URL encoding
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        
-        return make_api_request("GET", f"/company_updates?{query_string}", None, LINKEDIN_HEADERS)
+        return await make_api_request_async("GET", with_query("/company_updates", params), None, LINKEDIN_HEADERS)
     except Exception as e:
         logger.error(f"Error in company_updates tool: {str(e)}")
         return {"error": str(e), "exception_type": type(e).__name__}
 
-# Tool: Company Employee Count
+# Tool: Harvest Post Engagement
 @mcp.tool()
-def company_employee_count_per_skill(keyword: str, company_url: str) -> Dict:
-    """Get employee count with specific skill at a company
+async def harvest_engagement(post: str, max_per_type: int = 1000, ctx: Context = None) -> Dict:
+    """Collects everyone who reacted to, commented on or reposted a post in one call
 
-    NOTE: API doc example uses camelCase 'companyUrl' in the request body.
+    Walks the post_reactions, post_comments and post_reposts feeds in parallel, following
+    their pagination to the end (or max_per_type items each), and returns the people
+    deduplicated across all three with what each of them did.
     
-    Request Body Example:
-    {
-        "keyword": "java",
-        "companyUrl": "https://www.linkedin.com/company/google"
-    }
+    Parameters:
+    - post: Post URN or link (e.g., "urn:li:activity:7219434359085252608" or
+      "https://www.linkedin.com/feed/update/urn:li:activity:7219434359085252608")
+    - max_per_type: Maximum reactions, comments and reposts to read each (e.g., 1000)
     """
     try:
-        payload = json.dumps({
-            "keyword": keyword,
-            "companyUrl": company_url
-        })
-        return make_api_request("POST", "/company_employee_count_per_skill", payload, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in company_employee_count_per_skill tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: School Alumni Count
-@mcp.tool()
-def school_alumini_count_per_skill(keyword: str, schoolUrl: str, skillExplicits: str = None) -> Dict:
-    """Returns alumni count of a school/university
-    NOTE: API doc example uses camelCase 'schoolUrl' in the request body.
-    NOTE: This tool failed during testing with 400 Bad Request.
-    
-    Request Body Example:
-    {
-        "keyword": "",
-        "schoolUrl": "https://www.linkedin.com/school/abertay-university",
-        "skillExplicits": "260"
-    }
-    """
-    try:
-        payload = {
-            "keyword": keyword,
-            "schoolUrl": schoolUrl
-        }
+        urn = activity_urn(canonical_link(post))
         
-        if skillExplicits:
-            payload["skillExplicits"] = skillExplicits
-            
-        return make_api_request("POST", "/school_alumini_count_per_skill", json.dumps(payload), LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in school_alumini_count_per_skill tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Company Employee
-@mcp.tool()
-def company_employee(company_id: str, page: int = 1) -> Dict:
-    """Scrapes 12 people from a company (People Tab)
-
-    NOTE: API doc specifies company_id and page as required GET parameters.
-    NOTE: This tool failed persistently during testing (status 400, error: Couldn't recognize the parameter keys provided), unable to recognize parameters even when matching doc.
-    
-    Get Request Parameters:
-    - company_id: LinkedIn company ID (paramType: STRING, required) (e.g., "1441" for Google)
-    - page: Page number (paramType: NUMBER, required) (e.g., 1)
-    """
-    try:
-        params = {"companyId": company_id, "page": page}
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/company_employee?{query_string}", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in company_employee tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Post Reactions
-@mcp.tool()
-def post_reactions(reactions_urn: str, pagination_token: str = None) -> Dict:
-    """Data of the people who reacted to a particular post
-
-    NOTE: Obtain 'reactionsUrn' from 'Company Updates' or 'Profile Updates' endpoints.
-    
-    Get Request Parameters:
-    - reactionsUrn: URN for the post reactions (paramType: STRING, required) (e.g., "urn:li:activity:7219434359085252608/reactions")
-    - paginationToken: For pagination (paramType: STRING, optional)
-    """
-    try:
-        params = {"reactions_urn": reactions_urn}
-        if pagination_token:
-            params["pagination_token"] = pagination_token
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/post_reactions?{query_string}", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in post_reactions tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Post Comments
-@mcp.tool()
-def post_comments(comments_urn: str, pagination_token: str = None) -> Dict:
-    """Scrapes all commenters data who commented below a post
-
-    NOTE: Obtain 'commentsUrn' from 'Company Updates' or 'Profile Updates' endpoints.
-
-    Get Request Parameters:
-    - commentsUrn: URN for the post comments (paramType: STRING, required) (e.g., "urn:li:activity:7219434359085252608/comments")
-    - paginationToken: For pagination (paramType: STRING, optional)
-    """
-    try:
-        params = {"comments_urn": comments_urn}
-        if pagination_token:
-            params["pagination_token"] = pagination_token
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/post_comments?{query_string}", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in post_comments tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Post Reposts
-@mcp.tool()
-def post_reposts(reposts_urn: str, pagination_token: str = None) -> Dict:
-    """Scrapes all Reposters data who reposted a post
-
-    NOTE: Obtain 'repostsUrn' from 'Company Updates' or 'Profile Updates' endpoints.
-    
-    Get Request Parameters:
-    - repostsUrn: URN for the post reposts (paramType: STRING, required) (e.g., "urn:li:activity:7219434359085252608/reposts")
-    - paginationToken: For pagination (paramType: STRING, optional)
-    """
-    try:
-        params = {"reposts_urn": reposts_urn}
-        if pagination_token:
-            params["pagination_token"] = pagination_token
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/post_reposts?{query_string}", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in post_reposts tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Search Posts With Filters
-@mcp.tool()
-def search_posts_with_filters(query: str = None, sort_by: str = None, from_member: str = None, 
-                              from_organization: str = None, author_job_title: str = None,
-                              author_company: str = None, content_type: str = None,
-                              mentions_organization: str = None, author_industry: str = None,
-                              mentions_member: str = None, page: str = "1") -> Dict:
-    """Search for posts as per linkedin using all the available filters
-
-    NOTE: API doc shows this endpoint uses different parameter names than previously implemented.
-    
-    Get Request Parameters:
-    - query: Search term (paramType: STRING, optional) (e.g., "Top 10")
-    - sort_by: Sorting option (paramType: STRING, optional)
-    - from_member: Filter by member (paramType: STRING, optional)
-    - from_organization: Filter by organization (paramType: STRING, optional)
-    - author_job_title: Filter by author's job title (paramType: STRING, optional)
-    - author_company: Filter by author's company (paramType: STRING, optional)
-    - content_type: Filter by content type (paramType: STRING, optional)
-    - mentions_organization: Filter by mentioned organization (paramType: STRING, optional)
-    - author_industry: Filter by author's industry (paramType: STRING, optional)
-    - mentions_member: Filter by mentioned member (paramType: STRING, optional)
-    - page: Page number (paramType: STRING, optional) (e.g., "1")
-    """
-    try:
-        params = {}
+        def stream(route: str, urn_param: str, suffix: str):
+            async def fetch_page(page: int, token: Optional[str]) -> Dict[str, Any]:
+                params = {urn_param: f"{urn}/{suffix}", "page": page}
+                if token:
+                    params["pagination_token"] = token
+                return await make_api_request_async("GET", with_query(route, params), None, LINKEDIN_HEADERS)
+            return fetch_page
         
-        if query:
-            params["query"] = query
-        if sort_by:
-            params["sort_by"] = sort_by
-        if from_member:
-            params["from_member"] = from_member
-        if from_organization:
-            params["from_organization"] = from_organization
-        if author_job_title:
-            params["author_job_title"] = author_job_title
-        if author_company:
-            params["author_company"] = author_company
-        if content_type:
-            params["content_type"] = content_type
-        if mentions_organization:
-            params["mentions_organization"] = mentions_organization
-        if author_industry:
-            params["author_industry"] = author_industry
-        if mentions_member:
-            params["mentions_member"] = mentions_member
-        if page:
-            params["page"] = page
-            
-        # Convert params to query string with URL encoding
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/search_posts_with_filters?{query_string}", headers=LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in search_posts_with_filters tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Search Jobs
-@mcp.tool()
-def search_jobs(query: str, page: str = "1", searchLocationId: str = None, experience: str = None,
-               postedAgo: str = None, locationIdsList: str = None, sortBy: str = None,
-               titleIdsList: str = None, workplaceType: str = None, functionIdsList: str = None,
-               industryIdsList: str = None, jobType: str = None, companyIdsList: str = None,
-               easyApply: str = None) -> Dict:
-    """Search for jobs with filters as per linkedin
-
-    NOTE: API doc shows this endpoint uses different parameter names than previously implemented.
-    
-    Get Request Parameters:
-    - query: Job search keywords (paramType: STRING, required) (e.g., "software engineer")
-    - page: Page number (paramType: STRING, required) (e.g., "1")
-    - searchLocationId: Location ID (paramType: STRING, optional) (e.g., "Europe")
-    - experience: Experience level (paramType: STRING, optional)
-    - postedAgo: Filter by post date (paramType: STRING, optional)
-    - locationIdsList: List of location IDs (paramType: STRING, optional)
-    - sortBy: Sort results by (paramType: STRING, optional)
-    - titleIdsList: List of job title IDs (paramType: STRING, optional)
-    - workplaceType: Type of workplace (paramType: STRING, optional)
-    - functionIdsList: List of function IDs (paramType: STRING, optional)
-    - industryIdsList: List of industry IDs (paramType: STRING, optional)
-    - jobType: Type of job (paramType: STRING, optional)
-    - companyIdsList: List of company IDs (paramType: STRING, optional)
-    - easyApply: Filter for easy apply jobs (paramType: STRING, optional)
-    """
-    try:
-        params = {"query": query, "page": page}
+        fetch_reposts = stream("/post_reposts", "reposts_urn", "reposts")
+        use_original = {"reposts": False}
         
-        if searchLocationId:
-            params["searchLocationId"] = searchLocationId
-        if experience:
-            params["experience"] = experience
-        if postedAgo:
-            params["postedAgo"] = postedAgo
-        if locationIdsList:
-            params["locationIdsList"] = locationIdsList
-        if sortBy:
-            params["sortBy"] = sortBy
-        if titleIdsList:
-            params["titleIdsList"] = titleIdsList
-        if workplaceType:
-            params["workplaceType"] = workplaceType
-        if functionIdsList:
-            params["functionIdsList"] = functionIdsList
-        if industryIdsList:
-            params["industryIdsList"] = industryIdsList
-        if jobType:
-            params["jobType"] = jobType
-        if companyIdsList:
-            params["companyIdsList"] = companyIdsList
-        if easyApply:
-            params["easyApply"] = easyApply
-            
-        # Convert params to query string with URL encoding
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/search_jobs?{query_string}", headers=LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in search_jobs tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Job Details
-@mcp.tool()
-def job_details(job_id: str) -> Dict:
-    """Get detailed information about a specific job
-    
-    Get Request Parameters:
-    - jobId: LinkedIn job ID (paramType: STRING, required) (e.g., "3862806121" - obtain from search results)
-    """
-    try:
-        params = {"jobId": job_id}
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/job_details?{query_string}", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in job_details tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Similar Profiles
-@mcp.tool()
-def similar_profiles(profileUrl: str) -> Dict:
-    """Returns similar profiles to a given linkedin profile url
-    
-    Get Request Parameters:
-    - profileUrl: LinkedIn profile URL (paramType: STRING, required) (e.g., "https://www.linkedin.com/in/williamhgates/")
-    """
-    try:
-        params = {"profileUrl": profileUrl}
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/similar_profiles?{query_string}", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in similar_profiles tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Suggestion Location
-@mcp.tool()
-def suggestion_location(query: str) -> Dict:
-    """Suggestions per query
-    
-    Get Request Parameters:
-    - query: Search query (paramType: STRING, required) (e.g., "California")
-    """
-    try:
-        params = {"query": query}
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/suggestion_location?{query_string}", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in suggestion_location tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Suggestion Company
-@mcp.tool()
-def suggestion_company(query: str) -> Dict:
-    """Suggestions per query
-    
-    Get Request Parameters:
-    - query: Search query (paramType: STRING, required) (e.g., "Google")
-    """
-    try:
-        params = {"query": query}
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/suggestion_company?{query_string}", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in suggestion_company tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Suggestion School
-@mcp.tool()
-def suggestion_school(query: str) -> Dict:
-    """Suggestions per query
-    
-    Get Request Parameters:
-    - query: Search query (paramType: STRING, required) (e.g., "Stanford")
-    """
-    try:
-        params = {"query": query}
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/suggestion_school?{query_string}", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in suggestion_school tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Suggestion Industry
-@mcp.tool()
-def suggestion_industry(query: str) -> Dict:
-    """Suggestions per query
-    
-    Get Request Parameters:
-    - query: Search query (paramType: STRING, required) (e.g., "Technology")
-    """
-    try:
-        params = {"query": query}
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/suggestion_industry?{query_string}", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in suggestion_industry tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Suggestion Service Category
-@mcp.tool()
-def suggestion_service_catagory(query: str) -> Dict:
-    """Suggestions as per query
-    
-    Get Request Parameters:
-    - query: Search query (paramType: STRING, required) (e.g., "Consulting")
-    """
-    try:
-        params = {"query": query}
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/suggestion_service_catagory?{query_string}", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in suggestion_service_catagory tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Suggestion Person
-@mcp.tool()
-def suggestion_person(query: str) -> Dict:
-    """Returns a list of people suggestion from linkedin.
-    
-    Get Request Parameters:
-    - query: Search query (paramType: STRING, required) (e.g., "Bill Gates")
-    """
-    try:
-        params = {"query": query}
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/suggestion_person?{query_string}", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in suggestion_person tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Search Geo URNs
-@mcp.tool()
-def search_geourns(keyword: str) -> Dict:
-    """Suggestions per query
-
-    NOTE: Failed during testing when keyword contained spaces (e.g., "New York"). Needs URL encoding or API fix.
-    
-    Get Request Parameters:
-    - keyword: Search keyword (paramType: STRING, required) (e.g., "California", avoid spaces)
-    """
-    try:
-        params = {"keyword": keyword}
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/search_geourns?{query_string}", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in search_geourns tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Suggestion Function
-@mcp.tool()
-def suggestion_function(query: str = None) -> Dict:
-    """Gets suggestions for Job Function
-    
-    Get Request Parameters:
-    - query: Search query (paramType: STRING, optional) (e.g., "Engineering")
-    """
-    try:
-        params = {}
-        if query:
-            params["query"] = query
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/suggestion_function?{query_string}", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in suggestion_function tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Suggestion Company Size
-@mcp.tool()
-def suggestion_company_size() -> Dict:
-    """Suggestions for company size filter
-    """
-    try:
-        return make_api_request("GET", "/suggestion_company_size", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in suggestion_company_size tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Suggestion Language
-@mcp.tool()
-def suggestion_language() -> Dict:
-    """Suggestions for language filter
-    """
-    try:
-        return make_api_request("GET", "/suggestion_language", None, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in suggestion_language tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Private David
-@mcp.tool()
-def profiles_david(links: List[str]) -> Dict:
-    """Scrape 100 profiles in a single API call
-
-    NOTE: Marked as private/premium in documentation.
-    
-    Request Body Example:
-    {
-        "links": [
-            "http://www.linkedin.com/in/luke-sharp-b3838719a",
-            "http://www.linkedin.com/in/hollie-smith-96ab44b5"
-        ]
-    }
-    """
-    try:
-        payload = json.dumps({"links": links})
-        return make_api_request("POST", "/profiles_david", payload, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in profiles_david tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Private Skander
-@mcp.tool()
-def private_chtiouisk(links: List[str], count: int = 5) -> Dict:
-    """This is a private endpoint for our premium user
-
-    NOTE: Marked as private/premium in documentation.
-    
-    Request Body Example:
-    {
-        "links": [
-            "http://www.linkedin.com/in/luke-sharp-b3838719a",
-            "http://www.linkedin.com/in/rodneydbainjr"
-        ],
-        "count": 5
-    }
-    """
-    try:
-        payload = json.dumps({"links": links, "count": count})
-        return make_api_request("POST", "/private_chtiouisk", payload, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in private_chtiouisk tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Person Data With Open To Work Flag
-@mcp.tool()
-def person_data_with_open_to_work_flag(link: str) -> Dict:
-    """Scrapes person data with open to work flag
-    
-    Request Body Example:
-    {
-        "link": "https://www.linkedin.com/in/ingmar-klein"
-    }
-    """
-    try:
-        payload = json.dumps({"link": link})
-        return make_api_request("POST", "/person_data_with_open_to_work_flag", payload, LINKEDIN_HEADERS)
-    except Exception as e:
-        logger.error(f"Error in person_data_with_open_to_work_flag tool: {str(e)}")
-        return {"error": str(e), "exception_type": type(e).__name__}
-
-# Tool: Private Search Posts with Filters
-@mcp.tool()
-def original_search_posts_with_filters(query: str = None, author_company: str = None, author_job_title: str = None, 
-                                author_industry: str = None, from_member: str = None, from_organization: str = None, 
-                                mentions_member: str = None, mentions_organization: str = None, content_type: str = None, 
-                                sort_by: str = None, page: str = None) -> Dict:
-    """Search for posts as per linkedin using all the available filters
-
-    NOTE: Marked as private/premium in documentation.
-    
-    Get Request Parameters:
-    - query: Search query (paramType: STRING, optional)
-    - author_company: Filter by author's company (paramType: STRING, optional)
-    - author_job_title: Filter by author's job title (paramType: STRING, optional)
-    - author_industry: Filter by author's industry (paramType: STRING, optional)
-    - from_member: Filter by member (paramType: STRING, optional)
-    - from_organization: Filter by organization (paramType: STRING, optional)
-    - mentions_member: Filter by mentioned member (paramType: STRING, optional)
-    - mentions_organization: Filter by mentioned organization (paramType: STRING, optional)
-    - content_type: Filter by content type (paramType: STRING, optional)
-    - sort_by: Sort results by (paramType: STRING, optional)
-    - page: Page number (paramType: STRING, optional)
-    """
-    try:
-        # Build query parameters
-        params = {}
-        if query:
-            params["query"] = query
-        if author_company:
-            params["author_company"] = author_company
-        if author_job_title:
-            params["author_job_title"] = author_job_title
-        if author_industry:
-            params["author_industry"] = author_industry
-        if from_member:
-            params["from_member"] = from_member
-        if from_organization:
-            params["from_organization"] = from_organization
-        if mentions_member:
-            params["mentions_member"] = mentions_member
-        if mentions_organization:
-            params["mentions_organization"] = mentions_organization
-        if content_type:
-            params["content_type"] = content_type
-        if sort_by:
-            params["sort_by"] = sort_by
-        if page:
-            params["page"] = page
-            
-        # Convert params to query string with URL encoding
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        endpoint = "/original_search_posts_with_filters"
-        if query_string:
-            endpoint = f"{endpoint}?{query_string}"
-            
-        return make_api_request("GET", endpoint, None, LINKEDIN_HEADERS)
+        async def fetch_reposts_with_fallback(page: int, token: Optional[str]) -> Dict[str, Any]:
+            # post_reposts_original serves the same feed when post_reposts rejects the post
+            if not use_original["reposts"]:
+                result = await fetch_reposts(page, token)
+                if result.get("success") or page != 1:
+                    return result
+                use_original["reposts"] = True
+            params = {"repostsUrn": urn, "page": page}
+            return await make_api_request_async("GET", with_query("/post_reposts_original", params), None, LINKEDIN_HEADERS)
+        
+        async def report_progress(done: int) -> None:
+            if ctx is None:
+                return
+            try:
+                await ctx.report_progress(done, max_per_type * 3)
+            except ValueError:
+                # Called outside of an MCP request
+                pass
+        
+        result = await _harvest_engagement(
+            {
+                "reactions": stream("/post_reactions", "reactions_urn", "reactions"),
+                "comments": stream("/post_comments", "comments_urn", "comments"),
+                "reposts": fetch_reposts_with_fallback
+            },
+            max_per_type=max_per_type,
+            max_pages=LINKEDIN_MAX_PAGES,
+            on_progress=report_progress
+        )
+        result["post"] = urn
+        return result
     except Exception as e:
-        logger.error(f"Error in original_search_posts_with_filters tool: {str(e)}")
+        logger.error(f"Error in harvest_engagement tool: {str(e)}")
         return {"error": str(e), "exception_type": type(e).__name__}
 
-# Tool: Private Company Insights 2
+# Tool: Metrics
 @mcp.tool()
-def private_company_insights_2(link: str) -> Dict:
-    """Private endpoint to scrapes company insights
-
-    NOTE: Marked as private/premium in documentation.
+async def dump_metrics(format: str = "json") -> Dict:
+    """Returns this server's metrics: upstream latency per route, status and error counts, retries,
+    bytes in/out, cache use, and latency/outcome per tool.
     
-    Get Request Parameters:
-    - link: Company LinkedIn URL (paramType: STRING, required)
+    Args:
+        format: "json" for summaries with p50/p95/p99 estimates, or "prometheus" for the text exposition format
     """
     try:
-        params = {"link": link}
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        return make_api_request("GET", f"/private_company_insights_2?{query_string}", None, LINKEDIN_HEADERS)
+        if format == "prometheus":
+            return {"success": True, "status": 200, "data": metrics.registry.render()}
+        return {"success": True, "status": 200, "data": metrics.registry.snapshot()}
     except Exception as e:
-        logger.error(f"Error in private_company_insights_2 tool: {str(e)}")
+        logger.error(f"Error in dump_metrics tool: {str(e)}")
         return {"error": str(e), "exception_type": type(e).__name__}
 
-# Tool: Post Reposts Original
-@mcp.tool()
-def post_reposts_original(repostsUrn: str, page: str) -> Dict:
-    """Private
-
-    NOTE: Marked as private/premium in documentation.
-    
-    Get Request Parameters:
-    - repostsUrn: URN for the post reposts (paramType: STRING, required)
-    - page: Page number (paramType: STRING, required)
-    """
-    conn = http.client.HTTPSConnection(LINKEDIN_API_HOST)
-    headers = LINKEDIN_HEADERS.copy()
-    
-    # Build query parameters
-    params = f"?repostsUrn={repostsUrn}&page={page}"
-    conn.request("GET", f"/post_reposts_original{params}", headers=headers)
-    response = conn.getresponse()
-    data = response.read()
-    return json.loads(data.decode("utf-8"))
-
-# Tool: Profile Updates Original
-@mcp.tool()
-def profile_updates_original(profile_url: str, page: str) -> Dict:
-    """Private
-
-    NOTE: Marked as private/premium in documentation.
-    
-    Get Request Parameters:
-    - profile_url: LinkedIn profile URL (paramType: STRING, required)
-    - page: Page number (paramType: STRING, required)
-    """
-    conn = http.client.HTTPSConnection(LINKEDIN_API_HOST)
-    headers = LINKEDIN_HEADERS.copy()
-    
-    # Build query parameters
-    params = f"?profile_url={profile_url}&page={page}"
-    conn.request("GET", f"/profile_updates_original{params}", headers=headers)
-    response = conn.getresponse()
-    data = response.read()
-    return json.loads(data.decode("utf-8"))
-
-# Tool: Company Updates Original
-@mcp.tool()
-def company_updates_original(company_url: str, page: int) -> Dict:
-    """Original data
-
-    NOTE: Marked as private/premium in documentation.
-    
-    Get Request Parameters:
-    - company_url: LinkedIn company URL (paramType: STRING, required)
-    - page: Page number (paramType: STRING, required)
-    """
-    conn = http.client.HTTPSConnection(LINKEDIN_API_HOST)
-    headers = LINKEDIN_HEADERS.copy()
-    
-    # Build query parameters
-    params = f"?company_url={company_url}&page={page}"
-    conn.request("GET", f"/company_updates_original{params}", headers=headers)
-    response = conn.getresponse()
-    data = response.read()
-    return json.loads(data.decode("utf-8"))
-
-# Tool: All posts from a profile
-@mcp.tool()
-def profile_posts_all(link: str) -> Dict:
-    """This endpoint scrapes all posts posted by a user at linkedin.com since joined.
-
-    NOTE: Marked as private/premium in documentation.
-    
-    Request Body Example:
-    {
-        "link": "https://www.linkedin.com/in/ingmar-klein"
-    }
-    """
-    conn = http.client.HTTPSConnection(LINKEDIN_API_HOST)
-    payload = json.dumps({"link": link})
-    conn.request("POST", "/profile_posts_all", payload, LINKEDIN_HEADERS)
-    response = conn.getresponse()
-    data = response.read()
-    return json.loads(data.decode("utf-8"))
-
-# Tool: Person Data With All Experiences
-@mcp.tool()
-def person_data_with_experiences(link: str) -> Dict:
-    """Scrapes all linkedin profile data alongwith all the experiences.
-    
-    Request Body Example:
-    {
-        "link": "https://www.linkedin.com/in/ingmar-klein"
-    }
-    """
-    conn = http.client.HTTPSConnection(LINKEDIN_API_HOST)
-    payload = json.dumps({"link": link})
-    conn.request("POST", "/person_data_with_experiences", payload, LINKEDIN_HEADERS)
-    response = conn.getresponse()
-    data = response.read()
-    return json.loads(data.decode("utf-8"))
-
-# Tool: Person Data With All Languages
-@mcp.tool()
-def person_data_with_languages(link: str) -> Dict:
-    """Scrapers person data with all languages data
-    
-    Request Body Example:
-    {
-        "link": "https://www.linkedin.com/in/matiss-brunavs/"
-    }
-    """
-    conn = http.client.HTTPSConnection(LINKEDIN_API_HOST)
-    payload = json.dumps({"link": link})
-    conn.request("POST", "/person_data_with_languages", payload, LINKEDIN_HEADERS)
-    response = conn.getresponse()
-    data = response.read()
-    return json.loads(data.decode("utf-8"))
-
-# Tool: Person Data With All Educations
-@mcp.tool()
-def person_data_with_educations(link: str) -> Dict:
-    """Scrapers person data along with all the educations data.
-    
-    Request Body Example:
-    {
-        "link": "https://www.linkedin.com/in/ingmar-klein"
-    }
-    """
-    conn = http.client.HTTPSConnection(LINKEDIN_API_HOST)
-    payload = json.dumps({"link": link})
-    conn.request("POST", "/person_data_with_educations", payload, LINKEDIN_HEADERS)
-    response = conn.getresponse()
-    data = response.read()
-    return json.loads(data.decode("utf-8"))
-
 if __name__ == "__main__":
     mcp.run()
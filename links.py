@@ -0,0 +1,65 @@
+import functools
+import re
+from urllib.parse import quote, unquote
+
+# One pass over the input: optional scheme and subdomain (www, m, country), then the entity kind and its id
+_LINK = re.compile(
+    r"(?:https?://)?(?:[\w-]+\.)?linkedin\.com/"
+    r"(?:(in|company|school|showcase)/([^/?#\s]+)|posts/([^/?#\s]+)|feed/update/(urn:li:\w+:[^/?#\s]+))",
+    re.IGNORECASE)
+_URN = re.compile(r"urn:li:(\w+):([^/?#\s]+)(.*)", re.IGNORECASE | re.DOTALL)
+
+# Member ids (/in/ACoAA...) are case-sensitive, unlike vanity names
+_MEMBER_ID = re.compile(r"AC[\w-]{20,}")
+# Ids needing no percent-encoding either way, the common case
+_PLAIN_ID = re.compile(r"[A-Za-z0-9._~-]+")
+
+# URN types whose canonical spelling is not all lowercase
+_URN_TYPES = {"ugcpost": "ugcPost", "fs_miniprofile": "fs_miniProfile"}
+
+CANONICAL_HOST = "https://www.linkedin.com"
+
+
+def _urn(kind: str, rest: str) -> str:
+    kind = kind.lower()
+    return f"urn:li:{_URN_TYPES.get(kind, kind)}:{rest}"
+
+
+@functools.lru_cache(maxsize=65536)
+def canonical_link(link: str) -> str:
+    """
+    Rewrites a LinkedIn link or URN into the one spelling used for requests,
+    cache keys and deduplication.
+
+    Profile, company, school and showcase links become
+    ``https://www.linkedin.com/<kind>/<id>``:
+    - scheme, subdomain, trailing path, query string and fragment are dropped
+    - the id is lowercased, except case-sensitive member ids (``/in/ACoAA...``)
+    - the id is percent-encoded exactly once
+
+    Post links keep their case-sensitive slug. Feed links and bare URNs get a
+    lowercase ``urn:li:`` prefix and the canonical type spelling
+    (``urn:li:ugcPost:...``). Anything else comes back stripped of
+    surrounding whitespace only.
+
+    Examples:
+        "http://LinkedIn.com/in/Ingmar-Klein/?trk=x" -> "https://www.linkedin.com/in/ingmar-klein"
+        "URN:LI:Activity:7219434359085252608" -> "urn:li:activity:7219434359085252608"
+    """
+    link = link.strip()
+    match = _LINK.match(link)
+    if match is None:
+        urn = _URN.match(link)
+        return _urn(urn.group(1), urn.group(2)) + urn.group(3) if urn else link
+    kind, slug, post, feed_urn = match.groups()
+    if kind is not None:
+        plain = _PLAIN_ID.fullmatch(slug) is not None
+        if not plain:
+            slug = unquote(slug)
+        if not _MEMBER_ID.fullmatch(slug):
+            slug = slug.lower()
+        return f"{CANONICAL_HOST}/{kind.lower()}/{slug if plain else quote(slug, safe='-_.~')}"
+    if post is not None:
+        return f"{CANONICAL_HOST}/posts/{post}"
+    urn = _URN.match(feed_urn)
+    return f"{CANONICAL_HOST}/feed/update/{_urn(urn.group(1), urn.group(2))}"
@@ -0,0 +1,179 @@
+import logging
+import logging.handlers
+import queue
+import random
+import socket
+import threading
+import time
+from typing import Dict, List, Optional
+
+import metrics
+
+# Records this module logs about itself go to the console only, never back into the shipping queue
+logger = logging.getLogger('linkedin_api_tools.logshipping')
+
+LOG_RECORDS_SHIPPED = metrics.registry.counter(
+    "linkedin_log_records_shipped_total", "Log records delivered to the remote log host")
+LOG_RECORDS_DROPPED = metrics.registry.counter(
+    "linkedin_log_records_dropped_total", "Log records dropped before reaching the remote log host", ("reason",))
+LOG_RECONNECTS = metrics.registry.counter(
+    "linkedin_log_reconnects_total", "Connection attempts to the remote log host", ("outcome",))
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that never blocks the logging call.
+
+    When the bounded queue is full the record is dropped and counted, instead
+    of QueueHandler's default of reporting the queue.Full through handleError.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            LOG_RECORDS_DROPPED.inc(reason="queue_full")
+
+
+class LogShipper(threading.Thread):
+    """
+    Background thread sending queued log records to a remote SocketHandler receiver.
+
+    Records are taken off the queue in batches of up to ``batch_size`` (waiting
+    at most ``flush_interval`` seconds to fill one) and written with a single
+    send, in the length-prefixed pickle framing of logging.handlers.SocketHandler,
+    so existing receivers keep working. While the host is unreachable the batch
+    in hand is kept and reconnects back off exponentially with jitter, from
+    ``retry_initial`` up to ``retry_max`` seconds; the bounded queue absorbs
+    new records meanwhile and drops the overflow.
+
+    Args:
+        log_queue: Queue filled by a BoundedQueueHandler
+        host: Remote log host
+        port: Remote log port
+        batch_size: Most records per send
+        flush_interval: Longest a record waits for its batch to fill, in seconds
+        connect_timeout: Timeout for connecting and sending, in seconds
+        retry_initial: First reconnect delay, in seconds
+        retry_max: Largest reconnect delay, in seconds
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]", host: str, port: int, batch_size: int = 200,
+                 flush_interval: float = 1.0, connect_timeout: float = 5.0, retry_initial: float = 1.0,
+                 retry_max: float = 60.0):
+        super().__init__(name="log-shipper", daemon=True)
+        self.queue = log_queue
+        self.host = host
+        self.port = port
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.connect_timeout = connect_timeout
+        self.retry_initial = retry_initial
+        self.retry_max = retry_max
+        # Only used for its pickling; it never opens a socket of its own
+        self._framer = logging.handlers.SocketHandler(host, port)
+        self._sock: Optional[socket.socket] = None
+        self._retry_delay = retry_initial
+        self._stopping = threading.Event()
+        self._stats = {"shipped": 0, "batches": 0, "send_failures": 0, "reconnects": 0}
+
+    def _next_batch(self, batch: List[logging.LogRecord]) -> List[logging.LogRecord]:
+        """Tops the batch up from the queue, waiting up to flush_interval for the first new record."""
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                if batch and timeout <= 0:
+                    batch.append(self.queue.get_nowait())
+                else:
+                    batch.append(self.queue.get(timeout=max(timeout, 0.01)))
+            except queue.Empty:
+                break
+        return batch
+
+    def _connect(self) -> bool:
+        try:
+            self._sock = socket.create_connection((self.host, self.port), timeout=self.connect_timeout)
+        except OSError as e:
+            LOG_RECONNECTS.inc(outcome="failed")
+            logger.debug(f"Log host {self.host}:{self.port} unreachable: {str(e)}")
+            return False
+        LOG_RECONNECTS.inc(outcome="connected")
+        self._stats["reconnects"] += 1
+        self._retry_delay = self.retry_initial
+        return True
+
+    def _send(self, batch: List[logging.LogRecord]) -> bool:
+        if self._sock is None and not self._connect():
+            return False
+        try:
+            self._sock.sendall(b"".join(self._framer.makePickle(record) for record in batch))
+        except OSError:
+            self._stats["send_failures"] += 1
+            self._close()
+            return False
+        return True
+
+    def _close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+    def run(self) -> None:
+        batch: List[logging.LogRecord] = []
+        while not (self._stopping.is_set() and not batch and self.queue.empty()):
+            batch = self._next_batch(batch)
+            if not batch:
+                continue
+            if self._send(batch):
+                LOG_RECORDS_SHIPPED.inc(len(batch))
+                self._stats["shipped"] += len(batch)
+                self._stats["batches"] += 1
+                batch = []
+                continue
+            if self._stopping.is_set():
+                LOG_RECORDS_DROPPED.inc(len(batch), reason="shutdown")
+                break
+            # Keep the batch for the next attempt and back off with jitter
+            self._stopping.wait(random.uniform(self._retry_delay / 2, self._retry_delay))
+            self._retry_delay = min(self._retry_delay * 2, self.retry_max)
+        self._close()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flushes what is queued (if the host is reachable) and stops the thread."""
+        self._stopping.set()
+        self.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats, queued=self.queue.qsize(), connected=self._sock is not None)
+
+
+def start_remote_logging(target: logging.Logger, host: str, port: int, queue_size: int = 10000,
+                         batch_size: int = 200, flush_interval: float = 1.0) -> LogShipper:
+    """
+    Ships a logger's records to a remote log host without blocking the caller.
+
+    Args:
+        target: Logger whose records should be shipped
+        host: Remote log host
+        port: Remote log port
+        queue_size: Most records buffered while the host is slow or down
+        batch_size: Most records per send
+        flush_interval: Longest a record waits for its batch, in seconds
+
+    Returns:
+        The started LogShipper thread
+    """
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=queue_size)
+    target.addHandler(BoundedQueueHandler(log_queue))
+    shipper = LogShipper(log_queue, host, port, batch_size=batch_size, flush_interval=flush_interval)
+    shipper.start()
+    return shipper
@@ -1,12 +1,15 @@
 from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 import os
 import logging
-import logging.handlers
-import time
+import atexit
+import tempfile
 import traceback
-from starlette.middleware.base import BaseHTTPMiddleware
+from contextlib import asynccontextmanager
+from asgi_middleware import RequestTimingMiddleware
+from log_shipping import start_remote_logging
 
 # Configure logging
 # Basic console logging
@@ -18,51 +21,52 @@ logging.basicConfig(
 # Create logger
 logger = logging.getLogger('linkedin_mcp_server')
 
-# Add socket handler for remote logging to Aternos
-socket_handler = logging.handlers.SocketHandler(
-    host='mukulkathayat97.aternos.me',
-    port=19580
-)
-# Set formatter for socket handler
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-socket_handler.setFormatter(formatter)
-logger.addHandler(socket_handler)
+# Ship records to the remote log host (Aternos) from a background thread, so a slow
+# or unreachable host never blocks a request; set LOG_HOST empty to turn it off
+LOG_HOST = os.environ.get("LOG_HOST", "mukulkathayat97.aternos.me")
+LOG_PORT = int(os.environ.get("LOG_PORT", "19580"))
+LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", "10000"))
+LOG_BATCH_SIZE = int(os.environ.get("LOG_BATCH_SIZE", "200"))
+LOG_FLUSH_INTERVAL = float(os.environ.get("LOG_FLUSH_INTERVAL", "1.0"))
+
+log_shipper = None
+if LOG_HOST:
+    log_shipper = start_remote_logging(
+        logger, LOG_HOST, LOG_PORT,
+        queue_size=LOG_QUEUE_SIZE,
+        batch_size=LOG_BATCH_SIZE,
+        flush_interval=LOG_FLUSH_INTERVAL
+    )
+    atexit.register(log_shipper.stop)
 
 # Log startup message
 logger.info("LinkedIn MCP Server starting with remote logging configured")
 
+# Worker processes serving the app; above 1 they share cache, in-flight requests, rate limits and MCP
+# sessions through LINKEDIN_SHARED_STATE (a SQLite file in the temp directory unless set)
+LINKEDIN_WORKERS = int(os.environ.get("LINKEDIN_WORKERS", "1"))
+
 # Import your MCP server from linkedin_api_tools.py
-from linkedin_api_tools import mcp
+from linkedin_api_tools import mcp, circuit_breakers, key_pool, shared_state, single_flight
+from session_relay import SessionRelay
+import metrics
+
+session_relay = None
+
+# Relays MCP messages between workers while the app runs
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if session_relay is not None:
+        session_relay.start()
+    yield
+    if session_relay is not None:
+        await session_relay.stop()
 
 # Create FastAPI app
-app = FastAPI(title="LinkedIn MCP Server")
-
-# Add request logging middleware
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-        
-        # Log request details
-        logger.info(f"Request: {request.method} {request.url.path}")
-        
-        try:
-            # Process the request and get the response
-            response = await call_next(request)
-            
-            # Log response details
-            process_time = time.time() - start_time
-            logger.info(f"Response: {request.method} {request.url.path} - Status: {response.status_code} - Time: {process_time:.3f}s")
-            
-            return response
-        except Exception as e:
-            # Log any unhandled exceptions
-            logger.error(f"Unhandled exception in request: {request.method} {request.url.path}")
-            logger.error(f"Exception details: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            raise
-
-# Add the logging middleware
-app.add_middleware(LoggingMiddleware)
+app = FastAPI(title="LinkedIn MCP Server", lifespan=lifespan)
+
+# Add request logging middleware (pure ASGI, so the SSE stream is passed through as it is written)
+app.add_middleware(RequestTimingMiddleware, logger=logger)
 
 # Add CORS middleware with full access
 app.add_middleware(
@@ -73,8 +77,15 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
-# Mount the MCP server to the FastAPI app
-app.mount("/mcp", mcp.app)
+# Mount the MCP server's SSE transport under /mcp; the paths are set on the server
+# itself because the SSE endpoint advertises the message path to clients as is
+mcp.settings.sse_path = "/mcp/sse"
+mcp.settings.message_path = "/mcp/messages/"
+sse_routes = mcp.sse_app().routes
+# With shared state a client's messages may reach another worker than its SSE stream; the relay forwards them
+if shared_state is not None:
+    session_relay = SessionRelay.install(sse_routes, shared_state)
+app.router.routes.extend(sse_routes)
 
 # Add a simple health check endpoint
 @app.get("/")
@@ -82,6 +93,29 @@ async def root():
     logger.info("Health check endpoint called")
     return {"status": "LinkedIn MCP server is running"}
 
+# Circuit breaker state per upstream route
+@app.get("/circuit-breakers")
+async def circuit_breaker_status():
+    return circuit_breakers.snapshot()
+
+# Usage, load, quota and cooldown per API key of the pool (keys masked)
+@app.get("/api-keys")
+async def api_key_status():
+    return key_pool.snapshot()
+
+# What the workers share: backend, claims, reservations, relayed messages and the shared cache tier
+# (a plain def, so FastAPI queries the store from its threadpool rather than the event loop)
+@app.get("/shared-state")
+def shared_state_status():
+    if shared_state is None:
+        return {"enabled": False}
+    return dict(shared_state.stats(), enabled=True, worker_pid=os.getpid(), coalescing=single_flight.stats())
+
+# Prometheus metrics of upstream calls and tools
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    return PlainTextResponse(metrics.registry.render(), media_type="text/plain; version=0.0.4")
+
 # Add an error handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -94,4 +128,11 @@ async def global_exception_handler(request: Request, exc: Exception):
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
     logger.info(f"Starting LinkedIn MCP server on port {port}")
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    if LINKEDIN_WORKERS > 1:
+        # Workers import the app anew from their environment, so that is where the shared state goes
+        if not os.environ.get("LINKEDIN_SHARED_STATE"):
+            os.environ["LINKEDIN_SHARED_STATE"] = os.path.join(tempfile.gettempdir(), f"linkedin-mcp-{port}.db")
+        logger.info(f"Running {LINKEDIN_WORKERS} workers sharing {os.environ['LINKEDIN_SHARED_STATE']}")
+        uvicorn.run("main:app", host="0.0.0.0", port=port, workers=LINKEDIN_WORKERS)
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=port)
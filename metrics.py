@@ -0,0 +1,304 @@
+import asyncio
+import bisect
+import contextlib
+import functools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger('linkedin_api_tools.metrics')
+
+# Latency buckets in seconds, from cache hits to slow multi-attempt upstream calls
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base of the metric types: a name, help text and one series per label combination."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label combination."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}" for key, value in values
+        ]
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {",".join(key): value for key, value in sorted(self._values.items())}
+
+
+class Gauge(Counter):
+    """Value that goes up and down, e.g. requests in flight."""
+
+    type_name = "gauge"
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed cumulative buckets, with their sum and count."""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label combination: [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[LabelValues, List[Any]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, (list(counts), total, count)) for key, (counts, total, count) in self._series.items())
+        lines = self._header()
+        for key, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = _format_labels(self.label_names, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Count, mean and estimated p50/p95/p99 (upper bucket bounds) per label combination."""
+        with self._lock:
+            series = {key: (list(counts), total, count) for key, (counts, total, count) in self._series.items()}
+        result = {}
+        for key, (counts, total, count) in sorted(series.items()):
+            summary = {"count": count, "mean": round(total / count, 4) if count else 0.0}
+            for quantile in (0.5, 0.95, 0.99):
+                summary[f"p{int(quantile * 100)}"] = self._quantile(counts, count, quantile)
+            result[",".join(key)] = summary
+        return result
+
+    def _quantile(self, counts: List[int], count: int, quantile: float) -> Optional[float]:
+        if not count:
+            return None
+        target = quantile * count
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return bound if bound != float("inf") else self.buckets[-1]
+        return self.buckets[-1]
+
+
+class MetricsRegistry:
+    """Holds the metrics of the process and renders them in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labels))
+
+    def histogram(self, name: str, documentation: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All metrics as plain dictionaries keyed by comma-joined label values."""
+        return {name: metric.snapshot() for name, metric in list(self._metrics.items())}
+
+
+registry = MetricsRegistry()
+
+# Upstream API calls, one observation per attempt
+UPSTREAM_LATENCY = registry.histogram(
+    "linkedin_upstream_request_duration_seconds", "Duration of upstream API attempts", ("route", "method"))
+UPSTREAM_REQUESTS = registry.counter(
+    "linkedin_upstream_requests_total", "Upstream API attempts by response status", ("route", "status"))
+UPSTREAM_ERRORS = registry.counter(
+    "linkedin_upstream_errors_total", "Upstream API attempts that raised, by exception type", ("route", "exception_type"))
+UPSTREAM_RETRIES = registry.counter(
+    "linkedin_upstream_retries_total", "Upstream API attempts beyond the first of a call", ("route",))
+UPSTREAM_IN_FLIGHT = registry.gauge(
+    "linkedin_upstream_in_flight", "Upstream API attempts currently waiting for a response", ("route",))
+UPSTREAM_BYTES_OUT = registry.counter(
+    "linkedin_upstream_bytes_sent_total", "Request body bytes sent upstream", ("route",))
+UPSTREAM_BYTES_IN = registry.counter(
+    "linkedin_upstream_bytes_received_total", "Response body bytes received from upstream", ("route",))
+API_CALLS = registry.counter(
+    "linkedin_api_calls_total", "make_api_request calls by where the result came from (cache, stale, upstream)",
+    ("route", "source"))
+CACHE_REFRESHES = registry.counter(
+    "linkedin_cache_refreshes_total", "Background refreshes of stale cache entries by outcome", ("route", "outcome"))
+SUGGESTION_LOOKUPS = registry.counter(
+    "linkedin_suggestion_lookups_total", "Suggestion tool calls by how the local index answered (exact, prefix, miss)",
+    ("route", "outcome"))
+
+# Client-side rate limiting (rate_limiter.RateLimiter), one observation per reservation
+RATE_LIMIT_WAIT = registry.histogram(
+    "linkedin_rate_limit_wait_seconds", "Wait a rate-limit reservation was given before its upstream attempt", ("route",))
+RATE_LIMIT_DELAYED = registry.counter(
+    "linkedin_rate_limit_delayed_total", "Reservations that had to wait for a rate-limit slot", ("route",))
+RATE_LIMIT_REJECTED = registry.counter(
+    "linkedin_rate_limit_rejected_total", "Reservations refused because the wait would exceed the maximum", ("route",))
+
+# Request coalescing (coalescing.SingleFlight), one increment per caller
+COALESCING_LEADERS = registry.counter(
+    "linkedin_coalescing_leaders_total", "Requests performed by their first caller, with no identical one in flight")
+COALESCING_COALESCED = registry.counter(
+    "linkedin_coalescing_coalesced_total", "Requests that waited for an identical one in flight in the same worker")
+COALESCING_REMOTE = registry.counter(
+    "linkedin_coalescing_remote_total", "Requests answered by an identical one another worker performed")
+
+# MCP tools, one observation per tool call
+TOOL_LATENCY = registry.histogram(
+    "linkedin_tool_duration_seconds", "Duration of MCP tool calls", ("tool",))
+TOOL_CALLS = registry.counter(
+    "linkedin_tool_calls_total", "MCP tool calls by outcome (ok, error, exception)", ("tool", "outcome"))
+TOOL_IN_FLIGHT = registry.gauge(
+    "linkedin_tool_in_flight", "MCP tool calls currently running", ("tool",))
+
+
+def _outcome(result: Any) -> str:
+    if isinstance(result, dict) and (result.get("success") is False or "error" in result):
+        return "error"
+    return "ok"
+
+
+@contextlib.contextmanager
+def tool_call(tool: str) -> Iterator[Dict[str, Any]]:
+    """Times one tool call; the caller stores the tool's return value under "result"."""
+    TOOL_IN_FLIGHT.inc(tool=tool)
+    record: Dict[str, Any] = {}
+    start = time.perf_counter()
+    outcome = "exception"
+    try:
+        yield record
+        outcome = _outcome(record.get("result"))
+    finally:
+        TOOL_IN_FLIGHT.dec(tool=tool)
+        TOOL_LATENCY.observe(time.perf_counter() - start, tool=tool)
+        TOOL_CALLS.inc(tool=tool, outcome=outcome)
+
+
+def instrument_tool(fn: Callable[..., Any], name: Optional[str] = None) -> Callable[..., Any]:
+    """Wraps a tool function so every call is timed and counted by outcome; the signature is kept for FastMCP."""
+    tool = name or fn.__name__
+
+    if asyncio.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with tool_call(tool) as record:
+                record["result"] = await fn(*args, **kwargs)
+            return record["result"]
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with tool_call(tool) as record:
+            record["result"] = fn(*args, **kwargs)
+        return record["result"]
+    return wrapper
+
+
+@contextlib.contextmanager
+def upstream_attempt(route: str, method: str, attempt: int, sent: int) -> Iterator[Dict[str, Any]]:
+    """
+    Times one upstream attempt.
+
+    The caller stores the response's "status" and body size in bytes under
+    "received" in the yielded dictionary; an exception escaping the block is
+    counted by type.
+    """
+    UPSTREAM_IN_FLIGHT.inc(route=route)
+    if attempt > 1:
+        UPSTREAM_RETRIES.inc(route=route)
+    UPSTREAM_BYTES_OUT.inc(sent, route=route)
+    record: Dict[str, Any] = {"status": None, "received": 0}
+    start = time.perf_counter()
+    try:
+        yield record
+    except Exception as e:
+        UPSTREAM_ERRORS.inc(route=route, exception_type=type(e).__name__)
+        raise
+    finally:
+        UPSTREAM_IN_FLIGHT.dec(route=route)
+        UPSTREAM_LATENCY.observe(time.perf_counter() - start, route=route, method=method)
+        if record["status"] is not None:
+            UPSTREAM_REQUESTS.inc(route=route, status=str(record["status"]))
+        UPSTREAM_BYTES_IN.inc(record["received"], route=route)
@@ -0,0 +1,190 @@
+import logging
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from bulk import batch_items
+
+logger = logging.getLogger('linkedin_api_tools.pagination')
+
+# Fields a feed page may use for the token of the next page
+_TOKEN_FIELDS = ("paginationToken", "pagination_token", "nextPaginationToken", "next_pagination_token")
+
+# Fields a feed item may use for when it was posted
+_DATE_FIELDS = ("postedDateTimestamp", "postedAt", "posted_at", "postedDate", "posted_date", "createdAt",
+                "created_at", "time", "timestamp", "date")
+
+
+def _find_token(data: Any, depth: int = 0) -> Optional[Any]:
+    """Returns the next-page token of a page ("" if present but empty), or None if the page has none."""
+    if not isinstance(data, dict) or depth > 2:
+        return None
+    for field in _TOKEN_FIELDS:
+        if field in data:
+            return data[field] or ""
+    for value in data.values():
+        token = _find_token(value, depth + 1)
+        if token is not None:
+            return token
+    return None
+
+
+def page_items(data: Any) -> List[Any]:
+    """Returns the items of a feed page, looking one level into a nested "data" object."""
+    items = batch_items(data)
+    if not items and isinstance(data, dict) and isinstance(data.get("data"), dict):
+        items = batch_items(data["data"])
+    return items
+
+
+def parse_timestamp(value: Any) -> Optional[float]:
+    """Parses an epoch (seconds or milliseconds) or ISO-8601 value into epoch seconds."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value / 1000 if value > 1e11 else float(value)
+    if isinstance(value, str) and value:
+        if value.isdigit():
+            return parse_timestamp(int(value))
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    return None
+
+
+def item_timestamp(item: Any) -> Optional[float]:
+    if not isinstance(item, dict):
+        return None
+    for field in _DATE_FIELDS:
+        if field in item:
+            timestamp = parse_timestamp(item[field])
+            if timestamp is not None:
+                return timestamp
+    return None
+
+
+class FeedPaginator:
+    """
+    Walks a paginated feed endpoint, following page numbers and pagination tokens.
+
+    Iterate with ``async for`` to receive items as each page arrives. The walk
+    stops once ``max_items`` items were produced, when an item older than
+    ``since`` is reached (feeds are newest first), when the upstream stops
+    returning a pagination token or items, on an error, or after ``max_pages``.
+    ``stop_reason`` and ``error`` say which one ended it. ``page``, ``token`` and
+    ``offset`` then hold where to resume: when the walk stopped inside a page, that
+    page plus the number of its items already produced, otherwise the next page.
+
+    Args:
+        fetch_page: Coroutine fetching one page given (page number, pagination token)
+        max_items: Maximum number of items to produce
+        since: Epoch seconds; items posted before this end the walk
+        max_pages: Hard limit on upstream calls
+        start_page: Page number of the first call
+        start_token: Pagination token of the first call
+        start_offset: Items of the first page already returned by an earlier walk, skipped here
+    """
+
+    def __init__(self, fetch_page: Callable[[int, Optional[str]], Awaitable[Dict[str, Any]]],
+                 max_items: int = 100, since: Optional[float] = None, max_pages: int = 50,
+                 start_page: int = 1, start_token: Optional[str] = None, start_offset: int = 0):
+        self.fetch_page = fetch_page
+        self.max_items = max_items
+        self.since = since
+        self.max_pages = max_pages
+        self.page = start_page
+        self.token = start_token
+        self.offset = max(start_offset, 0)
+        self.pages = 0
+        self.produced = 0
+        self.stop_reason: Optional[str] = None
+        self.exhausted = False
+        self.error: Optional[Dict[str, Any]] = None
+        self.status = 200
+
+    async def pages_iter(self) -> AsyncIterator[List[Any]]:
+        """Yields the accepted items of each page as soon as it is fetched."""
+        token_mode = self.token is not None
+        while self.stop_reason is None:
+            if self.pages >= self.max_pages:
+                self.stop_reason = "max_pages"
+                break
+            response = await self.fetch_page(self.page, self.token)
+            self.pages += 1
+            self.status = response.get("status", self.status)
+            if not response.get("success"):
+                self.error = response
+                self.stop_reason = "error"
+                break
+
+            data = response.get("data")
+            items = page_items(data)
+            accepted = []
+            for item in items[self.offset:]:
+                if self.since is not None:
+                    timestamp = item_timestamp(item)
+                    if timestamp is not None and timestamp < self.since:
+                        self.stop_reason = "since"
+                        break
+                accepted.append(item)
+                if self.produced + len(accepted) >= self.max_items:
+                    self.stop_reason = "max_items"
+                    break
+            self.produced += len(accepted)
+            if accepted:
+                yield accepted
+
+            token = _find_token(data)
+            token_mode = token_mode or token is not None
+            if self.stop_reason is not None:
+                # Stopped inside the page: resume on it, past the items already returned
+                self.offset += len(accepted)
+                if self.offset < len(items):
+                    break
+            if not items or (token_mode and (not token or token == self.token)):
+                self.exhausted = True
+                self.stop_reason = self.stop_reason or "exhausted"
+                break
+            self.page += 1
+            self.token = token or None
+            self.offset = 0
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        async for items in self.pages_iter():
+            for item in items:
+                yield item
+
+    async def collect(self, on_page: Optional[Callable[[int, int], Awaitable[None]]] = None) -> Dict[str, Any]:
+        """
+        Walks the feed and returns every item in one result dictionary.
+
+        Args:
+            on_page: Coroutine called with (items so far, max_items) after each page
+
+        Returns:
+            {"success", "status", "data", "pages", "stop_reason", "page", "paginationToken", "offset"}
+        """
+        items: List[Any] = []
+        async for page in self.pages_iter():
+            items.extend(page)
+            if on_page is not None:
+                await on_page(len(items), self.max_items)
+        if self.error is not None and not items:
+            return self.error
+        result = {
+            "success": True,
+            "status": self.status,
+            "data": items,
+            "pages": self.pages,
+            "stop_reason": self.stop_reason,
+            # Where to resume: the first page not fully returned and how many of its items were, unless the feed ran out
+            "page": self.page if not self.exhausted else None,
+            "paginationToken": self.token if not self.exhausted else None,
+            "offset": self.offset if not self.exhausted else None
+        }
+        if self.error is not None:
+            result["error"] = self.error
+        return result
@@ -0,0 +1,105 @@
+import asyncio
+import copy
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from bulk import PROFILES_PER_CALL, batch_items, item_link_key, link_key
+
+logger = logging.getLogger('linkedin_api_tools.batcher')
+
+class ProfileBatcher:
+    """
+    Collects single-profile lookups and sends them upstream as /profiles batches.
+
+    A batch is flushed when ``window`` seconds have passed since its first
+    lookup, or as soon as it holds ``max_batch`` distinct links. Each caller
+    gets back the item for its own link; a caller whose link cannot be found
+    in the batch response, or whose whole batch failed, gets None so it can
+    fall back to a single lookup.
+
+    Args:
+        fetch_batch: Coroutine sending a list of links to /profiles
+        window: Seconds to wait for more lookups before flushing
+        max_batch: Maximum number of links per upstream call
+    """
+
+    def __init__(self, fetch_batch: Callable[[List[str]], Awaitable[Dict[str, Any]]], window: float = 0.05,
+                 max_batch: int = PROFILES_PER_CALL):
+        self.fetch_batch = fetch_batch
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[str, Tuple[str, List[asyncio.Future]]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Running batches, referenced until they finish so none is garbage collected midway
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = {"lookups": 0, "batches": 0, "links_sent": 0, "unmatched": 0, "failed_batches": 0}
+
+    async def lookup(self, link: str) -> Optional[Dict[str, Any]]:
+        """Queues a profile lookup and waits for the batch that carries it."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        slug = link_key(link)
+        if slug in self._pending:
+            self._pending[slug][1].append(future)
+        else:
+            self._pending[slug] = (link, [future])
+        self._stats["lookups"] += 1
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[str, Tuple[str, List[asyncio.Future]]]) -> None:
+        links = [link for link, _ in batch.values()]
+        self._stats["batches"] += 1
+        self._stats["links_sent"] += len(links)
+        logger.info(f"Flushing profile batch of {len(links)} links")
+        try:
+            response = await self.fetch_batch(links)
+        except Exception as e:
+            response = {"error": str(e), "exception_type": type(e).__name__}
+
+        if not response.get("success"):
+            # The whole batch failed; every caller falls back to its own lookup rather than sharing one error
+            self._stats["failed_batches"] += 1
+            logger.warning(f"Profile batch of {len(links)} links failed, looking them up one by one: "
+                           f"{response.get('error') or response.get('status')}")
+            for _, futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_result(None)
+            return
+
+        items = {}
+        for item in batch_items(response.get("data")):
+            slug = item_link_key(item)
+            if slug is not None:
+                items.setdefault(slug, item)
+        for slug, (_, futures) in batch.items():
+            item = items.get(slug)
+            if item is None:
+                self._stats["unmatched"] += 1
+            for index, future in enumerate(futures):
+                if future.done():
+                    continue
+                if item is None:
+                    future.set_result(None)
+                else:
+                    # Callers that asked for the same profile each get their own copy
+                    data = item if index == 0 else copy.deepcopy(item)
+                    future.set_result({"success": True, "status": response.get("status", 200), "data": data})
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats, pending=len(self._pending))
@@ -0,0 +1,84 @@
+import logging
+from typing import Any, Dict, List, Optional, Union
+
+from bulk import batch_items
+
+logger = logging.getLogger('linkedin_api_tools.projection')
+
+# Compiled projection: field name -> sub-projection, or None to keep the whole value
+FieldTree = Dict[str, Optional["FieldTree"]]
+
+
+def compile_fields(fields: Optional[Union[str, List[str]]]) -> Optional[FieldTree]:
+    """
+    Compiles field paths into a projection tree; returns None when nothing is to be projected.
+
+    Paths are dot-separated keys, with ``[]`` marking a list whose elements
+    the rest of the path applies to, e.g. ``experiences[].company``. Lists are
+    also traversed without the marker. A comma-separated string is accepted
+    in place of a list. A path selecting a whole object wins over paths below it.
+
+    Raises:
+        ValueError: If a path is empty or has an empty segment
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    paths = [path.strip() for path in fields if path and path.strip()]
+    if not paths:
+        return None
+
+    tree: FieldTree = {}
+    for path in paths:
+        segments = [segment.replace("[]", "").replace("[*]", "").strip() for segment in path.split(".")]
+        if any(not segment for segment in segments):
+            raise ValueError(f"Invalid field path: {path}")
+        node = tree
+        for index, segment in enumerate(segments):
+            last = index == len(segments) - 1
+            if last:
+                node[segment] = None
+            elif segment in node and node[segment] is None:
+                # An ancestor is already kept whole
+                break
+            else:
+                node = node.setdefault(segment, {})
+    return tree
+
+
+def project(value: Any, tree: Optional[FieldTree]) -> Any:
+    """Returns a copy of value keeping only the paths in tree; missing keys are left out."""
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {key: project(value[key], subtree) for key, subtree in tree.items() if key in value}
+
+
+def project_response(response: Dict[str, Any], tree: Optional[FieldTree]) -> Dict[str, Any]:
+    """Projects the "data" of a successful tool result; errors are returned untouched."""
+    if tree is None or not response.get("success") or "data" not in response:
+        return response
+    return dict(response, data=project(response["data"], tree))
+
+
+def project_items(response: Dict[str, Any], tree: Optional[FieldTree]) -> Dict[str, Any]:
+    """
+    Projects every item of a batch response (e.g. /profiles) rather than the body as a whole.
+
+    Paths are then relative to one profile or company, whether the items are
+    the body itself, nested in it, or a merged fan-out result.
+    """
+    if tree is None or not response.get("success"):
+        return response
+    data = response.get("data")
+    items = batch_items(data)
+    if not items:
+        return project_response(response, tree)
+    projected = [project(item, tree) for item in items]
+    if isinstance(data, list):
+        return dict(response, data=projected)
+    return dict(response, data={key: projected if value is items else value for key, value in data.items()})
@@ -0,0 +1,288 @@
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import metrics
+from retry_policy import parse_retry_after
+
+logger = logging.getLogger('linkedin_api_tools.ratelimit')
+
+# Quota windows longer than this (e.g. monthly plans) are only enforced once exhausted, never paced
+PACING_HORIZON = 3600
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations instead of rejecting.
+
+    Tokens may go negative: each reservation takes one token and is told how
+    long to wait until its token has been refilled, so concurrent callers line
+    up behind each other at exactly ``rate`` requests per second. A rate of 0
+    means unlimited, which still honours quota pacing and blocks learned from
+    the upstream.
+
+    Args:
+        rate: Tokens added per second; 0 for no static limit
+        capacity: Maximum burst size
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.quota_rate: Optional[float] = None
+        self.quota_until = 0.0
+
+    def _effective_rate(self, now: float) -> float:
+        if self.quota_rate is not None and now < self.quota_until:
+            return self.quota_rate if self.rate <= 0 else min(self.rate, self.quota_rate)
+        return self.rate
+
+    def reserve(self, now: float) -> float:
+        """Takes one token and returns the seconds to wait before using it."""
+        blocked = max(0.0, self.blocked_until - now)
+        rate = self._effective_rate(now)
+        if rate <= 0:
+            return blocked
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = -self.tokens / rate if self.tokens < 0 else 0.0
+        return max(wait, blocked)
+
+    def refund(self) -> None:
+        if self.rate > 0 or self.quota_rate is not None:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+    def block(self, now: float, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+    def pace(self, now: float, remaining: float, reset: float) -> None:
+        """Spreads the remaining quota evenly over the time left in the window."""
+        self.quota_rate = max(remaining / reset, 1e-3)
+        self.quota_until = now + reset
+        self.tokens = min(self.tokens, remaining)
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def parse_quota_headers(headers: Mapping[str, str]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Reads the tightest (remaining, reset seconds) pair from x-ratelimit-* headers.
+
+    RapidAPI sends one family per quota, e.g. x-ratelimit-requests-remaining with
+    x-ratelimit-requests-reset; plain x-ratelimit-remaining/-reset is accepted too.
+    Header names must already be lower case.
+    """
+    best: Tuple[Optional[float], Optional[float]] = (None, None)
+    for name in headers:
+        if not (name.startswith("x-ratelimit-") and name.endswith("remaining")):
+            continue
+        remaining = _header_float(headers, name)
+        reset = _header_float(headers, name[:-len("remaining")] + "reset")
+        if remaining is None:
+            continue
+        if best[0] is None or remaining < best[0]:
+            best = (remaining, reset)
+    return best
+
+
+class RateLimiter:
+    """
+    Shared client-side rate limiter with a token bucket per API key and per route.
+
+    Before each upstream attempt a caller reserves a token from both its key's
+    and its route's bucket and sleeps for the longer wait, so bursts queue up
+    instead of running into 429s. Quota headers on every response adapt the
+    key's bucket: an exhausted quota blocks the key until its reset, and a
+    nearly exhausted short window paces the rest of it. A 429 blocks the key for
+    its Retry-After. Reservations that would wait longer than ``max_wait`` are
+    refused so callers can fail fast instead of hanging.
+
+    With ``shared`` the buckets live in a store all worker processes use
+    (shared_state.py), so the limits and whatever the upstream reported hold
+    across workers instead of once per worker. The ``*_async`` variants
+    consult that store from a worker thread, keeping the event loop free
+    while it waits on a lock or the network.
+
+    Args:
+        rate: Requests per second per API key; 0 for no static limit
+        burst: Bucket capacity
+        route_rates: Requests per second per route, e.g. {"/profiles": 1}
+        max_wait: Longest wait, in seconds, a reservation may be given
+        shared: Optional SqliteSharedState/RemoteSharedState holding the buckets
+    """
+
+    def __init__(self, rate: float = 0, burst: float = 10, route_rates: Optional[Dict[str, float]] = None,
+                 max_wait: float = 30, shared: Optional[Any] = None):
+        self.rate = rate
+        self.burst = burst
+        self.route_rates = dict(route_rates or {})
+        self.max_wait = max_wait
+        self.shared = shared
+        self._key_buckets: Dict[str, TokenBucket] = {}
+        self._route_buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._stats = {"reservations": 0, "delayed": 0, "rejected": 0, "throttled": 0, "wait_seconds": 0.0}
+
+    def _key_bucket(self, key: str) -> TokenBucket:
+        bucket = self._key_buckets.get(key)
+        if bucket is None:
+            bucket = self._key_buckets[key] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    def _route_bucket(self, route: str) -> Optional[TokenBucket]:
+        rate = self.route_rates.get(route)
+        if not rate:
+            return None
+        bucket = self._route_buckets.get(route)
+        if bucket is None:
+            bucket = self._route_buckets[route] = TokenBucket(rate, max(1.0, min(self.burst, rate)))
+        return bucket
+
+    def _key_spec(self, key: str) -> Tuple[str, float, float]:
+        # Shared buckets are named by a hash, so API keys never reach the store
+        return f"key:{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}", self.rate, self.burst
+
+    def _shared_specs(self, key: str, route: str) -> List[Tuple[str, float, float]]:
+        specs = [self._key_spec(key)]
+        rate = self.route_rates.get(route)
+        if rate:
+            specs.append((f"route:{route}", rate, max(1.0, min(self.burst, rate))))
+        return specs
+
+    def reserve(self, key: str, route: str) -> Optional[float]:
+        """Reserves a request slot; returns the seconds to wait, or None if that would exceed max_wait."""
+        if self.shared is not None:
+            wait = self.shared.reserve(self._shared_specs(key, route), self.max_wait)
+            with self._lock:
+                if wait is not None:
+                    self._stats["reservations"] += 1
+                    if wait > 0:
+                        self._stats["delayed"] += 1
+                        self._stats["wait_seconds"] += wait
+                else:
+                    self._stats["rejected"] += 1
+            self._record(route, wait)
+            return wait
+        now = time.monotonic()
+        with self._lock:
+            buckets = [self._key_bucket(key)]
+            route_bucket = self._route_bucket(route)
+            if route_bucket is not None:
+                buckets.append(route_bucket)
+            wait = max(bucket.reserve(now) for bucket in buckets)
+            if wait > self.max_wait:
+                for bucket in buckets:
+                    bucket.refund()
+                self._stats["rejected"] += 1
+                wait = None
+            else:
+                self._stats["reservations"] += 1
+                if wait > 0:
+                    self._stats["delayed"] += 1
+                    self._stats["wait_seconds"] += wait
+        self._record(route, wait)
+        return wait
+
+    @staticmethod
+    def _record(route: str, wait: Optional[float]) -> None:
+        if wait is None:
+            metrics.RATE_LIMIT_REJECTED.inc(route=route)
+            return
+        metrics.RATE_LIMIT_WAIT.observe(wait, route=route)
+        if wait > 0:
+            metrics.RATE_LIMIT_DELAYED.inc(route=route)
+
+    def blocked_for(self, key: str) -> Optional[float]:
+        """
+        Returns how much longer a key is blocked by the upstream (0 if not), or None if beyond max_wait.
+
+        Callers re-check this after sleeping off a reservation, since a block
+        learned meanwhile (429 or exhausted quota) applies to them as well.
+        """
+        shared_wait = self.shared.blocked_for(self._key_spec(key)[0]) if self.shared is not None else None
+        with self._lock:
+            if shared_wait is not None:
+                wait = shared_wait
+            else:
+                bucket = self._key_buckets.get(key)
+                wait = max(0.0, bucket.blocked_until - time.monotonic()) if bucket is not None else 0.0
+            if wait > self.max_wait:
+                self._stats["rejected"] += 1
+                return None
+            if wait > 0:
+                self._stats["wait_seconds"] += wait
+        return wait
+
+    def observe(self, key: str, status: int, headers: Mapping[str, str]) -> None:
+        """
+        Adapts the key's bucket to an upstream response.
+
+        Args:
+            key: API key the request was sent with
+            status: HTTP status of the response
+            headers: Response headers with lower-case names
+        """
+        remaining, reset = parse_quota_headers(headers)
+        if status == 429:
+            with self._lock:
+                self._stats["throttled"] += 1
+            retry_after = parse_retry_after(headers.get("retry-after"))
+            self._block(key, retry_after if retry_after is not None else (reset or 1.0))
+            return
+        if remaining is None or reset is None or reset <= 0:
+            return
+        if remaining <= 0:
+            self._block(key, reset)
+        elif remaining <= max(1.0, self.burst) and reset <= PACING_HORIZON:
+            self._pace(key, remaining, reset)
+
+    async def reserve_async(self, key: str, route: str) -> Optional[float]:
+        if self.shared is None:
+            return self.reserve(key, route)
+        return await asyncio.to_thread(self.reserve, key, route)
+
+    async def blocked_for_async(self, key: str) -> Optional[float]:
+        if self.shared is None:
+            return self.blocked_for(key)
+        return await asyncio.to_thread(self.blocked_for, key)
+
+    async def observe_async(self, key: str, status: int, headers: Mapping[str, str]) -> None:
+        if self.shared is None:
+            self.observe(key, status, headers)
+            return
+        await asyncio.to_thread(self.observe, key, status, headers)
+
+    def _block(self, key: str, seconds: float) -> None:
+        if self.shared is not None:
+            self.shared.block(self._key_spec(key), seconds)
+            return
+        with self._lock:
+            self._key_bucket(key).block(time.monotonic(), seconds)
+
+    def _pace(self, key: str, remaining: float, reset: float) -> None:
+        if self.shared is not None:
+            self.shared.pace(self._key_spec(key), remaining, reset)
+            return
+        with self._lock:
+            self._key_bucket(key).pace(time.monotonic(), remaining, reset)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            now = time.monotonic()
+            blocked = sum(1 for bucket in self._key_buckets.values() if bucket.blocked_until > now)
+            return dict(self._stats, keys=len(self._key_buckets), blocked_keys=blocked)
@@ -0,0 +1,392 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
+
+import json_codec
+
+logger = logging.getLogger('linkedin_api_tools.cache')
+
+# Default time-to-live per route, in seconds. Routes not listed are never cached.
+DEFAULT_ROUTE_TTLS: Dict[str, float] = {
+    # Near-static lookup tables
+    "/suggestion_location": 7 * 86400,
+    "/suggestion_company": 7 * 86400,
+    "/suggestion_school": 7 * 86400,
+    "/suggestion_industry": 7 * 86400,
+    "/suggestion_service_catagory": 7 * 86400,
+    "/suggestion_function": 7 * 86400,
+    "/suggestion_company_size": 7 * 86400,
+    "/suggestion_language": 7 * 86400,
+    "/suggestion_person": 86400,
+    "/search_geourns": 7 * 86400,
+    # Profiles and companies
+    "/person": 6 * 3600,
+    "/person_skills": 6 * 3600,
+    "/profiles": 6 * 3600,
+    "/profiles_david": 6 * 3600,
+    "/similar_profiles": 6 * 3600,
+    "/person_data_with_experiences": 6 * 3600,
+    "/person_data_with_open_to_work_flag": 6 * 3600,
+    "/person_data_with_languages": 6 * 3600,
+    "/person_data_with_educations": 6 * 3600,
+    "/company": 6 * 3600,
+    "/companies": 6 * 3600,
+    "/private_company_insights_2": 6 * 3600,
+    "/job_details": 3600,
+    # Search results
+    "/search_people_with_filters": 600,
+    "/search_company_with_filters": 600,
+    "/search_posts": 600,
+    "/search_posts_with_filters": 600,
+    "/original_search_posts_with_filters": 600,
+    "/search_jobs": 600,
+}
+
+# Seconds past its TTL an entry of these rarely changing routes is still served, while a
+# background refresh replaces it (stale-while-revalidate). Routes not listed never serve stale.
+DEFAULT_STALE_TTLS: Dict[str, float] = {
+    "/suggestion_location": 7 * 86400,
+    "/suggestion_company": 7 * 86400,
+    "/suggestion_school": 7 * 86400,
+    "/suggestion_industry": 7 * 86400,
+    "/suggestion_service_catagory": 7 * 86400,
+    "/suggestion_function": 7 * 86400,
+    "/suggestion_company_size": 7 * 86400,
+    "/suggestion_language": 7 * 86400,
+    "/suggestion_person": 86400,
+    "/search_geourns": 7 * 86400,
+    "/company": 86400,
+    "/private_company_insights_2": 86400,
+}
+
+# Routes whose responses are also written to the persistent cache
+PERSISTENT_ROUTES = frozenset({
+    "/person",
+    "/person_data_with_experiences",
+    "/person_data_with_open_to_work_flag",
+    "/person_data_with_languages",
+    "/person_data_with_educations",
+    "/company",
+    "/private_company_insights_2",
+    "/profiles",
+})
+
+
+def split_endpoint(endpoint: str) -> Tuple[str, str]:
+    """Splits an endpoint into its route and raw query string."""
+    route, _, query = endpoint.partition("?")
+    return route, query
+
+
+def request_key(method: str, endpoint: str, payload: Optional[str] = None) -> str:
+    """
+    Builds a normalized identity for a request.
+
+    Query parameters are sorted and JSON payloads re-encoded with sorted keys,
+    so argument order and whitespace never split one logical request in two.
+    """
+    route, query = split_endpoint(endpoint)
+    if query:
+        query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(query, keep_blank_values=True)))
+    body = ""
+    if payload:
+        try:
+            body = json.dumps(json.loads(payload), sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            body = payload
+    return f"{method.upper()} {route}?{query} {body}"
+
+
+class ResponseCache:
+    """
+    Bounded in-process TTL cache for successful API responses.
+
+    Entries are stored as their JSON encoding, which gives an exact byte size
+    for the size bound and hands every hit a fresh copy callers may mutate.
+    Least recently used entries are evicted once either ``max_entries`` or
+    ``max_bytes`` is exceeded.
+
+    Routes with a stale TTL keep their entries that much longer after they
+    expire; lookup() still returns them, flagged stale, so the caller can
+    answer at once and refresh in the background.
+
+    Args:
+        max_entries: Maximum number of cached responses
+        max_bytes: Maximum total size of cached responses, in bytes
+        route_ttls: Time-to-live per route in seconds; 0 or missing disables caching
+        backend: Optional second tier (e.g. PersistentCache) consulted on a miss
+        stale_ttls: Seconds per route an expired entry may still be served stale
+    """
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 64 * 1024 * 1024,
+                 route_ttls: Optional[Dict[str, float]] = None, backend: Optional["PersistentCache"] = None,
+                 stale_ttls: Optional[Dict[str, float]] = None):
+        self.backend = backend
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.route_ttls = dict(DEFAULT_ROUTE_TTLS if route_ttls is None else route_ttls)
+        self.stale_ttls = dict(DEFAULT_STALE_TTLS if stale_ttls is None else stale_ttls)
+        # key -> (expires_at, stale_until, size, encoded)
+        self._entries: "OrderedDict[str, Tuple[float, float, int, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "stores": 0, "evictions": 0, "expired": 0,
+                       "backend_hits": 0}
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.route_ttls.get(split_endpoint(endpoint)[0], 0)
+
+    def key_for(self, method: str, endpoint: str, payload: Optional[str] = None) -> Optional[str]:
+        """Builds a normalized cache key, or returns None if the route is not cacheable."""
+        if self.route_ttls.get(split_endpoint(endpoint)[0], 0) <= 0:
+            return None
+        return request_key(method, endpoint, payload)
+
+    def stale_ttl_for(self, endpoint: str) -> float:
+        return self.stale_ttls.get(split_endpoint(endpoint)[0], 0)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns a copy of the cached response, or None on a miss or expiry."""
+        return self._lookup(key, allow_stale=False)[0]
+
+    def lookup(self, key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Returns (copy of the cached response or None, whether it is stale).
+
+        A stale response is past its TTL but within its route's stale TTL; the
+        caller is expected to refresh it.
+        """
+        return self._lookup(key, allow_stale=True)
+
+    async def get_async(self, key: str) -> Optional[Dict[str, Any]]:
+        return (await self._lookup_async(key, allow_stale=False))[0]
+
+    async def lookup_async(self, key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """lookup() for the event loop: a miss in memory consults the backend in a worker thread."""
+        return await self._lookup_async(key, allow_stale=True)
+
+    def _lookup(self, key: str, allow_stale: bool) -> Tuple[Optional[Dict[str, Any]], bool]:
+        now = time.time()
+        found = self._lookup_memory(key, allow_stale, now)
+        return found if found is not None else self._lookup_backend(key, allow_stale, now)
+
+    async def _lookup_async(self, key: str, allow_stale: bool) -> Tuple[Optional[Dict[str, Any]], bool]:
+        now = time.time()
+        found = self._lookup_memory(key, allow_stale, now)
+        if found is not None:
+            return found
+        if self.backend is None:
+            return self._lookup_backend(key, allow_stale, now)
+        return await asyncio.to_thread(self._lookup_backend, key, allow_stale, now)
+
+    def _lookup_memory(self, key: str, allow_stale: bool, now: float) -> Optional[Tuple[Dict[str, Any], bool]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= now:
+                del self._entries[key]
+                self._bytes -= entry[2]
+                self._stats["expired"] += 1
+                entry = None
+            if entry is not None and (allow_stale or entry[0] > now):
+                stale = entry[0] <= now
+                self._entries.move_to_end(key)
+                self._stats["stale_hits" if stale else "hits"] += 1
+                return json_codec.loads(entry[3]), stale
+        return None
+
+    def _lookup_backend(self, key: str, allow_stale: bool, now: float) -> Tuple[Optional[Dict[str, Any]], bool]:
+        if self.backend is not None:
+            stored = self.backend.get(key)
+            if stored is not None and (allow_stale or stored[0] > now):
+                expires_at, stale_until, encoded = stored
+                self._store(key, encoded, expires_at, stale_until)
+                with self._lock:
+                    self._stats["backend_hits"] += 1
+                return json_codec.loads(encoded), expires_at <= now
+        with self._lock:
+            self._stats["misses"] += 1
+        return None, False
+
+    def put(self, key: str, endpoint: str, response: Dict[str, Any]) -> bool:
+        """Caches a successful response; error responses are never stored."""
+        if not response.get("success"):
+            return False
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return False
+        encoded = json_codec.dumps_bytes(response)
+        expires_at = time.time() + ttl
+        stale_until = expires_at + self.stale_ttl_for(endpoint)
+        if self.backend is not None and split_endpoint(endpoint)[0] in self.backend.routes:
+            self.backend.put(key, split_endpoint(endpoint)[0], encoded, expires_at, stale_until)
+        return self._store(key, encoded, expires_at, stale_until)
+
+    async def put_async(self, key: str, endpoint: str, response: Dict[str, Any]) -> bool:
+        """put() for the event loop: with a backend, the write happens in a worker thread."""
+        if self.backend is None:
+            return self.put(key, endpoint, response)
+        return await asyncio.to_thread(self.put, key, endpoint, response)
+
+    def _store(self, key: str, encoded: Union[bytes, str], expires_at: float, stale_until: float) -> bool:
+        size = len(encoded)
+        if size > self.max_bytes:
+            return False
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._entries[key] = (expires_at, stale_until, size, encoded)
+            self._bytes += size
+            self._stats["stores"] += 1
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, _, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats["evictions"] += 1
+        return True
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[2]
+        if self.backend is not None:
+            self.backend.invalidate(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries), bytes=self._bytes)
+
+
+class PersistentCache:
+    """
+    SQLite-backed response cache that survives process restarts.
+
+    The database runs in WAL mode so readers never wait on the writer. Once the
+    stored payloads exceed ``max_bytes`` the least recently read entries are
+    deleted, and every ``compact_interval`` seconds rows past their stale TTL
+    are purged and freed pages returned to the file system.
+
+    Args:
+        path: SQLite database file
+        max_bytes: Maximum total size of stored payloads, in bytes
+        compact_interval: Seconds between compaction passes
+        routes: Routes whose responses are persisted
+    """
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024, compact_interval: float = 3600,
+                 routes: frozenset = PERSISTENT_ROUTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compact_interval = compact_interval
+        self.routes = routes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, route TEXT NOT NULL, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        # Databases from before stale-while-revalidate lack the column; their rows go when they expire
+        if "stale_until" not in {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}:
+            self._conn.execute("ALTER TABLE responses ADD COLUMN stale_until REAL")
+        self._bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self._last_compaction = time.monotonic()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "compactions": 0}
+
+    def get(self, key: str) -> Optional[Tuple[float, float, Union[bytes, str]]]:
+        """Returns (expires_at, stale_until, encoded response) for an entry that is live or may be served stale, or None."""
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT expires_at, COALESCE(stale_until, expires_at), value FROM responses "
+                    "WHERE key = ? AND COALESCE(stale_until, expires_at) > ?", (key, now)
+                ).fetchone()
+                if row is None:
+                    self._stats["misses"] += 1
+                    return None
+                self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                self._stats["hits"] += 1
+        except sqlite3.Error as e:
+            logger.error(f"Persistent cache read failed: {str(e)}")
+            return None
+        return row[0], row[1], row[2]
+
+    def put(self, key: str, route: str, encoded: bytes, expires_at: float, stale_until: Optional[float] = None) -> None:
+        now = time.time()
+        size = len(encoded)
+        if size > self.max_bytes:
+            return
+        try:
+            with self._lock:
+                previous = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, route, value, size, created_at, expires_at, stale_until, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, route, encoded, size, now, expires_at, stale_until, now)
+                )
+                self._bytes += size - (previous[0] if previous else 0)
+                self._stats["stores"] += 1
+                if self._bytes > self.max_bytes:
+                    self._evict()
+                if time.monotonic() - self._last_compaction >= self.compact_interval:
+                    self._compact()
+        except sqlite3.Error as e:
+            logger.error(f"Persistent cache write failed: {str(e)}")
+
+    def _evict(self) -> None:
+        """Deletes least recently read entries until the store is back under 90% of the cap."""
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        doomed = []
+        for key, size in rows:
+            if self._bytes <= target:
+                break
+            doomed.append((key,))
+            self._bytes -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self._stats["evictions"] += len(doomed)
+
+    def _compact(self) -> None:
+        self._conn.execute("DELETE FROM responses WHERE COALESCE(stale_until, expires_at) <= ?", (time.time(),))
+        self._bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self._conn.execute("PRAGMA incremental_vacuum")
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._last_compaction = time.monotonic()
+        self._stats["compactions"] += 1
+
+    def compact(self) -> None:
+        """Purges expired entries and shrinks the database file."""
+        with self._lock:
+            self._compact()
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._bytes -= row[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, bytes=self._bytes)
@@ -0,0 +1,110 @@
+import email.utils
+import http.client
+import logging
+import random
+import time
+from typing import FrozenSet, Mapping, Optional
+
+import httpx
+
+logger = logging.getLogger('linkedin_api_tools.retry')
+
+# Statuses worth another attempt: throttling and gateway/availability errors
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+# Exceptions from the transport (resets, timeouts, broken keep-alive connections); anything else is a bug
+RETRYABLE_EXCEPTIONS = (OSError, http.client.HTTPException, httpx.TransportError)
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Parses a Retry-After header (delta seconds or HTTP date) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+
+class RetryState:
+    """Attempt count, previous backoff and deadline of one call; created by RetryPolicy.start()."""
+
+    def __init__(self, policy: "RetryPolicy"):
+        self.policy = policy
+        self.attempts = 0
+        self.deadline = time.monotonic() + policy.deadline
+        self._previous_delay = policy.base_delay
+
+    def remaining(self) -> float:
+        """Seconds left in the call's deadline budget."""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def backoff(self, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Returns how long to sleep before the next attempt, or None to give up.
+
+        The delay is decorrelated jitter, ``uniform(base, 3 * previous)`` capped at
+        ``max_delay``, raised to the upstream's Retry-After when one was sent.
+        Gives up once the attempts are used up or the delay would overrun the
+        deadline.
+        """
+        if self.attempts >= self.policy.max_attempts:
+            return None
+        delay = min(self.policy.max_delay, random.uniform(self.policy.base_delay, self._previous_delay * 3))
+        self._previous_delay = delay
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        if delay >= self.remaining():
+            logger.info(f"Retry budget exhausted after {self.attempts} attempts")
+            return None
+        return delay
+
+
+class RetryPolicy:
+    """
+    Decides which failures are retried and how long to back off between attempts.
+
+    Responses are retried on ``retryable_statuses`` and on transport
+    exceptions; any other status (notably 4xx) or exception is final. Backoff
+    uses decorrelated jitter so sessions hit by the same blip do not retry in
+    lockstep, and every call has an overall ``deadline`` covering all attempts
+    and sleeps.
+
+    Args:
+        max_attempts: Attempts per call, including the first
+        base_delay: Smallest backoff, in seconds
+        max_delay: Largest backoff, in seconds (Retry-After may exceed it)
+        deadline: Budget for the whole call, in seconds
+        retryable_statuses: HTTP statuses that get another attempt
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 20,
+                 deadline: float = 60, retryable_statuses: FrozenSet[int] = RETRYABLE_STATUSES):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retryable_statuses = retryable_statuses
+
+    def start(self) -> RetryState:
+        return RetryState(self)
+
+    def retryable_status(self, status: int) -> bool:
+        return status in self.retryable_statuses
+
+    def retryable_exception(self, error: BaseException) -> bool:
+        return isinstance(error, RETRYABLE_EXCEPTIONS)
+
+    def retry_after(self, status: int, headers: Mapping[str, str]) -> Optional[float]:
+        """Returns the Retry-After of a throttling/unavailable response; header names must be lower case."""
+        if status not in (429, 503):
+            return None
+        return parse_retry_after(headers.get("retry-after"))
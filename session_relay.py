@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+from uuid import UUID
+
+from pydantic import ValidationError
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import BaseRoute, Mount
+from starlette.types import Receive, Scope, Send
+
+import mcp.types as types
+from mcp.server.sse import SseServerTransport
+
+logger = logging.getLogger('linkedin_mcp_server.relay')
+
+# The endpoint event, the first thing an SSE stream sends, carries the session's ID
+SESSION_ID = re.compile(rb"session_id=([0-9a-f]{32})")
+
+
+class SessionRelay:
+    """
+    Delivers MCP messages that reach a worker other than the one holding the session.
+
+    The SSE transport keeps each session's stream in the worker process that
+    accepted its ``GET /mcp/sse``, while the client's ``POST /mcp/messages/``
+    may land on any worker. The relay wraps the transport's connect_sse to
+    learn which sessions this worker holds and takes over the message route:
+    a message for a session of this worker goes to the transport as before,
+    one for another worker's session is queued in the shared store. Every
+    worker announces its sessions there and polls for messages queued for
+    them every ``interval`` seconds, handing them to the transport's own
+    message handler. Calls to the store run in a worker thread, off the
+    event loop.
+
+    Args:
+        transport: The SseServerTransport of this worker
+        shared: SqliteSharedState/RemoteSharedState the workers share
+        interval: Seconds between polls for queued messages
+        ttl: Seconds a session stays announced without being renewed
+        grace: Seconds a message waits for its session to be announced (a client
+            may post right after the SSE stream opened, before the next poll)
+    """
+
+    def __init__(self, transport: SseServerTransport, shared: Any, interval: float = 0.05, ttl: float = 30,
+                 grace: float = 1.0):
+        self.transport = transport
+        self.shared = shared
+        self.interval = interval
+        self.ttl = ttl
+        self.grace = grace
+        self._sessions: Set[str] = set()
+        self._announced: List[str] = []
+        self._announced_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._connect = transport.connect_sse
+        transport.connect_sse = self._connect_sse
+
+    @classmethod
+    def install(cls, routes: List[BaseRoute], shared: Any, **options: Any) -> "SessionRelay":
+        """Puts a relay in place of the message route of FastMCP.sse_app() routes."""
+        for index, route in enumerate(routes):
+            transport = getattr(route, "app", None) and getattr(route.app, "__self__", None)
+            if isinstance(route, Mount) and isinstance(transport, SseServerTransport):
+                relay = cls(transport, shared, **options)
+                routes[index] = Mount(route.path, app=relay)
+                return relay
+        raise ValueError("No SSE message route to relay")
+
+    @asynccontextmanager
+    async def _connect_sse(self, scope: Scope, receive: Receive, send: Send) -> AsyncIterator[Any]:
+        # Notes the session's ID from its endpoint event and forgets it once the client disconnects
+        session: Dict[str, str] = {}
+
+        async def tracking_send(message: Dict[str, Any]) -> None:
+            if "id" not in session and message["type"] == "http.response.body":
+                found = SESSION_ID.search(message.get("body", b""))
+                if found:
+                    session["id"] = found.group(1).decode("ascii")
+                    self._sessions.add(session["id"])
+            await send(message)
+
+        async def tracking_receive() -> Dict[str, Any]:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                self._sessions.discard(session.get("id"))
+            return message
+
+        try:
+            async with self._connect(scope, tracking_receive, tracking_send) as streams:
+                yield streams
+        finally:
+            self._sessions.discard(session.get("id"))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request = Request(scope, receive)
+        try:
+            session_id = UUID(hex=request.query_params.get("session_id", "")).hex
+        except ValueError:
+            session_id = None
+        if session_id is None or session_id in self._sessions:
+            await self.transport.handle_post_message(scope, receive, send)
+            return
+        body = await request.body()
+        try:
+            types.JSONRPCMessage.model_validate_json(body)
+        except ValidationError:
+            await Response("Could not parse message", status_code=400)(scope, receive, send)
+            return
+        deadline = time.monotonic() + self.grace
+        while not await asyncio.to_thread(self.shared.post_message, session_id, body.decode("utf-8")):
+            if time.monotonic() >= deadline:
+                logger.warning(f"Could not find session for ID: {session_id}")
+                await Response("Could not find session", status_code=404)(scope, receive, send)
+                return
+            await asyncio.sleep(self.interval)
+        await Response("Accepted", status_code=202)(scope, receive, send)
+
+    async def _hand_to_transport(self, session_id: str, body: str) -> int:
+        # Replays a relayed message as a POST to the transport's handler; returns the status it answered
+        scope = {"type": "http", "method": "POST", "path": "/",
+                 "query_string": f"session_id={session_id}".encode("ascii"),
+                 "headers": [(b"content-type", b"application/json")]}
+        status = {}
+        delivered = False
+
+        async def receive() -> Dict[str, Any]:
+            nonlocal delivered
+            if delivered:
+                return {"type": "http.disconnect"}
+            delivered = True
+            return {"type": "http.request", "body": body.encode("utf-8"), "more_body": False}
+
+        async def send(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+
+        await self.transport.handle_post_message(scope, receive, send)
+        return status.get("code", 500)
+
+    async def _deliver(self) -> None:
+        sessions = sorted(self._sessions)
+        now = time.monotonic()
+        if sessions != self._announced or now - self._announced_at >= self.ttl / 3:
+            await asyncio.to_thread(self.shared.register_sessions, sessions, self.ttl)
+            self._announced, self._announced_at = sessions, now
+        for session_id, body in await asyncio.to_thread(self.shared.take_messages, sessions):
+            try:
+                status = await self._hand_to_transport(session_id, body)
+            except Exception as e:
+                logger.info(f"Session {session_id} closed before a relayed message reached it: {str(e)}")
+                continue
+            if status != 202:
+                logger.info(f"Relayed message for session {session_id} was refused with status {status}")
+
+    async def run(self) -> None:
+        """Announces this worker's sessions and hands them the messages other workers queued."""
+        while True:
+            try:
+                await self._deliver()
+            except Exception as e:
+                logger.error(f"Session relay failed: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        self._task = asyncio.ensure_future(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
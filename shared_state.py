@@ -0,0 +1,490 @@
+import argparse
+import contextlib
+import http.client
+import json
+import logging
+import sqlite3
+import threading
+import time
+import urllib.parse
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from rate_limiter import TokenBucket
+from response_cache import PersistentCache
+
+logger = logging.getLogger('linkedin_api_tools.shared')
+
+# Seconds a finished request's result stays readable for the callers already polling for it; a new
+# caller never joins a finished request, it claims the key anew
+RESULT_LINGER = 2
+
+# Seconds between purges of finished requests, lapsed sessions and undelivered messages
+PURGE_INTERVAL = 60
+
+# (bucket name, tokens per second, capacity), as the rate limiter configures its buckets
+BucketSpec = Tuple[str, float, float]
+
+
+class SqliteSharedState:
+    """
+    State the worker processes of one host share through a SQLite file in WAL mode.
+
+    - cache: a PersistentCache on the same file holding every cacheable route,
+      the second tier behind each worker's in-memory ResponseCache
+    - flights: one row per upstream request in flight, claimed by the worker
+      that performs it; workers wanting the same request poll the row for its
+      result instead of calling the upstream again
+    - buckets: the rate limiter's token buckets, read and written back in one
+      IMMEDIATE transaction per reservation, so the workers' requests line up
+      in a single queue per API key and route
+    - sessions and messages: where each MCP SSE session lives, and messages
+      posted to another worker waiting for the session's worker to take them
+
+    Timestamps are wall-clock, the one clock every process agrees on.
+
+    Args:
+        path: SQLite database file
+        routes: Routes whose responses go to the shared cache
+        max_bytes: Maximum total size of cached responses, in bytes
+        compact_interval: Seconds between compaction passes of the cache
+    """
+
+    def __init__(self, path: str, routes: frozenset, max_bytes: int = 512 * 1024 * 1024,
+                 compact_interval: float = 3600):
+        self.path = path
+        self.cache = PersistentCache(path, max_bytes=max_bytes, compact_interval=compact_interval, routes=routes)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS flights ("
+            "key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL, result BLOB)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL, blocked_until REAL NOT NULL, "
+            "quota_rate REAL, quota_until REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS sessions (id TEXT PRIMARY KEY, expires_at REAL NOT NULL)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS messages ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, session_id TEXT NOT NULL, body TEXT NOT NULL, "
+            "created_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS messages_session ON messages (session_id)")
+        self._last_purge = 0.0
+        self._stats = {"claims": 0, "waits": 0, "reservations": 0, "relayed": 0, "errors": 0}
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # IMMEDIATE takes the write lock up front, so concurrent read-modify-writes of other processes queue
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except BaseException:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+
+    def _failed(self, what: str, error: Exception) -> None:
+        logger.error(f"Shared state {what} failed: {str(error)}")
+        with self._lock:
+            self._stats["errors"] += 1
+
+    def _purge(self, conn: sqlite3.Connection, now: float) -> None:
+        if now - self._last_purge < PURGE_INTERVAL:
+            return
+        self._last_purge = now
+        conn.execute("DELETE FROM flights WHERE expires_at <= ?", (now,))
+        conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+        conn.execute("DELETE FROM messages WHERE created_at <= ?", (now - PURGE_INTERVAL,))
+
+    # Requests in flight
+
+    def claim(self, key: str, ttl: float, token: Optional[str] = None) -> Optional[str]:
+        """
+        Makes the caller the one performing a request, unless another caller already is.
+
+        Args:
+            key: Coalescing key of the request
+            ttl: Seconds the claim holds if it is never published or released (the claimant died)
+            token: Claim token to use; claiming again with the same token succeeds
+
+        Returns:
+            The claim token, or None while someone else is still performing the request (a published
+            result does not count). If the store fails the caller gets a token and goes ahead on its own.
+        """
+        token = token or uuid.uuid4().hex
+        now = time.time()
+        try:
+            with self._transaction() as conn:
+                row = conn.execute("SELECT owner, expires_at, result IS NULL FROM flights WHERE key = ?",
+                                   (key,)).fetchone()
+                if row is not None and row[1] > now and row[2] and row[0] != token:
+                    self._stats["waits"] += 1
+                    return None
+                conn.execute("INSERT OR REPLACE INTO flights (key, owner, expires_at, result) VALUES (?, ?, ?, NULL)",
+                             (key, token, now + ttl))
+                self._stats["claims"] += 1
+                self._purge(conn, now)
+        except sqlite3.Error as e:
+            self._failed("claim", e)
+        return token
+
+    def publish(self, key: str, token: str, encoded: Union[bytes, str], linger: float = RESULT_LINGER) -> None:
+        """Stores the result of a claimed request for the callers waiting on it."""
+        try:
+            with self._lock:
+                self._conn.execute("UPDATE flights SET result = ?, expires_at = ? WHERE key = ? AND owner = ?",
+                                   (encoded, time.time() + linger, key, token))
+        except sqlite3.Error as e:
+            self._failed("publish", e)
+
+    def release(self, key: str, token: str) -> None:
+        """Gives up a claim without a result; the next caller claims the request anew."""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM flights WHERE key = ? AND owner = ?", (key, token))
+        except sqlite3.Error as e:
+            self._failed("release", e)
+
+    def poll(self, key: str) -> Tuple[str, Optional[Union[bytes, str]]]:
+        """Returns ("running", None), ("done", encoded result) or ("gone", None) for a claimed request."""
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT expires_at, result FROM flights WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            self._failed("poll", e)
+            return "gone", None
+        if row is None or row[0] <= time.time():
+            return "gone", None
+        return ("done", row[1]) if row[1] is not None else ("running", None)
+
+    # Rate-limit buckets
+
+    def _bucket(self, conn: sqlite3.Connection, spec: BucketSpec, now: float) -> TokenBucket:
+        name, rate, capacity = spec
+        bucket = TokenBucket(rate, capacity)
+        row = conn.execute("SELECT tokens, updated, blocked_until, quota_rate, quota_until FROM buckets WHERE name = ?",
+                           (name,)).fetchone()
+        if row is None:
+            bucket.updated = now
+        else:
+            bucket.tokens, bucket.updated, bucket.blocked_until, bucket.quota_rate, bucket.quota_until = row
+        return bucket
+
+    def _save(self, conn: sqlite3.Connection, name: str, bucket: TokenBucket) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO buckets (name, tokens, updated, blocked_until, quota_rate, quota_until) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (name, bucket.tokens, bucket.updated, bucket.blocked_until, bucket.quota_rate, bucket.quota_until)
+        )
+
+    def _update(self, spec: BucketSpec, what: str, change: Callable[[TokenBucket, float], None]) -> None:
+        try:
+            with self._transaction() as conn:
+                now = time.time()
+                bucket = self._bucket(conn, spec, now)
+                change(bucket, now)
+                self._save(conn, spec[0], bucket)
+        except sqlite3.Error as e:
+            self._failed(what, e)
+
+    def reserve(self, specs: List[BucketSpec], max_wait: float) -> Optional[float]:
+        """TokenBucket.reserve over every bucket at once; None (and nothing taken) if the wait exceeds max_wait."""
+        try:
+            with self._transaction() as conn:
+                now = time.time()
+                buckets = [self._bucket(conn, spec, now) for spec in specs]
+                wait = max(bucket.reserve(now) for bucket in buckets)
+                if wait > max_wait:
+                    for bucket in buckets:
+                        bucket.refund()
+                for spec, bucket in zip(specs, buckets):
+                    self._save(conn, spec[0], bucket)
+                self._stats["reservations"] += 1
+        except sqlite3.Error as e:
+            # Better an unpaced request than none at all
+            self._failed("reservation", e)
+            return 0.0
+        return None if wait > max_wait else wait
+
+    def blocked_for(self, name: str) -> float:
+        """Seconds the bucket stays blocked by the upstream (429 or exhausted quota)."""
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT blocked_until FROM buckets WHERE name = ?", (name,)).fetchone()
+        except sqlite3.Error as e:
+            self._failed("read", e)
+            return 0.0
+        return max(0.0, row[0] - time.time()) if row is not None else 0.0
+
+    def block(self, spec: BucketSpec, seconds: float) -> None:
+        self._update(spec, "block", lambda bucket, now: bucket.block(now, seconds))
+
+    def pace(self, spec: BucketSpec, remaining: float, reset: float) -> None:
+        self._update(spec, "pacing", lambda bucket, now: bucket.pace(now, remaining, reset))
+
+    # MCP sessions
+
+    def register_sessions(self, session_ids: List[str], ttl: float) -> None:
+        """Announces the sessions held by the calling worker for the next ttl seconds."""
+        expires_at = time.time() + ttl
+        try:
+            with self._lock:
+                self._conn.executemany("INSERT OR REPLACE INTO sessions (id, expires_at) VALUES (?, ?)",
+                                       [(session_id, expires_at) for session_id in session_ids])
+        except sqlite3.Error as e:
+            self._failed("session registration", e)
+
+    def post_message(self, session_id: str, body: str) -> bool:
+        """Queues a message for a session held by another worker; False if no worker holds it."""
+        now = time.time()
+        try:
+            with self._transaction() as conn:
+                row = conn.execute("SELECT expires_at FROM sessions WHERE id = ?", (session_id,)).fetchone()
+                if row is None or row[0] <= now:
+                    return False
+                conn.execute("INSERT INTO messages (session_id, body, created_at) VALUES (?, ?, ?)",
+                             (session_id, body, now))
+                self._stats["relayed"] += 1
+                self._purge(conn, now)
+        except sqlite3.Error as e:
+            self._failed("message relay", e)
+            return False
+        return True
+
+    def take_messages(self, session_ids: List[str]) -> List[Tuple[str, str]]:
+        """Removes and returns the (session id, body) messages queued for these sessions, oldest first."""
+        if not session_ids:
+            return []
+        marks = ",".join("?" * len(session_ids))
+        try:
+            with self._lock:
+                # Cheap check first: this runs every few milliseconds and there is rarely anything queued
+                if self._conn.execute(f"SELECT 1 FROM messages WHERE session_id IN ({marks}) LIMIT 1",
+                                      session_ids).fetchone() is None:
+                    return []
+            with self._transaction() as conn:
+                rows = conn.execute(f"SELECT id, session_id, body FROM messages WHERE session_id IN ({marks}) "
+                                    f"ORDER BY id", session_ids).fetchall()
+                conn.executemany("DELETE FROM messages WHERE id = ?", [(row[0],) for row in rows])
+        except sqlite3.Error as e:
+            self._failed("message pickup", e)
+            return []
+        return [(row[1], row[2]) for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, backend="sqlite", path=self.path, cache=self.cache.stats())
+
+
+def _text(value: Union[bytes, str, None]) -> Optional[str]:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _cache_get(state: SqliteSharedState, key: str) -> Optional[List[Any]]:
+    stored = state.cache.get(key)
+    return None if stored is None else [stored[0], stored[1], _text(stored[2])]
+
+
+def _poll(state: SqliteSharedState, key: str) -> List[Any]:
+    status, encoded = state.poll(key)
+    return [status, _text(encoded)]
+
+
+# Operations of the state server: name -> (state, JSON arguments) -> JSON result
+_OPERATIONS: Dict[str, Callable[[SqliteSharedState, Dict[str, Any]], Any]] = {
+    "cache_get": lambda state, a: _cache_get(state, a["key"]),
+    "cache_put": lambda state, a: state.cache.put(a["key"], a["route"], a["value"].encode("utf-8"), a["expires_at"],
+                                                  a["stale_until"]),
+    "cache_invalidate": lambda state, a: state.cache.invalidate(a["key"]),
+    "claim": lambda state, a: state.claim(a["key"], a["ttl"], a["token"]),
+    "publish": lambda state, a: state.publish(a["key"], a["token"], a["result"], a["linger"]),
+    "release": lambda state, a: state.release(a["key"], a["token"]),
+    "poll": lambda state, a: _poll(state, a["key"]),
+    "reserve": lambda state, a: state.reserve([tuple(spec) for spec in a["specs"]], a["max_wait"]),
+    "blocked_for": lambda state, a: state.blocked_for(a["name"]),
+    "block": lambda state, a: state.block(tuple(a["spec"]), a["seconds"]),
+    "pace": lambda state, a: state.pace(tuple(a["spec"]), a["remaining"], a["reset"]),
+    "register_sessions": lambda state, a: state.register_sessions(a["session_ids"], a["ttl"]),
+    "post_message": lambda state, a: state.post_message(a["session_id"], a["body"]),
+    "take_messages": lambda state, a: state.take_messages(a["session_ids"]),
+    "stats": lambda state, a: state.stats(),
+}
+
+
+class _RemoteCache:
+    """The PersistentCache interface of a RemoteSharedState, used as ResponseCache backend."""
+
+    def __init__(self, remote: "RemoteSharedState", routes: frozenset):
+        self.remote = remote
+        self.routes = routes
+
+    def get(self, key: str) -> Optional[Tuple[float, float, str]]:
+        stored = self.remote._call("cache_get", None, key=key)
+        return tuple(stored) if stored is not None else None
+
+    def put(self, key: str, route: str, encoded: bytes, expires_at: float, stale_until: Optional[float] = None) -> None:
+        self.remote._call("cache_put", None, key=key, route=route, value=_text(encoded), expires_at=expires_at,
+                          stale_until=stale_until)
+
+    def invalidate(self, key: str) -> None:
+        self.remote._call("cache_invalidate", None, key=key)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.remote._call("stats", {}).get("cache", {})
+
+
+class RemoteSharedState:
+    """
+    Client of a state server (``python shared_state.py``), for replicas on several hosts.
+
+    Offers the same operations as SqliteSharedState, each one HTTP request
+    with a JSON body over a keep-alive connection per thread. When the server
+    cannot be reached every worker carries on alone: cache lookups miss,
+    claims succeed and reservations do not wait.
+
+    Args:
+        url: Base URL of the state server, e.g. http://10.0.0.5:8701
+        routes: Routes whose responses go to the shared cache
+        timeout: Seconds per request to the server
+    """
+
+    def __init__(self, url: str, routes: frozenset, timeout: float = 5):
+        self.url = url.rstrip("/")
+        parsed = urllib.parse.urlsplit(self.url)
+        self._host = parsed.netloc
+        self._prefix = parsed.path
+        self._connection_class = http.client.HTTPSConnection if parsed.scheme == "https" else http.client.HTTPConnection
+        self.timeout = timeout
+        self.cache = _RemoteCache(self, routes)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._errors = 0
+
+    def _call(self, operation: str, default: Any, **arguments: Any) -> Any:
+        body = json.dumps(arguments)
+        error: Exception = RuntimeError("no attempt")
+        # A second attempt on a fresh connection covers a keep-alive connection the server has closed
+        for _ in range(2):
+            conn = getattr(self._local, "conn", None)
+            if conn is None:
+                conn = self._local.conn = self._connection_class(self._host, timeout=self.timeout)
+            try:
+                conn.request("POST", f"{self._prefix}/{operation}", body, {"Content-Type": "application/json"})
+                res = conn.getresponse()
+                data = res.read()
+                if res.status != 200:
+                    raise http.client.HTTPException(f"status {res.status}: {data[:200]!r}")
+                return json.loads(data)
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                conn.close()
+                self._local.conn = None
+                error = e
+        logger.error(f"Shared state {operation} at {self.url} failed: {str(error)}")
+        with self._lock:
+            self._errors += 1
+        return default
+
+    def claim(self, key: str, ttl: float, token: Optional[str] = None) -> Optional[str]:
+        token = token or uuid.uuid4().hex
+        # The token is chosen here, so a retried claim that had gone through is recognised as ours
+        return self._call("claim", token, key=key, ttl=ttl, token=token)
+
+    def publish(self, key: str, token: str, encoded: Union[bytes, str], linger: float = RESULT_LINGER) -> None:
+        self._call("publish", None, key=key, token=token, result=_text(encoded), linger=linger)
+
+    def release(self, key: str, token: str) -> None:
+        self._call("release", None, key=key, token=token)
+
+    def poll(self, key: str) -> Tuple[str, Optional[str]]:
+        state, encoded = self._call("poll", ["gone", None], key=key)
+        return state, encoded
+
+    def reserve(self, specs: List[BucketSpec], max_wait: float) -> Optional[float]:
+        return self._call("reserve", 0.0, specs=specs, max_wait=max_wait)
+
+    def blocked_for(self, name: str) -> float:
+        return self._call("blocked_for", 0.0, name=name)
+
+    def block(self, spec: BucketSpec, seconds: float) -> None:
+        self._call("block", None, spec=spec, seconds=seconds)
+
+    def pace(self, spec: BucketSpec, remaining: float, reset: float) -> None:
+        self._call("pace", None, spec=spec, remaining=remaining, reset=reset)
+
+    def register_sessions(self, session_ids: List[str], ttl: float) -> None:
+        self._call("register_sessions", None, session_ids=session_ids, ttl=ttl)
+
+    def post_message(self, session_id: str, body: str) -> bool:
+        return self._call("post_message", False, session_id=session_id, body=body)
+
+    def take_messages(self, session_ids: List[str]) -> List[Tuple[str, str]]:
+        if not session_ids:
+            return []
+        return [tuple(message) for message in self._call("take_messages", [], session_ids=session_ids)]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            errors = self._errors
+        return dict(self._call("stats", {}), backend="remote", url=self.url, client_errors=errors)
+
+
+def open_shared_state(location: str, routes: frozenset, max_bytes: int = 512 * 1024 * 1024,
+                      compact_interval: float = 3600) -> Union[SqliteSharedState, RemoteSharedState]:
+    """A RemoteSharedState for an http(s):// URL, else a SqliteSharedState on that file."""
+    if location.startswith(("http://", "https://")):
+        return RemoteSharedState(location, routes)
+    return SqliteSharedState(location, routes, max_bytes=max_bytes, compact_interval=compact_interval)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state: SqliteSharedState
+
+    def do_POST(self) -> None:
+        operation = _OPERATIONS.get(self.path.rsplit("/", 1)[-1])
+        arguments = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if operation is None:
+            status, body = 404, b'{"error": "unknown operation"}'
+        else:
+            try:
+                status, body = 200, json.dumps(operation(self.state, arguments)).encode("utf-8")
+            except (KeyError, TypeError, ValueError) as e:
+                status, body = 400, json.dumps({"error": str(e)}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def make_server(state: SqliteSharedState, host: str = "127.0.0.1", port: int = 8701) -> ThreadingHTTPServer:
+    """An HTTP server exposing a SqliteSharedState to RemoteSharedState clients."""
+    handler = type("Handler", (_Handler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="State server shared by LinkedIn MCP server replicas")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8701)
+    parser.add_argument("--path", default="shared_state.db", help="SQLite file holding the state")
+    parser.add_argument("--max-bytes", type=int, default=512 * 1024 * 1024, help="cap of the shared cache")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # The server stores whatever routes its clients send; each client decides which ones it shares
+    shared = SqliteSharedState(args.path, frozenset(), max_bytes=args.max_bytes)
+    logger.info(f"Shared state server on {args.host}:{args.port}, state in {args.path}")
+    make_server(shared, args.host, args.port).serve_forever()
@@ -0,0 +1,307 @@
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import json_codec
+
+logger = logging.getLogger('linkedin_api_tools.suggestions')
+
+# Autocomplete-style routes answered from the index, with the argument holding the typed text
+SUGGESTION_ROUTES: Dict[str, Optional[str]] = {
+    "/suggestion_location": "query",
+    "/suggestion_company": "query",
+    "/suggestion_school": "query",
+    "/suggestion_industry": "query",
+    "/suggestion_function": "query",
+    "/suggestion_service_catagory": "query",
+    "/search_geourns": "keyword",
+    # No arguments: one static list each
+    "/suggestion_company_size": None,
+    "/suggestion_language": None,
+}
+
+SNAPSHOT_VERSION = 2
+
+_WORDS = re.compile(r"\w+")
+# Strings that identify an item rather than name it; their words ("urn", "li", "www", ...) never match a query
+_IDENTIFIER = re.compile(r"^(urn:|https?://)")
+_IDENTIFIER_KEYS = frozenset({"id", "urn", "url", "link", "entityurn", "trackingid"})
+
+
+def normalize_query(query: Optional[str]) -> str:
+    """Case-folded query with runs of whitespace collapsed, so "  Goo gle" and "goo gle" share an entry."""
+    return " ".join(str(query or "").casefold().split())
+
+
+def response_items(response: Dict[str, Any]) -> Optional[List[Any]]:
+    """
+    The suggestion list of a successful response: its data when that is a
+    list, or the list under data.data when the body is the API's
+    {"success": ..., "data": [...]} envelope. None when there is no list.
+    """
+    data = response.get("data")
+    if isinstance(data, dict):
+        data = data.get("data")
+    return data if isinstance(data, list) else None
+
+
+def answer_complete(response: Dict[str, Any], items: List[Any]) -> bool:
+    """
+    Whether the upstream says the answer holds every match: a "total" no
+    larger than its item count or a false "has_more", on the response or on
+    the body under its data. Without either it is taken to be cut off.
+    """
+    for body in (response, response.get("data")):
+        if not isinstance(body, dict):
+            continue
+        total = body.get("total", body.get("totalCount"))
+        if isinstance(total, int) and not isinstance(total, bool):
+            return total <= len(items)
+        has_more = body.get("has_more", body.get("hasMore"))
+        if isinstance(has_more, bool):
+            return not has_more
+    return False
+
+
+def _with_items(response: Dict[str, Any], items: List[Any]) -> Dict[str, Any]:
+    """Copy of response with its suggestion list replaced by items."""
+    result = dict(response)
+    if isinstance(result.get("data"), dict):
+        result["data"] = dict(result["data"], data=items)
+    else:
+        result["data"] = items
+    return result
+
+
+def _item_words(item: Any) -> Tuple[str, ...]:
+    """Every case-folded word of the item's strings, identifiers (ids, URNs, URLs) left out."""
+    words = []
+    stack = [item]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            if not _IDENTIFIER.match(value):
+                words.extend(_WORDS.findall(value.casefold()))
+        elif isinstance(value, dict):
+            stack.extend(field for key, field in value.items() if key.casefold() not in _IDENTIFIER_KEYS)
+        elif isinstance(value, list):
+            stack.extend(value)
+    return tuple(words)
+
+
+def _matches(words: Tuple[str, ...], query_words: List[str]) -> bool:
+    return all(any(word.startswith(part) for word in words) for part in query_words)
+
+
+class _Entry:
+    """Answer to one normalized query: the response envelope and the indices of its items."""
+
+    __slots__ = ("response", "items", "complete", "stored_at")
+
+    def __init__(self, response: Dict[str, Any], items: Tuple[int, ...], complete: bool, stored_at: float):
+        self.response = response
+        self.items = items
+        self.complete = complete
+        self.stored_at = stored_at
+
+
+class SuggestionIndex:
+    """
+    Local prefix index in front of the suggestion/autocomplete routes.
+
+    Every upstream answer is merged in under its normalized query. A later
+    lookup is answered without a request when either
+
+    - the same query was answered before (exact hit), or
+    - a shorter query it starts with was answered with every match there
+      is, as the upstream stated with a "total" or "has_more" (see
+      answer_complete): the refinement's answer is then the subset of those
+      items that still match, each query word being a prefix of a word in the
+      item (prefix hit).
+
+    An answer the upstream did not state to be complete only answers its own
+    query; refinements of it go upstream.
+
+    The longest complete answered prefix is used, found by walking the query's
+    prefixes from the longest down through a dict, so a lookup is a handful
+    of hash probes. Items are kept encoded, once per route however many
+    queries return them, and decoded fresh for every answer. Entries older
+    than ``max_age`` seconds are ignored and dropped from snapshots.
+
+    Args:
+        max_age: Seconds an answer is used for
+        routes: Route -> name of its query argument (None for argument-less routes)
+    """
+
+    def __init__(self, max_age: float = 7 * 86400, routes: Optional[Dict[str, Optional[str]]] = None):
+        self.max_age = max_age
+        self.routes = dict(SUGGESTION_ROUTES if routes is None else routes)
+        # route -> normalized query -> entry
+        self._queries: Dict[str, Dict[str, _Entry]] = {route: {} for route in self.routes}
+        # route -> encoded items, their words, and encoded item -> index for interning
+        self._items: Dict[str, List[bytes]] = {route: [] for route in self.routes}
+        self._words: Dict[str, List[Tuple[str, ...]]] = {route: [] for route in self.routes}
+        self._interned: Dict[str, Dict[bytes, int]] = {route: {} for route in self.routes}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._stats = {"exact_hits": 0, "prefix_hits": 0, "misses": 0, "merges": 0}
+
+    def query_for(self, route: str, arguments: Dict[str, Any]) -> str:
+        param = self.routes.get(route)
+        return normalize_query(arguments.get(param)) if param else ""
+
+    def lookup(self, route: str, query: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Answers a normalized query locally.
+
+        Returns:
+            (response or None, "exact" / "prefix" / "miss")
+        """
+        queries = self._queries.get(route)
+        if queries is None:
+            return None, "miss"
+        oldest = time.time() - self.max_age
+        with self._lock:
+            entry = queries.get(query)
+            if entry is not None and entry.stored_at >= oldest:
+                self._stats["exact_hits"] += 1
+                return self._response(route, entry, entry.items), "exact"
+            query_words = query.split()
+            for end in range(len(query) - 1, 0, -1):
+                entry = queries.get(query[:end].rstrip())
+                if entry is None or not entry.complete or entry.stored_at < oldest:
+                    continue
+                words = self._words[route]
+                matching = tuple(index for index in entry.items if _matches(words[index], query_words))
+                self._stats["prefix_hits"] += 1
+                return self._response(route, entry, matching), "prefix"
+            self._stats["misses"] += 1
+        return None, "miss"
+
+    def _response(self, route: str, entry: _Entry, indices: Iterable[int]) -> Dict[str, Any]:
+        items = self._items[route]
+        encoded = b"[" + b",".join(items[index] for index in indices) + b"]"
+        response = _with_items(entry.response, json_codec.loads(encoded))
+        response["attempts"] = 0
+        return response
+
+    def merge(self, route: str, query: str, response: Dict[str, Any], stored_at: Optional[float] = None) -> bool:
+        """Adds a successful upstream answer for a normalized query; other responses are ignored."""
+        if route not in self._queries or not response.get("success"):
+            return False
+        items = response_items(response)
+        if items is None:
+            return False
+        with self._lock:
+            indices = tuple(self._intern(route, item) for item in items)
+            envelope = json_codec.loads(json_codec.dumps_bytes(
+                _with_items({key: value for key, value in response.items() if key != "attempts"}, [])))
+            self._queries[route][query] = _Entry(envelope, indices, answer_complete(response, items),
+                                                 time.time() if stored_at is None else stored_at)
+            self._dirty = True
+            self._stats["merges"] += 1
+        return True
+
+    def _intern(self, route: str, item: Any) -> int:
+        encoded = json_codec.dumps_bytes(item)
+        interned = self._interned[route]
+        index = interned.get(encoded)
+        if index is None:
+            index = interned[encoded] = len(self._items[route])
+            self._items[route].append(encoded)
+            self._words[route].append(_item_words(item))
+        return index
+
+    def load_seed(self, path: str) -> int:
+        """
+        Merges a hand-written seed file: {route: {query: [items]}}, where an
+        answer may also be a body like {"data": [items], "has_more": false}.
+        Seeded answers count as complete only when they say so, like upstream
+        ones, and never age out.
+
+        Returns:
+            Number of queries merged
+        """
+        with open(path, "rb") as f:
+            seed = json_codec.loads(f.read())
+        merged = 0
+        for route, answers in seed.items():
+            for query, answer in answers.items():
+                response = dict(answer) if isinstance(answer, dict) else {"data": answer}
+                merged += self.merge(route, normalize_query(query), dict(response, success=True, status=200),
+                                     stored_at=float("inf"))
+        return merged
+
+    def save(self, path: str) -> None:
+        """Writes a snapshot of the live entries, replacing path atomically."""
+        oldest = time.time() - self.max_age
+        with self._lock:
+            routes = {}
+            items = {}
+            for route, queries in self._queries.items():
+                live = {query: entry for query, entry in queries.items() if entry.stored_at >= oldest}
+                if not live:
+                    continue
+                # Renumber the items still referenced so dropped answers don't keep theirs alive
+                renumbered: Dict[int, int] = {}
+                for entry in live.values():
+                    for index in entry.items:
+                        renumbered.setdefault(index, len(renumbered))
+                items[route] = [json_codec.loads(self._items[route][index]) for index in renumbered]
+                routes[route] = [[query, entry.stored_at if entry.stored_at != float("inf") else None,
+                                  entry.complete, entry.response, [renumbered[index] for index in entry.items]]
+                                 for query, entry in live.items()]
+            self._dirty = False
+        snapshot = {"version": SNAPSHOT_VERSION, "items": items, "routes": routes}
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(json_codec.dumps_bytes(snapshot))
+        os.replace(temporary, path)
+
+    def load(self, path: str) -> int:
+        """
+        Restores a snapshot written by save(); a missing or unreadable file
+        leaves the index empty.
+
+        Returns:
+            Number of queries restored
+        """
+        try:
+            with open(path, "rb") as f:
+                snapshot = json_codec.loads(f.read())
+        except FileNotFoundError:
+            return 0
+        except (OSError, json_codec.DecodeError) as e:
+            logger.warning(f"Ignoring unreadable suggestion snapshot {path}: {str(e)}")
+            return 0
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            logger.warning(f"Ignoring suggestion snapshot {path} of version {snapshot.get('version')}")
+            return 0
+        oldest = time.time() - self.max_age
+        restored = 0
+        with self._lock:
+            for route, rows in snapshot.get("routes", {}).items():
+                if route not in self._queries:
+                    continue
+                items = snapshot["items"][route]
+                for query, stored_at, complete, envelope, indices in rows:
+                    stored_at = float("inf") if stored_at is None else stored_at
+                    if stored_at < oldest:
+                        continue
+                    interned = tuple(self._intern(route, items[index]) for index in indices)
+                    self._queries[route][query] = _Entry(envelope, interned, complete, stored_at)
+                    restored += 1
+        return restored
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats,
+                        queries=sum(len(queries) for queries in self._queries.values()),
+                        items=sum(len(items) for items in self._items.values()))
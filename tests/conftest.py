@@ -0,0 +1,47 @@
+import json
+import os
+import subprocess
+import sys
+import urllib.request
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.append(os.path.join(ROOT, "benchmarks"))
+
+from load_test import free_port, stop, wait_for  # noqa: E402
+
+
+class MockUpstream:
+    """benchmarks/mock_upstream.py on a free port, with a generous per-key quota so requests are counted per key."""
+
+    def __init__(self):
+        self.port = free_port()
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "benchmarks", "mock_upstream.py"), "--port", str(self.port),
+             "--latency", "0", "--key-rate", "1000"],
+            stdout=subprocess.DEVNULL)
+        wait_for(f"http://127.0.0.1:{self.port}/__stats", self.process)
+
+    def stats(self) -> dict:
+        with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/__stats") as response:
+            return json.loads(response.read())
+
+    def run(self, script: str, **env: str) -> str:
+        """Runs a Python script against this upstream in a fresh process and returns its output."""
+        base = {name: value for name, value in os.environ.items()
+                if name not in ("LINKEDIN_API_KEY", "LINKEDIN_SHARED_STATE", "LINKEDIN_CACHE_PATH")}
+        env = dict(base, LINKEDIN_API_SCHEME="http", LINKEDIN_API_HOST=f"127.0.0.1:{self.port}",
+                   LINKEDIN_SUGGEST_INDEX="0", PYTHONPATH=ROOT, **env)
+        return subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env, capture_output=True, text=True,
+                              timeout=60, check=True).stdout
+
+
+@pytest.fixture
+def upstream():
+    mock = MockUpstream()
+    try:
+        yield mock
+    finally:
+        stop(mock.process)
@@ -0,0 +1,27 @@
+import pytest
+
+from endpoints import ENDPOINTS
+
+SEARCH_JOBS = next(endpoint for endpoint in ENDPOINTS if endpoint.tool == "search_jobs")
+
+
+def test_bind_fills_in_defaults():
+    arguments = SEARCH_JOBS.bind(("engineer",), {"page": "2"})
+    assert arguments["query"] == "engineer"
+    assert arguments["page"] == "2"
+    assert arguments["sortBy"] is None
+    assert set(arguments) == set(SEARCH_JOBS.signature.parameters)
+
+
+def test_bind_rejects_unknown_argument_in_place_of_a_missing_one():
+    with pytest.raises(TypeError, match="unexpected arguments: keyword"):
+        SEARCH_JOBS.bind((), {"keyword": "x"})
+
+
+def test_bind_rejects_missing_and_duplicate_arguments():
+    with pytest.raises(TypeError, match="missing required arguments: query"):
+        SEARCH_JOBS.bind((), {"page": "2"})
+    with pytest.raises(TypeError, match="multiple values for argument 'query'"):
+        SEARCH_JOBS.bind(("engineer",), {"query": "designer"})
+    with pytest.raises(TypeError, match="arguments but"):
+        SEARCH_JOBS.bind(tuple(range(len(SEARCH_JOBS.signature.parameters) + 1)), {})
@@ -0,0 +1,36 @@
+from key_pool import KeyPool, parse_keys
+
+# Sends a few /person lookups with the default headers and prints which key the pool routed them over
+KEYS_ONLY_CLIENT = """
+import linkedin_api_tools as tools
+for index in range(6):
+    result = tools.make_api_request("POST", "/person", '{"link": "https://www.linkedin.com/in/k-%d"}' % index,
+                                    tools.LINKEDIN_HEADERS)
+    assert result["success"], result
+print(tools.key_pool.owns(tools.LINKEDIN_HEADERS["x-rapidapi-key"]))
+"""
+
+
+def test_empty_key_is_pooled():
+    pool = KeyPool(parse_keys("first-key,second-key"))
+    assert pool.owns("")
+    assert pool.owns("first-key")
+    assert not pool.owns("someone-elses-key")
+
+
+def test_labels_are_unique_and_masked():
+    keys = ["a" * 20 + "tail", "b" * 20 + "tail", "short", "other"]
+    pool = KeyPool([(key, "") for key in keys])
+    labels = [api_key.label for api_key in pool.keys]
+    assert len(set(labels)) == len(keys)
+    assert all(key not in label for key, label in zip(keys, labels))
+    assert set(pool.snapshot()) == set(labels)
+
+
+def test_keys_only_configuration_uses_the_pool(upstream):
+    output = upstream.run(KEYS_ONLY_CLIENT, LINKEDIN_API_KEYS="first-key,second-key", LINKEDIN_CACHE_MAX_ENTRIES="0")
+    assert output.strip().splitlines()[-1] == "True"
+    stats = upstream.stats()
+    assert stats.get("key first-key 200", 0) > 0
+    assert stats.get("key second-key 200", 0) > 0
+    assert "key  200" not in stats
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from endpoints import ENDPOINTS
+from links import canonical_link
+from response_cache import ResponseCache
+
+PROFILE = "https://www.linkedin.com/in/ingmar-klein"
+
+# Spellings of one profile seen in tool input: scheme, subdomains, case, trailing slashes, sub-pages, tracking
+PROFILE_SPELLINGS = [
+    PROFILE,
+    "http://LinkedIn.com/in/Ingmar-Klein/?trk=public_profile",
+    "  de.linkedin.com/in/ingmar-klein/details/experience/ ",
+    "https://m.linkedin.com/in/ingmar-klein#about",
+    "www.linkedin.com/in/INGMAR-KLEIN/",
+]
+
+
+@pytest.mark.parametrize("link", PROFILE_SPELLINGS)
+def test_profile_spellings_are_canonical(link):
+    assert canonical_link(link) == PROFILE
+
+
+@pytest.mark.parametrize("link, expected", [
+    # Member ids are case-sensitive
+    ("https://www.linkedin.com/in/ACoAACeIPPkBUymOGNvgfbBL_uhKc32Hg_g_haU/",
+     "https://www.linkedin.com/in/ACoAACeIPPkBUymOGNvgfbBL_uhKc32Hg_g_haU"),
+    # Percent-encoded exactly once, however the id came in
+    ("https://www.linkedin.com/in/J%C3%BCrgen-M%C3%BCller", "https://www.linkedin.com/in/j%C3%BCrgen-m%C3%BCller"),
+    ("https://www.linkedin.com/in/Jürgen-Müller/", "https://www.linkedin.com/in/j%C3%BCrgen-m%C3%BCller"),
+    ("https://www.linkedin.com/company/Google/about/", "https://www.linkedin.com/company/google"),
+    ("linkedin.com/school/Stanford-University", "https://www.linkedin.com/school/stanford-university"),
+    ("https://www.linkedin.com/showcase/Microsoft-Azure", "https://www.linkedin.com/showcase/microsoft-azure"),
+    # Post slugs keep their case
+    ("https://www.linkedin.com/posts/Satya-Nadella_ai-activity-7219434359085252608-AbCd?utm_source=share",
+     "https://www.linkedin.com/posts/Satya-Nadella_ai-activity-7219434359085252608-AbCd"),
+])
+def test_links_are_canonical(link, expected):
+    assert canonical_link(link) == expected
+
+
+@pytest.mark.parametrize("urn, expected", [
+    ("URN:LI:Activity:7219434359085252608", "urn:li:activity:7219434359085252608"),
+    ("urn:li:ugcpost:7219434359085252608", "urn:li:ugcPost:7219434359085252608"),
+    ("https://www.linkedin.com/feed/update/URN:LI:UGCPOST:7219434359085252608/",
+     "https://www.linkedin.com/feed/update/urn:li:ugcPost:7219434359085252608"),
+])
+def test_urns_are_canonical(urn, expected):
+    assert canonical_link(urn) == expected
+
+
+def test_other_input_is_only_stripped():
+    assert canonical_link("  https://example.com/in/Someone/ ") == "https://example.com/in/Someone/"
+    assert canonical_link(canonical_link(PROFILE_SPELLINGS[1])) == PROFILE
+
+
+def test_equivalent_links_share_a_cache_entry():
+    cache = ResponseCache()
+    company = next(endpoint for endpoint in ENDPOINTS if endpoint.tool == "company")
+    keys = set()
+    for link in ["https://www.linkedin.com/company/google", "http://LinkedIn.com/company/Google/about/",
+                 "uk.linkedin.com/company/google?trk=x"]:
+        endpoint, payload = company.request(company.canonical(company.bind((link,), {})))
+        keys.add(cache.key_for(company.method, endpoint, payload))
+    assert len(keys) == 1
+
+    key = keys.pop()
+    cache.put(key, "/company", {"success": True, "status": 200, "data": {"name": "Google"}})
+    for _ in range(3):
+        assert cache.get(key)["data"] == {"name": "Google"}
+    assert cache.stats()["hits"] == 3
+
+
+# Looks one profile up under every spelling through the person tool
+PERSON_CLIENT = """
+import asyncio, json
+import linkedin_api_tools as tools
+
+async def main():
+    for link in json.loads({links!r}):
+        result = await tools.person(link)
+        assert result["success"], result
+    print(json.dumps(tools.response_cache.stats()))
+
+asyncio.run(main())
+"""
+
+
+def test_person_spellings_hit_the_cache(upstream):
+    script = PERSON_CLIENT.format(links=json.dumps(PROFILE_SPELLINGS))
+    stats = json.loads(upstream.run(script, LINKEDIN_PROFILE_BATCH_WINDOW="0").strip().splitlines()[-1])
+    assert upstream.stats()["/person 200"] == 1
+    assert stats["hits"] == len(PROFILE_SPELLINGS) - 1
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from pagination import FeedPaginator
+
+
+def feed(pages, use_tokens=False):
+    """Returns a fetch_page coroutine serving the given pages of item ids, numbered or token-linked."""
+    async def fetch_page(page, token):
+        index = int(token) if token else page - 1
+        data = {"items": [{"id": item} for item in pages[index]] if index < len(pages) else []}
+        if use_tokens:
+            data["paginationToken"] = str(index + 1) if index + 1 < len(pages) else ""
+        return {"success": True, "status": 200, "data": data}
+    return fetch_page
+
+
+def collect(fetch_page, **kwargs):
+    return asyncio.run(FeedPaginator(fetch_page, **kwargs).collect())
+
+
+def walk_in_chunks(fetch_page, max_items):
+    """Walks the whole feed max_items at a time, resuming from each returned position."""
+    ids, position = [], {"page": 1, "paginationToken": None, "offset": 0}
+    while position["page"] is not None:
+        result = collect(fetch_page, max_items=max_items, start_page=position["page"],
+                         start_token=position["paginationToken"], start_offset=position["offset"])
+        ids.extend(item["id"] for item in result["data"])
+        position = result
+    return ids
+
+
+@pytest.mark.parametrize("use_tokens", [False, True])
+@pytest.mark.parametrize("max_items", [1, 2, 3, 4, 7])
+def test_resuming_neither_repeats_nor_skips_items(use_tokens, max_items):
+    pages = [[1, 2, 3], [4, 5, 6], [7, 8]]
+    assert walk_in_chunks(feed(pages, use_tokens), max_items) == list(range(1, 9))
+
+
+def test_stopping_inside_a_page_returns_its_offset():
+    result = collect(feed([[1, 2, 3], [4, 5, 6]]), max_items=4)
+    assert [item["id"] for item in result["data"]] == [1, 2, 3, 4]
+    assert (result["stop_reason"], result["page"], result["offset"]) == ("max_items", 2, 1)
+
+
+def test_stopping_at_the_end_of_a_page_moves_to_the_next_one():
+    result = collect(feed([[1, 2, 3], [4, 5, 6]]), max_items=3)
+    assert (result["stop_reason"], result["page"], result["offset"]) == ("max_items", 2, 0)
+
+
+def test_stopping_on_the_last_item_of_the_feed_leaves_nothing_to_resume():
+    result = collect(feed([[1, 2], [3]], use_tokens=True), max_items=3)
+    assert result["stop_reason"] == "max_items"
+    assert (result["page"], result["paginationToken"], result["offset"]) == (None, None, None)
@@ -0,0 +1,15 @@
+import email.utils
+import time
+
+import pytest
+
+from rate_limiter import RateLimiter
+
+
+@pytest.mark.parametrize("http_date", [False, True])
+def test_429_blocks_the_key_for_its_retry_after(http_date):
+    retry_after = email.utils.formatdate(time.time() + 20, usegmt=True) if http_date else "20"
+    limiter = RateLimiter(max_wait=60)
+    limiter.observe("key", 429, {"retry-after": retry_after})
+    assert 18 <= limiter.blocked_for("key") <= 20
+    assert limiter.blocked_for("other-key") == 0